@@ -0,0 +1,50 @@
+# Building/BuildConfiguration.py
+
+"""
+BuildConfiguration Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Per-unit edits of an OpenCore config.plist. Everything else on a stick is
+identical between units; these values (SMBIOS serials and friends) are what
+makes each one unique.
+"""
+
+import plistlib
+
+# Keys under PlatformInfo -> Generic that identify a single machine
+SMBIOS_KEYS = {
+    "serial": "SystemSerialNumber",
+    "mlb": "MLB",
+    "system_uuid": "SystemUUID",
+    "rom": "ROM",
+    "product": "SystemProductName",
+}
+
+
+def apply_overrides(config_bytes, overrides):
+    """
+    Returns config.plist bytes with `overrides` applied. Keys are slash
+    separated paths into the plist, e.g. "PlatformInfo/Generic/MLB".
+    """
+    config = plistlib.loads(config_bytes)
+    for path, value in overrides.items():
+        node = config
+        parts = path.split("/")
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = value
+    return plistlib.dumps(config, sort_keys=False)
+
+
+def set_platform_info(config_bytes, serial=None, mlb=None, system_uuid=None, rom=None, product=None):
+    """Sets the SMBIOS identity of one unit. Arguments left as None are not touched."""
+    values = {"serial": serial, "mlb": mlb, "system_uuid": system_uuid, "rom": rom, "product": product}
+    overrides = {}
+    for name, value in values.items():
+        if value is None:
+            continue
+        if name == "rom" and isinstance(value, str):
+            value = bytes.fromhex(value.replace(":", ""))
+        overrides[f"PlatformInfo/Generic/{SMBIOS_KEYS[name]}"] = value
+    return apply_overrides(config_bytes, overrides)
@@ -1 +1,490 @@
+# Detection/DetectOS.py
 
+"""
+DetectOS Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Hardware inventory of the machine Hackintoshify runs on.
+
+Linux reads everything from the kernel's files, with no subprocess and
+no root needed:
+    /sys/class/dmi/id        board and firmware (the cache key)
+    /proc/cpuinfo            processor name, cores and threads
+    /proc/meminfo            installed memory
+    /sys/bus/pci/devices     every PCI function with its IDs and driver
+    /sys/bus/usb/devices     USB devices (Bluetooth is usually one)
+    /sys/bus/acpi/devices    ACPI hardware IDs (battery, I2C trackpad, PS/2)
+Windows reads the board, processor and memory from the registry and the
+kernel. That is instant, so WMI is only used for the device lists, which
+are the slow part. PCI, USB and ACPI come from one Win32_PnPEntity query.
+
+detect_hardware() runs the probes one section at a time (SECTIONS) and
+hands every section to `progress_callback(section, value)` as soon as it
+is known, so a screen can fill in rows while the rest is still running.
+The result is cached in HARDWARE_CACHE_FILE under a fingerprint of the
+DMI data. On the next launch a matching fingerprint serves the cached
+sections at once, and with `refresh=True` the probes still run
+afterwards and report only the sections that changed.
+
+Usage:
+    info = detect_hardware(progress_callback=lambda section, value: print(section, value))
+    print(summary(info))        # {"CPU": ..., "GPU": ..., "RAM": ...}
+"""
+
+import os
+import sys
+import json
+import time
+import glob
+import hashlib
+import functools
+import platform
+
+HARDWARE_CACHE_FILE = "hardware_cache.json"
+CACHE_VERSION = 3     # 3: Windows PCI classes from CompatibleID
+SECTIONS = ("dmi", "cpu", "memory", "pci", "usb", "acpi")
+
+DMI_DIR = "/sys/class/dmi/id"
+PCI_DIR = "/sys/bus/pci/devices"
+USB_DIR = "/sys/bus/usb/devices"
+ACPI_DIR = "/sys/bus/acpi/devices"
+# Readable without root; product_uuid and the serials are not
+DMI_FIELDS = ("sys_vendor", "product_name", "product_version", "board_vendor", "board_name",
+              "bios_vendor", "bios_version", "bios_date")
+# The same fields in HKLM\HARDWARE\DESCRIPTION\System\BIOS
+WINDOWS_BIOS_VALUES = ("SystemManufacturer", "SystemProductName", "SystemVersion", "BaseBoardManufacturer",
+                       "BaseBoardProduct", "BIOSVendor", "BIOSVersion", "BIOSReleaseDate")
+
+# Common PCI vendors, for when the PCI ID index (Detection/PciIds.py) has not been built
+PCI_VENDORS = {
+    0x8086: "Intel", 0x1002: "AMD", 0x1022: "AMD", 0x10de: "NVIDIA", 0x14e4: "Broadcom",
+    0x10ec: "Realtek", 0x168c: "Qualcomm Atheros", 0x17cb: "Qualcomm", 0x1b21: "ASMedia",
+    0x144d: "Samsung", 0x15b7: "SanDisk", 0x1987: "Phison", 0x1c5c: "SK hynix", 0x8087: "Intel",
+    0x15ad: "VMware", 0x80ee: "VirtualBox", 0x1af4: "Red Hat (virtio)", 0x1234: "QEMU",
+}
+DISPLAY_CLASS = 0x03        # PCI base class of graphics controllers
+
+
+def _read(path):
+    try:
+        with open(path, "r", errors="replace") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _hex(text):
+    try:
+        return int(text, 16)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_cache_path():
+    from Logic.Settings import get_config_dir
+    return os.path.join(get_config_dir(), HARDWARE_CACHE_FILE)
+
+
+# --- Linux ---
+
+def _linux_dmi():
+    return {field: _read(os.path.join(DMI_DIR, field)) for field in DMI_FIELDS}
+
+
+def _linux_cpu():
+    name = vendor = ""
+    threads = 0
+    cores = set()
+    physical = core = None
+    with open("/proc/cpuinfo", "r") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            key, value = key.strip(), value.strip()
+            if key == "processor":
+                threads += 1
+            elif key == "model name" and not name:
+                name = value
+            elif key == "vendor_id" and not vendor:
+                vendor = value
+            elif key == "physical id":
+                physical = value
+            elif key == "core id":
+                core = value
+            elif not key and core is not None:
+                # A blank line ends one logical processor
+                cores.add((physical, core))
+                physical = core = None
+    if core is not None:
+        cores.add((physical, core))
+    if not name:
+        name = platform.processor() or platform.machine()
+    return {"name": " ".join(name.split()), "vendor": vendor,
+            "cores": len(cores) or threads, "threads": threads}
+
+
+def _linux_memory():
+    with open("/proc/meminfo", "r") as f:
+        for line in f:
+            if line.startswith("MemTotal:"):
+                return {"total_bytes": int(line.split()[1]) * 1024}
+    return {"total_bytes": 0}
+
+
+def _linux_pci():
+    devices = []
+    for path in sorted(glob.glob(os.path.join(PCI_DIR, "*"))):
+        class_id = _hex(_read(os.path.join(path, "class")))
+        driver = os.path.join(path, "driver")
+        devices.append({
+            "slot": os.path.basename(path),
+            "vendor_id": _hex(_read(os.path.join(path, "vendor"))),
+            "device_id": _hex(_read(os.path.join(path, "device"))),
+            "subsystem_vendor_id": _hex(_read(os.path.join(path, "subsystem_vendor"))),
+            "subsystem_device_id": _hex(_read(os.path.join(path, "subsystem_device"))),
+            "class_id": class_id,
+            "driver": os.path.basename(os.readlink(driver)) if os.path.islink(driver) else "",
+            "boot_vga": _read(os.path.join(path, "boot_vga")) == "1",
+        })
+    return devices
+
+
+def _linux_usb():
+    devices = []
+    for path in sorted(glob.glob(os.path.join(USB_DIR, "*"))):
+        # Interfaces ("1-1:1.0") have no idVendor, only devices and root hubs do
+        vendor_id = _hex(_read(os.path.join(path, "idVendor")))
+        if vendor_id is None:
+            continue
+        devices.append({
+            "port": os.path.basename(path),
+            "vendor_id": vendor_id,
+            "product_id": _hex(_read(os.path.join(path, "idProduct"))),
+            "class_id": _hex(_read(os.path.join(path, "bDeviceClass"))),
+            "name": " ".join(filter(None, (_read(os.path.join(path, "manufacturer")),
+                                           _read(os.path.join(path, "product"))))),
+        })
+    return devices
+
+
+def _linux_acpi():
+    hids = set()
+    for path in glob.glob(os.path.join(ACPI_DIR, "*")):
+        # "status" is 0 for devices the firmware declares but has turned off
+        if _read(os.path.join(path, "status")) == "0":
+            continue
+        # Container nodes ("device:00") have no hid
+        hid = _read(os.path.join(path, "hid"))
+        if hid:
+            hids.add(hid.upper())
+    return sorted(hids)
+
+
+# --- Windows ---
+
+def _registry_values(key_path, names):
+    import winreg
+    values = {}
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
+            for name in names:
+                try:
+                    values[name] = str(winreg.QueryValueEx(key, name)[0]).strip()
+                except OSError:
+                    values[name] = ""
+    except OSError:
+        pass
+    return values
+
+
+def _windows_dmi():
+    bios = _registry_values(r"HARDWARE\DESCRIPTION\System\BIOS", WINDOWS_BIOS_VALUES)
+    return {field: bios.get(name, "") for field, name in zip(DMI_FIELDS, WINDOWS_BIOS_VALUES)}
+
+
+def _windows_cpu():
+    cpu = _registry_values(r"HARDWARE\DESCRIPTION\System\CentralProcessor\0",
+                           ("ProcessorNameString", "VendorIdentifier"))
+    threads = os.cpu_count() or 0
+    return {"name": " ".join(cpu.get("ProcessorNameString", "").split()) or platform.processor(),
+            "vendor": cpu.get("VendorIdentifier", ""),
+            "cores": _windows_core_count() or threads, "threads": threads}
+
+
+def _windows_core_count():
+    import ctypes
+    # SYSTEM_LOGICAL_PROCESSOR_INFORMATION_EX records, RelationProcessorCore = 0
+    kernel32 = ctypes.windll.kernel32
+    size = ctypes.c_ulong(0)
+    kernel32.GetLogicalProcessorInformationEx(0, None, ctypes.byref(size))
+    if not size.value:
+        return 0
+    buffer = ctypes.create_string_buffer(size.value)
+    if not kernel32.GetLogicalProcessorInformationEx(0, buffer, ctypes.byref(size)):
+        return 0
+    count = offset = 0
+    while offset < size.value:
+        record_size = int.from_bytes(buffer.raw[offset + 4:offset + 8], "little")
+        if not record_size:
+            break
+        count += 1
+        offset += record_size
+    return count
+
+
+def _windows_memory():
+    import ctypes
+
+    class MEMORYSTATUSEX(ctypes.Structure):
+        _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+
+    status = MEMORYSTATUSEX()
+    status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+    ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status))
+    return {"total_bytes": status.ullTotalPhys}
+
+
+@functools.lru_cache(maxsize=1)
+def _windows_pnp_entities():
+    """(PNPDeviceID, CompatibleID list, Service, Name) of every Plug and Play device, queried once per detection."""
+    import wmi
+    # WMI is COM, and detection runs on a worker thread
+    try:
+        import pythoncom
+        pythoncom.CoInitialize()
+    except ImportError:
+        pythoncom = None
+    try:
+        return [(entity.PNPDeviceID or "", tuple(entity.CompatibleID or ()), entity.Service or "", entity.Name or "")
+                for entity in wmi.WMI().Win32_PnPEntity()]
+    finally:
+        if pythoncom:
+            pythoncom.CoUninitialize()
+
+
+def _windows_pci():
+    import re
+    # e.g. PCI\VEN_8086&DEV_3E92&SUBSYS_86941043&REV_00\3&11583659&0&10
+    pattern = re.compile(r"PCI\\VEN_([0-9A-F]{4})&DEV_([0-9A-F]{4})(?:&SUBSYS_([0-9A-F]{4})([0-9A-F]{4}))?"
+                         r"(?:&REV_[0-9A-F]{2})?\\(.*)", re.I)
+    devices = []
+    for pnp_id, compatible_ids, service, name in _windows_pnp_entities():
+        match = pattern.match(pnp_id)
+        if not match:
+            continue
+        vendor, device, sub_device, sub_vendor, instance = match.groups()
+        devices.append({
+            "slot": instance,
+            "vendor_id": int(vendor, 16),
+            "device_id": int(device, 16),
+            "subsystem_vendor_id": _hex(sub_vendor),
+            "subsystem_device_id": _hex(sub_device),
+            "class_id": _windows_pci_class(compatible_ids),
+            "driver": service,
+            "boot_vga": False,
+            "name": name,
+        })
+    return devices
+
+
+def _windows_pci_class(compatible_ids):
+    """PCI class code (class, subclass, prog-if) from compatible IDs like PCI\\CC_010802 or PCI\\CC_0108."""
+    import re
+    class_id = None
+    for compatible_id in compatible_ids:
+        match = re.match(r"PCI\\CC_([0-9A-F]{4})([0-9A-F]{2})?$", compatible_id, re.I)
+        if match:
+            if match.group(2):
+                return int(match.group(1) + match.group(2), 16)
+            class_id = int(match.group(1), 16) << 8
+    return class_id
+
+
+def _windows_usb():
+    import re
+    # e.g. USB\VID_8087&PID_0026\5&2B8F6E3&0&14; composite interfaces add &MI_00 and are skipped
+    pattern = re.compile(r"USB\\VID_([0-9A-F]{4})&PID_([0-9A-F]{4})\\(.*)", re.I)
+    devices = []
+    for pnp_id, _, _, name in _windows_pnp_entities():
+        match = pattern.match(pnp_id)
+        if match:
+            vendor, product, instance = match.groups()
+            devices.append({"port": instance, "vendor_id": int(vendor, 16), "product_id": int(product, 16),
+                            "class_id": None, "name": name})
+    return devices
+
+
+def _windows_acpi():
+    # e.g. ACPI\PNP0C0A\1 or ACPI\ELAN0001\4&...
+    hids = set()
+    for pnp_id, _, _, _ in _windows_pnp_entities():
+        parts = pnp_id.split("\\")
+        if len(parts) > 1 and parts[0].upper() == "ACPI":
+            hids.add(parts[1].upper())
+    return sorted(hids)
+
+
+# --- Other platforms ---
+
+def _generic_dmi():
+    return {"sys_vendor": platform.system(), "product_name": platform.node(), "product_version": platform.release()}
+
+
+def _generic_cpu():
+    threads = os.cpu_count() or 0
+    return {"name": platform.processor() or platform.machine(), "vendor": "", "cores": threads, "threads": threads}
+
+
+def get_probes():
+    """{section: function} for this platform, in SECTIONS order."""
+    if sys.platform.startswith("linux"):
+        return {"dmi": _linux_dmi, "cpu": _linux_cpu, "memory": _linux_memory, "pci": _linux_pci,
+                "usb": _linux_usb, "acpi": _linux_acpi}
+    if sys.platform == "win32":
+        return {"dmi": _windows_dmi, "cpu": _windows_cpu, "memory": _windows_memory, "pci": _windows_pci,
+                "usb": _windows_usb, "acpi": _windows_acpi}
+    return {"dmi": _generic_dmi, "cpu": _generic_cpu, "memory": lambda: {"total_bytes": 0}, "pci": lambda: [],
+            "usb": lambda: [], "acpi": lambda: []}
+
+
+def dmi_fingerprint(dmi):
+    data = "\0".join(f"{key}={dmi.get(key, '')}" for key in sorted(dmi))
+    return hashlib.sha1(f"{sys.platform}\0{data}".encode()).hexdigest()
+
+
+# --- Cache ---
+
+def load_cache(fingerprint, cache_path=None):
+    try:
+        with open(cache_path or get_cache_path(), "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != CACHE_VERSION or data.get("fingerprint") != fingerprint:
+        return None
+    return data.get("info")
+
+
+def save_cache(fingerprint, info, cache_path=None):
+    path = cache_path or get_cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"version": CACHE_VERSION, "fingerprint": fingerprint, "time": time.time(), "info": info}, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass    # Only costs the next launch a fresh probe
+
+
+# --- Detection ---
+
+def detect_hardware(progress_callback=None, status_callback=None, use_cache=True, refresh=False, cache_path=None):
+    """
+    Returns {section: value} for SECTIONS. A probe that fails gives
+    {"error": "..."} for its section instead of stopping the others.
+    """
+    def report(section, value):
+        if progress_callback:
+            progress_callback(section, value)
+
+    def status(text):
+        if status_callback:
+            status_callback(text)
+
+    probes = get_probes()
+    _windows_pnp_entities.cache_clear()     # Fresh device lists on every run
+
+    def run(section):
+        try:
+            return probes[section]()
+        except Exception as e:
+            status(f"{section} detection failed: {e}")
+            return {"error": str(e)}
+
+    dmi = run("dmi")
+    fingerprint = dmi_fingerprint(dmi)
+    cached = load_cache(fingerprint, cache_path) if use_cache else None
+    if cached is not None:
+        status("Hardware loaded from cache")
+        for section in SECTIONS:
+            report(section, cached.get(section))
+        if not refresh:
+            return cached
+
+    info = {"dmi": dmi}
+    if cached is None:
+        report("dmi", dmi)
+    for section in SECTIONS[1:]:
+        status(f"Detecting {section}...")
+        info[section] = run(section)
+        if cached is None or cached.get(section) != info[section]:
+            report(section, info[section])
+
+    if info != cached and not any(isinstance(value, dict) and "error" in value for value in info.values()):
+        save_cache(fingerprint, info, cache_path)
+    return info
+
+
+# --- Presentation ---
+
+def pci_vendor_name(vendor_id):
+    return PCI_VENDORS.get(vendor_id, f"Vendor {vendor_id:04x}" if vendor_id is not None else "Unknown")
+
+
+def device_label(device):
+    """Display name of one PCI device, from the PCI ID index when it has been built."""
+    if device.get("name"):
+        return device["name"]
+    from Detection.PciIds import get_index
+    index = get_index()
+    names = index.describe(device) if index else {}
+    vendor = names.get("vendor") or pci_vendor_name(device.get("vendor_id"))
+    if names.get("device"):
+        return f"{vendor} {names['device']}"
+    return f"{vendor} [{device.get('vendor_id') or 0:04x}:{device.get('device_id') or 0:04x}]"
+
+
+def gpus(pci):
+    """Graphics controllers, the most likely dedicated one first."""
+    if not isinstance(pci, list):
+        return []
+    found = [device for device in pci if device.get("class_id") is not None
+             and device["class_id"] >> 16 == DISPLAY_CLASS]
+    # Discrete vendors before Intel, then the firmware's boot display
+    return sorted(found, key=lambda device: (device.get("vendor_id") == 0x8086, not device.get("boot_vga")))
+
+
+def format_cpu(cpu):
+    if not isinstance(cpu, dict) or "error" in cpu:
+        return "N/A"
+    return f"{cpu.get('name', 'Unknown')} ({cpu.get('cores', 0)}C/{cpu.get('threads', 0)}T)"
+
+
+def format_memory(memory):
+    if not isinstance(memory, dict) or not memory.get("total_bytes"):
+        return "N/A"
+    return f"{round(memory['total_bytes'] / (1024 ** 3))} GB"
+
+
+def format_gpu(pci):
+    found = gpus(pci)
+    return device_label(found[0]) if found else "N/A"
+
+
+def summary(info):
+    """The three values Setup shows: {"CPU", "GPU", "RAM"}."""
+    return {"CPU": format_cpu(info.get("cpu")), "GPU": format_gpu(info.get("pci")),
+            "RAM": format_memory(info.get("memory"))}
+
+
+if __name__ == "__main__":
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    start = time.perf_counter()
+    result = detect_hardware(status_callback=print, use_cache="--no-cache" not in sys.argv)
+    print(json.dumps(summary(result), indent=2))
+    print(f"{(time.perf_counter() - start) * 1000:.1f} ms")
@@ -0,0 +1,320 @@
+# Detection/PciIds.py
+
+"""
+PciIds Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Names for PCI vendor, device, subsystem and class IDs, from the pci.ids
+database (https://pci-ids.ucw.cz). pci.ids is a text file of about 1.5 MB
+that takes a noticeable time to parse, so it is compiled once into a
+binary index:
+
+    python -m hackintoshify pci-ids --build [SOURCE] [--output FILE]
+
+It is written to the config folder (get_index_path), next to the
+hardware cache, so the install itself stays read-only.
+
+The index is a header followed by one sorted key array and one
+(offset, length) array per table, plus a blob of UTF-8 names:
+
+    header      MAGIC, VERSION, then count/keys/refs offsets per table,
+                the names blob, and the pci.ids version line
+    vendors     u32 keys: vendor
+    devices     u32 keys: vendor << 16 | device
+    subsystems  u64 keys: vendor << 48 | device << 32 | subvendor << 16 | subdevice
+    classes     u32 keys: class << 16 | subclass << 8 | prog-if, with 0xff
+                for levels a line does not set (class "03" is 0x03ffff)
+
+All integers are little-endian. PciIdIndex maps the file and casts the
+arrays to memoryviews, so opening it reads only the header. A lookup is
+a bisect over one key array, done in C, plus one slice of the names blob.
+
+Usage:
+    index = get_index()
+    if index:
+        index.device(0x8086, 0x3e92)    # "CoffeeLake-S GT2 [UHD Graphics 630]"
+"""
+
+import os
+import sys
+import mmap
+import time
+import bisect
+import struct
+
+PCI_IDS_URL = "https://pci-ids.ucw.cz/v2.2/pci.ids"
+# Where distributions keep their copy
+SYSTEM_PCI_IDS = ["/usr/share/hwdata/pci.ids", "/usr/share/misc/pci.ids", "/usr/share/pci.ids",
+                  "/usr/local/share/pci.ids"]
+INDEX_FILE = "pci_ids.bin"
+
+MAGIC = b"HKPCIIDX"
+VERSION = 1
+TABLES = ("vendors", "devices", "subsystems", "classes")
+KEY_FORMATS = {"vendors": "I", "devices": "I", "subsystems": "Q", "classes": "I"}
+ANY = 0xff      # Class levels a line does not set
+
+# magic, version, 4 x (count, keys offset, refs offset), names offset and length, version line offset and length
+HEADER = struct.Struct("<8sI" + "III" * len(TABLES) + "IIII")
+
+
+class PciIdsError(Exception):
+    pass
+
+
+# --- Parsing pci.ids ---
+
+def parse_pci_ids(lines):
+    """
+    Yields (table, key, name) for every entry of a pci.ids file, and
+    ("version", 0, text) for its "# Version:" line.
+    """
+    vendor = device = None
+    klass = subclass = None
+    in_classes = False
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if not line:
+            continue
+        if line.startswith("#"):
+            text = line[1:].strip()
+            if text.startswith("Version:"):
+                yield "version", 0, text[len("Version:"):].strip()
+            continue
+
+        depth = len(line) - len(line.lstrip("\t"))
+        body = line.lstrip("\t")
+        try:
+            if depth == 0:
+                if body.startswith("C "):
+                    in_classes = True
+                    code, _, name = body[2:].partition("  ")
+                    klass, subclass = int(code, 16), None
+                    yield "classes", klass << 16 | ANY << 8 | ANY, name.strip()
+                else:
+                    in_classes = False
+                    code, _, name = body.partition("  ")
+                    vendor, device = int(code, 16), None
+                    yield "vendors", vendor, name.strip()
+            elif depth == 1:
+                code, _, name = body.partition("  ")
+                if in_classes and klass is not None:
+                    subclass = int(code, 16)
+                    yield "classes", klass << 16 | subclass << 8 | ANY, name.strip()
+                elif vendor is not None:
+                    device = int(code, 16)
+                    yield "devices", vendor << 16 | device, name.strip()
+            elif depth == 2:
+                if in_classes and subclass is not None:
+                    code, _, name = body.partition("  ")
+                    yield "classes", klass << 16 | subclass << 8 | int(code, 16), name.strip()
+                elif vendor is not None and device is not None:
+                    codes, _, name = body.partition("  ")
+                    sub_vendor, sub_device = (int(part, 16) for part in codes.split())
+                    yield "subsystems", vendor << 48 | device << 32 | sub_vendor << 16 | sub_device, name.strip()
+        except ValueError:
+            continue    # A malformed line loses only itself
+
+
+def get_index_path():
+    from Logic.Settings import get_config_dir
+    return os.path.join(get_config_dir(), INDEX_FILE)
+
+
+def find_pci_ids():
+    for path in SYSTEM_PCI_IDS:
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def download_pci_ids(dest_path, status_callback=None):
+    import requests
+    if status_callback:
+        status_callback(f"Downloading {PCI_IDS_URL}")
+    response = requests.get(PCI_IDS_URL, timeout=60)
+    response.raise_for_status()
+    with open(dest_path, "wb") as f:
+        f.write(response.content)
+    return dest_path
+
+
+# --- Building the index ---
+
+def compile_pci_ids(source_path, output_path=None, status_callback=None):
+    """Compiles a pci.ids text file into the binary index (get_index_path() by default). Returns the entry counts."""
+    output_path = output_path or get_index_path()
+    start = time.perf_counter()
+    entries = {table: {} for table in TABLES}
+    version = ""
+    with open(source_path, "r", encoding="utf-8", errors="replace") as f:
+        for table, key, name in parse_pci_ids(f):
+            if table == "version":
+                version = name
+            else:
+                entries[table].setdefault(key, name)    # First definition wins, like lspci
+
+    names = bytearray()
+    name_refs = {}
+
+    def add_name(text):
+        # Many subsystems share a name, store each distinct one once
+        data = text.encode("utf-8")
+        if data not in name_refs:
+            name_refs[data] = (len(names), len(data))
+            names.extend(data)
+        return name_refs[data]
+
+    version_ref = add_name(version)
+    sections = []
+    for table in TABLES:
+        keys = sorted(entries[table])
+        key_bytes = struct.pack(f"<{len(keys)}{KEY_FORMATS[table]}", *keys)
+        refs = []
+        for key in keys:
+            refs.extend(add_name(entries[table][key]))
+        sections.append((len(keys), key_bytes, struct.pack(f"<{len(refs)}I", *refs)))
+
+    # Lay out: header, then per table keys and refs (8-byte aligned for the u64 keys), then names
+    offset = HEADER.size
+    layout = []
+    body = bytearray()
+    for count, key_bytes, ref_bytes in sections:
+        offset_keys = _align(offset + len(body))
+        body.extend(b"\0" * (offset_keys - offset - len(body)))
+        body.extend(key_bytes)
+        offset_refs = offset + len(body)
+        body.extend(ref_bytes)
+        layout.extend((count, offset_keys, offset_refs))
+    names_offset = offset + len(body)
+
+    header = HEADER.pack(MAGIC, VERSION, *layout, names_offset, len(names), *version_ref)
+    tmp = output_path + ".tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(body)
+        f.write(names)
+    os.replace(tmp, output_path)
+
+    stats = {table: count for table, (count, _, _) in zip(TABLES, sections)}
+    stats.update(version=version, bytes=os.path.getsize(output_path), output=output_path,
+                 seconds=round(time.perf_counter() - start, 3))
+    if status_callback:
+        status_callback(f"Compiled {source_path} ({version or 'unknown version'}) into {output_path}, "
+                        f"{stats['bytes'] // 1024} KB")
+    return stats
+
+
+def _align(offset, to=8):
+    return (offset + to - 1) // to * to
+
+
+# --- Lookups ---
+
+class PciIdIndex:
+    def __init__(self, path=None):
+        self.path = path = path or get_index_path()
+        with open(path, "rb") as f:
+            try:
+                self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                self.buffer = f.read()      # Empty file or no mmap on this file system
+        if len(self.buffer) < HEADER.size:
+            raise PciIdsError(f"{path} is not a PCI ID index")
+        fields = HEADER.unpack_from(self.buffer, 0)
+        if fields[0] != MAGIC or fields[1] != VERSION:
+            raise PciIdsError(f"{path} is not a PCI ID index of version {VERSION}")
+
+        view = memoryview(self.buffer)
+        self.keys = {}
+        self.refs = {}
+        for i, table in enumerate(TABLES):
+            count, keys_offset, refs_offset = fields[2 + 3 * i:5 + 3 * i]
+            size = struct.calcsize(KEY_FORMATS[table])
+            self.keys[table] = view[keys_offset:keys_offset + count * size].cast(KEY_FORMATS[table])
+            self.refs[table] = view[refs_offset:refs_offset + count * 8].cast("I")
+        names_offset, names_length, version_offset, version_length = fields[-4:]
+        self.names = view[names_offset:names_offset + names_length]
+        self.version = self._name(version_offset, version_length)
+
+    def _name(self, offset, length):
+        return bytes(self.names[offset:offset + length]).decode("utf-8")
+
+    def _lookup(self, table, key):
+        keys = self.keys[table]
+        i = bisect.bisect_left(keys, key)
+        if i == len(keys) or keys[i] != key:
+            return None
+        refs = self.refs[table]
+        return self._name(refs[2 * i], refs[2 * i + 1])
+
+    def __len__(self):
+        return sum(len(keys) for keys in self.keys.values())
+
+    def vendor(self, vendor_id):
+        return self._lookup("vendors", vendor_id)
+
+    def device(self, vendor_id, device_id):
+        return self._lookup("devices", vendor_id << 16 | device_id)
+
+    def subsystem(self, vendor_id, device_id, subvendor_id, subdevice_id):
+        return self._lookup("subsystems", vendor_id << 48 | device_id << 32 | subvendor_id << 16 | subdevice_id)
+
+    def class_name(self, class_id):
+        """Most specific name of a 24-bit class code (class, subclass, prog-if)."""
+        klass, subclass, prog_if = class_id >> 16 & 0xff, class_id >> 8 & 0xff, class_id & 0xff
+        for key in (klass << 16 | subclass << 8 | prog_if, klass << 16 | subclass << 8 | ANY,
+                    klass << 16 | ANY << 8 | ANY):
+            name = self._lookup("classes", key)
+            if name:
+                return name
+        return None
+
+    def devices_of(self, vendor_id):
+        """(device_id, name) for every device of a vendor, a contiguous range of the device keys."""
+        keys = self.keys["devices"]
+        refs = self.refs["devices"]
+        start = bisect.bisect_left(keys, vendor_id << 16)
+        end = bisect.bisect_left(keys, (vendor_id + 1) << 16)
+        return [(keys[i] & 0xffff, self._name(refs[2 * i], refs[2 * i + 1])) for i in range(start, end)]
+
+    def describe(self, device):
+        """Names for a device dict from Detection.DetectOS."""
+        vendor_id, device_id = device.get("vendor_id"), device.get("device_id")
+        if vendor_id is None or device_id is None:
+            return {}
+        result = {"vendor": self.vendor(vendor_id), "device": self.device(vendor_id, device_id)}
+        if device.get("subsystem_vendor_id") is not None and device.get("subsystem_device_id") is not None:
+            result["subsystem"] = self.subsystem(vendor_id, device_id, device["subsystem_vendor_id"],
+                                                 device["subsystem_device_id"])
+        if device.get("class_id") is not None:
+            result["class"] = self.class_name(device["class_id"])
+        return result
+
+
+_index = None
+_index_loaded = False
+
+
+def get_index(path=None):
+    """The shared index, or None if it has not been built."""
+    global _index, _index_loaded
+    if path is not None:
+        return PciIdIndex(path)
+    if not _index_loaded:
+        _index_loaded = True
+        try:
+            _index = PciIdIndex(get_index_path())
+        except (OSError, PciIdsError):
+            _index = None
+    return _index
+
+
+if __name__ == "__main__":
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    source = sys.argv[1] if len(sys.argv) > 1 else find_pci_ids()
+    if not source:
+        sys.exit("No pci.ids found, pass its path")
+    print(compile_pci_ids(source, sys.argv[2] if len(sys.argv) > 2 else None, status_callback=print))
@@ -0,0 +1,291 @@
+# Downloader/Catalog.py
+
+"""
+Catalog Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Full macOS installers (InstallAssistant.pkg) from Apple's software update
+catalog. The catalog is a gzipped XML plist of many MB with thousands of
+products, so it is parsed with iterparse: every product dict is converted,
+kept if it is an InstallAssistant product and then cleared, which keeps
+memory flat no matter how big the catalog gets.
+
+The resulting index is cached in CATALOG_CACHE_FILE together with the
+ETag/Last-Modified of the catalog, and refreshed with a conditional
+request, so an unchanged catalog costs one 304.
+
+parse_catalog() takes any file object, plain or gzipped, so it can be run
+against a catalog saved to disk:
+
+    python -m Downloader.Catalog path/to/catalog.sucatalog.gz
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import time
+import base64
+import requests
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+CATALOG_URL = ("https://swscan.apple.com/content/catalogs/others/"
+               "index-26-15-14-13-12-10.16-10.15-10.14-10.13-10.12-10.11-10.10-10.9"
+               "-mountainlion-lion-snowleopard-leopard.merged-1.sucatalog.gz")
+CATALOG_CACHE_FILE = "installer_catalog.json"
+CACHE_VERSION = 1
+USER_AGENT = "Software%20Update (unknown version) CFNetwork/807.0.1 Darwin/16.0.0 (x86_64)"
+TIMEOUT = 30
+INSTALLER_PACKAGE = "InstallAssistant.pkg"
+GZIP_MAGIC = b"\x1f\x8b"
+
+MARKETING_NAMES = {
+    "26": "Tahoe", "15": "Sequoia", "14": "Sonoma", "13": "Ventura", "12": "Monterey", "11": "Big Sur",
+    "10.15": "Catalina", "10.14": "Mojave", "10.13": "High Sierra",
+}
+
+
+def plist_value(elem):
+    """Converts one plist XML element (and its children) to Python."""
+    tag = elem.tag
+    if tag == "dict":
+        result = {}
+        children = list(elem)
+        for key, value in zip(children[::2], children[1::2]):
+            result[key.text or ""] = plist_value(value)
+        return result
+    if tag == "array":
+        return [plist_value(child) for child in elem]
+    if tag == "integer":
+        return int(elem.text)
+    if tag == "real":
+        return float(elem.text)
+    if tag == "true":
+        return True
+    if tag == "false":
+        return False
+    if tag == "data":
+        return base64.b64decode(elem.text or "")
+    return elem.text or ""   # string, date
+
+
+class _PrefixedReader:
+    """File object that returns `head` first and then the rest of `fileobj`."""
+
+    def __init__(self, head, fileobj):
+        self.head = head
+        self.fileobj = fileobj
+
+    def read(self, size=-1):
+        if not self.head:
+            return self.fileobj.read(size)
+        if size is None or size < 0:
+            data, self.head = self.head + self.fileobj.read(), b""
+            return data
+        data, self.head = self.head[:size], self.head[size:]
+        if len(data) < size:
+            data += self.fileobj.read(size - len(data))
+        return data
+
+
+def _open_stream(fileobj):
+    """Wraps `fileobj` in a GzipFile if it starts with the gzip magic."""
+    head = fileobj.read(2)
+    stream = _PrefixedReader(head, fileobj)
+    if head == GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=stream)
+    return stream
+
+
+def _is_installer(product):
+    meta = product.get("ExtendedMetaInfo", {})
+    if "InstallAssistantPackageIdentifiers" in meta:
+        return True
+    return any(pkg.get("URL", "").endswith(INSTALLER_PACKAGE) for pkg in product.get("Packages", []))
+
+
+def _installer_entry(product_id, product):
+    packages = [{"url": pkg.get("URL", ""), "size": pkg.get("Size", 0), "digest": pkg.get("Digest", "")}
+                for pkg in product.get("Packages", [])]
+    installer = next((pkg for pkg in packages if pkg["url"].endswith(INSTALLER_PACKAGE)), None)
+    distributions = product.get("Distributions", {})
+    return {
+        "id": product_id,
+        "post_date": product.get("PostDate", ""),
+        "installer_url": installer["url"] if installer else None,
+        "installer_size": installer["size"] if installer else 0,
+        "packages": packages,
+        "dist_url": distributions.get("English") or next(iter(distributions.values()), None),
+        "server_metadata_url": product.get("ServerMetadataURL"),
+    }
+
+
+def parse_catalog(fileobj):
+    """
+    Streams a sucatalog (plain or gzipped) and returns the InstallAssistant
+    products as a list of dicts, without building the whole plist in memory.
+    """
+    installers = []
+    stack = []              # Open elements: plist, root dict, Products dict, product dict, ...
+    products = None         # The Products <dict> while inside it
+    last_key = {}           # depth -> text of the last <key> closed at that depth
+
+    for event, elem in ET.iterparse(_open_stream(fileobj), events=("start", "end")):
+        if event == "start":
+            if elem.tag == "dict" and len(stack) == 2 and last_key.get(2) == "Products":
+                products = elem
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        depth = len(stack)
+        if elem.tag == "key":
+            last_key[depth] = elem.text
+        elif elem is products:
+            products = None
+        elif products is not None and elem.tag == "dict" and depth == 3:
+            # One complete product, keyed by the <key> right before it
+            product = plist_value(elem)
+            if _is_installer(product):
+                installers.append(_installer_entry(last_key.get(3), product))
+            # Drop everything parsed so far under Products
+            products.clear()
+    return installers
+
+
+def parse_distribution(text):
+    """VERSION, BUILD and a display name out of a product's .dist file."""
+    info = {}
+    for key in ("VERSION", "BUILD"):
+        match = re.search(rf"<key>{key}</key>\s*<string>([^<]*)</string>", text)
+        if match:
+            info[key.lower()] = match.group(1)
+    version = info.get("version")
+    if version:
+        parts = version.split(".")
+        major = parts[0] if parts[0] != "10" else ".".join(parts[:2])
+        marketing = MARKETING_NAMES.get(major)
+        info["name"] = f"macOS {marketing} {version}" if marketing else f"macOS {version}"
+    return info
+
+
+class InstallerCatalog:
+    """
+    Usage:
+        catalog = InstallerCatalog(status_callback=print)
+        for installer in catalog.refresh():
+            print(installer["name"], installer["installer_url"], installer["installer_size"])
+    """
+
+    def __init__(self, url=CATALOG_URL, cache_file=CATALOG_CACHE_FILE, status_callback=None,
+                 fetch_distributions=True, session=None):
+        self.url = url
+        self.cache_file = cache_file
+        self.status_callback = status_callback
+        self.fetch_distributions = fetch_distributions
+        self.session = session or requests.Session()
+        self.cache = self.load_cache()
+
+    def _status(self, text):
+        if self.status_callback:
+            self.status_callback(text)
+
+    def load_cache(self):
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, "r") as f:
+                    cache = json.load(f)
+                if cache.get("version") == CACHE_VERSION and cache.get("url") == self.url:
+                    return cache
+            except (OSError, ValueError):
+                pass
+        return {}
+
+    def save_cache(self):
+        tmp = self.cache_file + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.cache, f, indent=4)
+        os.replace(tmp, self.cache_file)
+
+    @property
+    def installers(self):
+        return self.cache.get("installers", [])
+
+    def refresh(self):
+        """Re-fetches the catalog unless the server says it did not change. Returns the installers."""
+        headers = {"User-Agent": USER_AGENT}
+        if self.cache.get("etag"):
+            headers["If-None-Match"] = self.cache["etag"]
+        if self.cache.get("last_modified"):
+            headers["If-Modified-Since"] = self.cache["last_modified"]
+
+        self._status("Checking software update catalog...")
+        response = self.session.get(self.url, headers=headers, stream=True, timeout=TIMEOUT)
+        try:
+            if response.status_code == 304 and self.cache:
+                self._status(f"Catalog unchanged, {len(self.installers)} installers")
+                return self.installers
+            response.raise_for_status()
+            response.raw.decode_content = True   # Undo Content-Encoding, .gz bodies are handled by the parser
+            self._status("Parsing catalog...")
+            installers = parse_catalog(response.raw)
+        finally:
+            response.close()
+
+        self._add_distributions(installers)
+        installers.sort(key=lambda item: item.get("post_date", ""), reverse=True)
+        self.cache = {
+            "version": CACHE_VERSION,
+            "url": self.url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched": time.time(),
+            "installers": installers,
+        }
+        self.save_cache()
+        self._status(f"Found {len(installers)} installers")
+        return installers
+
+    def _add_distributions(self, installers):
+        """Names and versions come from the small .dist files, reused from the cache when unchanged."""
+        known = {item["id"]: item for item in self.installers}
+        pending = []
+        for item in installers:
+            old = known.get(item["id"])
+            if old and old.get("dist_url") == item["dist_url"] and "version" in old:
+                item.update({key: old[key] for key in ("name", "version", "build") if key in old})
+            elif self.fetch_distributions and item["dist_url"]:
+                pending.append(item)
+
+        def fetch(item):
+            try:
+                response = self.session.get(item["dist_url"], headers={"User-Agent": USER_AGENT}, timeout=TIMEOUT)
+                response.raise_for_status()
+                return item, parse_distribution(response.text)
+            except requests.RequestException:
+                return item, {}
+
+        if pending:
+            self._status(f"Reading {len(pending)} installer descriptions...")
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for item, info in executor.map(fetch, pending):
+                    item.update(info)
+        for item in installers:
+            item.setdefault("name", f"macOS Installer - {item['id']}")
+
+
+if __name__ == "__main__":
+    start = time.time()
+    if len(sys.argv) > 1 and os.path.exists(sys.argv[1]):
+        # A catalog downloaded by hand
+        with open(sys.argv[1], "rb") as f:
+            found = parse_catalog(f)
+    else:
+        found = InstallerCatalog(status_callback=print).refresh()
+    print(f"\n--- {len(found)} installers ({time.time() - start:.2f}s) ---")
+    for installer in found:
+        print(f"[{installer['id']}] {installer.get('name', '')} {installer['installer_size'] / (1024 ** 3):.1f} GB")
+        print(f"   {installer['installer_url']}")
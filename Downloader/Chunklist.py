@@ -0,0 +1,243 @@
+# Downloader/Chunklist.py
+
+"""
+Chunklist Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Reads Apple's binary .chunklist files that sit next to every BaseSystem.dmg.
+
+Layout (little endian):
+    0x00  magic "CNKL"
+    0x04  header size (0x24)
+    0x08  file version, chunk method, signature method, padding (1 byte each)
+    0x0C  chunk count (uint64)
+    0x14  chunk table offset (uint64)
+    0x1C  signature offset (uint64)
+Each chunk table entry is a uint32 chunk size followed by its SHA-256.
+
+verify() checks a stored image against its chunklist using every core:
+the image is mmapped and chunks are hashed on a thread pool straight from
+the mapping (hashlib releases the GIL while hashing). verify_directory()
+does the same for a whole image store, e.g. as a nightly job:
+
+    python -m Downloader.Chunklist /path/to/MacImages
+"""
+
+import os
+import sys
+import mmap
+import time
+import struct
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+CHUNKLIST_MAGIC = b"CNKL"
+HEADER_FORMAT = "<4sIBBBBQQQ"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)  # 0x24
+CHUNK_FORMAT = "<I32s"
+CHUNK_ENTRY_SIZE = struct.calcsize(CHUNK_FORMAT)  # 36
+CHUNK_METHOD_SHA256 = 1
+
+MAX_WORKERS = os.cpu_count() or 1
+
+
+class ChunklistError(Exception):
+    pass
+
+
+def parse_chunklist(data):
+    """Returns the chunks of a chunklist as a list of (size, sha256 digest bytes)."""
+    if len(data) < HEADER_SIZE:
+        raise ChunklistError("Chunklist is too short")
+    magic, header_size, version, method, sig_method, _, count, chunk_offset, sig_offset = \
+        struct.unpack_from(HEADER_FORMAT, data, 0)
+    if magic != CHUNKLIST_MAGIC:
+        raise ChunklistError(f"Bad chunklist magic {magic!r}")
+    if header_size != HEADER_SIZE:
+        raise ChunklistError(f"Unexpected chunklist header size {header_size}")
+    if method != CHUNK_METHOD_SHA256:
+        raise ChunklistError(f"Unsupported chunk method {method}")
+    if chunk_offset + count * CHUNK_ENTRY_SIZE > len(data):
+        raise ChunklistError("Chunk table runs past the end of the chunklist")
+    return [struct.unpack_from(CHUNK_FORMAT, data, chunk_offset + i * CHUNK_ENTRY_SIZE) for i in range(count)]
+
+
+def load_chunklist(path):
+    with open(path, "rb") as f:
+        return parse_chunklist(f.read())
+
+
+def image_size(chunks):
+    """Size of the image a chunklist describes."""
+    return sum(size for size, _ in chunks)
+
+
+class ChunkVerifier:
+    """
+    Checks an image against its chunklist while it is being written in order.
+    feed() returns how many bytes from the start are verified so far and
+    raises ChunklistError as soon as a chunk does not match. `start` resumes
+    at an already verified offset, which must be a chunk boundary.
+    """
+
+    def __init__(self, chunks, start=0):
+        self.chunks = chunks
+        self.index = 0          # Chunk currently being hashed
+        self.verified = 0       # Bytes verified from the start of the image
+        while self.verified < start:
+            self.verified += chunks[self.index][0]
+            self.index += 1
+        if self.verified != start:
+            raise ChunklistError(f"Offset {start} is not on a chunk boundary")
+        self._hash = hashlib.sha256()
+        self._filled = 0
+
+    @property
+    def total(self):
+        return image_size(self.chunks)
+
+    @property
+    def done(self):
+        return self.index == len(self.chunks)
+
+    def feed(self, data):
+        view = memoryview(data)
+        while len(view):
+            if self.done:
+                raise ChunklistError("Image is larger than its chunklist")
+            size, digest = self.chunks[self.index]
+            take = min(size - self._filled, len(view))
+            self._hash.update(view[:take])
+            self._filled += take
+            view = view[take:]
+            if self._filled == size:
+                if self._hash.digest() != digest:
+                    raise ChunklistError(f"Chunk {self.index} at offset {self.verified} does not match")
+                self.verified += size
+                self.index += 1
+                self._hash = hashlib.sha256()
+                self._filled = 0
+        return self.verified
+
+
+def _hash_chunk(view, offset, size):
+    return hashlib.sha256(view[offset:offset + size]).digest()
+
+
+def verify(image, chunklist, workers=None):
+    """
+    Verifies `image` (a path) against `chunklist` (a path, the raw bytes, or
+    already parsed chunks).
+
+    Returns a dict:
+        ok          True when the size and every chunk match
+        bad_chunks  list of (index, offset) of chunks that do not match
+        size        image size on disk
+        expected    size the chunklist describes
+        elapsed     seconds
+        throughput  MB/s
+    """
+    start = time.time()
+    if isinstance(chunklist, (bytes, bytearray)):
+        chunks = parse_chunklist(chunklist)
+    elif isinstance(chunklist, (str, os.PathLike)):
+        chunks = load_chunklist(chunklist)
+    else:
+        chunks = chunklist
+
+    expected = image_size(chunks)
+    size = os.path.getsize(image)
+    bad = []
+
+    offsets = []
+    position = 0
+    for chunk_size, _ in chunks:
+        offsets.append(position)
+        position += chunk_size
+
+    if size and expected:
+        with open(image, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            view = memoryview(mm)
+            try:
+                # Only chunks that are fully on disk can match, the rest are bad anyway
+                present = [i for i, (chunk_size, _) in enumerate(chunks) if offsets[i] + chunk_size <= size]
+                with ThreadPoolExecutor(max_workers=workers or MAX_WORKERS) as executor:
+                    digests = executor.map(lambda i: _hash_chunk(view, offsets[i], chunks[i][0]), present)
+                    for i, digest in zip(present, digests):
+                        if digest != chunks[i][1]:
+                            bad.append((i, offsets[i]))
+                present_set = set(present)
+                bad.extend((i, offsets[i]) for i in range(len(chunks)) if i not in present_set)
+            finally:
+                view.release()
+    elif expected:
+        bad = [(i, offsets[i]) for i in range(len(chunks))]
+
+    bad.sort()
+    elapsed = time.time() - start
+    return {
+        "ok": not bad and size == expected,
+        "bad_chunks": bad,
+        "size": size,
+        "expected": expected,
+        "elapsed": elapsed,
+        "throughput": (min(size, expected) / (1024 * 1024)) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def find_images(directory):
+    """(image, chunklist) pairs in a directory: every X.dmg with an X.chunklist next to it."""
+    pairs = []
+    for dirpath, _, filenames in os.walk(directory):
+        names = set(filenames)
+        for name in sorted(filenames):
+            stem, ext = os.path.splitext(name)
+            if ext.lower() == ".dmg" and stem + ".chunklist" in names:
+                pairs.append((os.path.join(dirpath, name), os.path.join(dirpath, stem + ".chunklist")))
+    return pairs
+
+
+def verify_directory(directory, workers=None, status_callback=None):
+    """
+    Verifies every image in an image store. Images are checked one after the
+    other, each one with all cores, so the disk sees one sequential reader.
+
+    Returns a dict with per-image "results" and the batch totals.
+    """
+    start = time.time()
+    results = []
+    total_bytes = 0
+    for image, chunklist in find_images(directory):
+        try:
+            result = verify(image, chunklist, workers=workers)
+        except (OSError, ChunklistError) as e:
+            result = {"ok": False, "error": str(e), "bad_chunks": [], "size": 0}
+        result["image"] = image
+        results.append(result)
+        total_bytes += result["size"]
+        if status_callback:
+            verdict = "OK" if result["ok"] else f"FAILED {result.get('error') or len(result['bad_chunks'])}"
+            status_callback(f"{image}: {verdict}")
+
+    elapsed = time.time() - start
+    return {
+        "ok": all(r["ok"] for r in results),
+        "results": results,
+        "images": len(results),
+        "bytes": total_bytes,
+        "elapsed": elapsed,
+        "throughput": (total_bytes / (1024 * 1024)) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python -m Downloader.Chunklist <image directory>")
+        sys.exit(2)
+    report = verify_directory(sys.argv[1], status_callback=print)
+    print(f"\n--- {report['images']} images, {report['bytes'] / (1024 ** 3):.2f} GB "
+          f"in {report['elapsed']:.2f}s ({report['throughput']:.0f} MB/s) ---")
+    sys.exit(0 if report["ok"] else 1)
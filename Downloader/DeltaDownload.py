@@ -0,0 +1,261 @@
+# Downloader/DeltaDownload.py
+
+"""
+DeltaDownload Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Downloads a new BaseSystem.dmg by reusing chunks we already have. Every
+image in the local store sits next to its .chunklist, so the SHA-256 of
+each stored chunk is known without reading the image. Chunks of the new
+image that exist anywhere in the store are copied locally (and re-hashed
+on the way), the rest is fetched with one Range request per run of
+missing chunks. Every chunk is checked against the new chunklist.
+"""
+
+import os
+import time
+import hashlib
+import requests
+
+from .Chunklist import parse_chunklist, image_size, find_images, load_chunklist, ChunklistError
+from .DownloadImage import USER_AGENT, TIMEOUT, CHUNK_SIZE, DownloadCancelled, fetch_bytes
+from .Throttle import get_limiter
+
+# Missing runs closer than this are fetched as one range, a short re-download
+# is cheaper than another request round trip
+MAX_GAP = 1024 * 1024
+
+
+def index_store(directory, exclude=None):
+    """
+    Maps chunk digest -> (image path, offset, size) for every image in the
+    store that has a chunklist next to it.
+    """
+    index = {}
+    for image, chunklist in find_images(directory):
+        if exclude and os.path.abspath(image) == os.path.abspath(exclude):
+            continue
+        try:
+            chunks = load_chunklist(chunklist)
+        except (OSError, ChunklistError):
+            continue
+        # Images that are shorter than their chunklist are skipped as a whole
+        if os.path.getsize(image) < image_size(chunks):
+            continue
+        offset = 0
+        for size, digest in chunks:
+            index.setdefault(digest, (image, offset, size))
+            offset += size
+    return index
+
+
+def plan_delta(chunks, index, max_gap=MAX_GAP):
+    """
+    Splits the new image into chunks to copy and ranges to fetch.
+
+    Returns (copies, ranges):
+        copies  list of (chunk index, dest offset, source path, source offset, size)
+        ranges  list of (start, end) byte ranges to download, end exclusive,
+                with runs closer than `max_gap` merged
+    """
+    copies = []
+    missing = []
+    offset = 0
+    for i, (size, digest) in enumerate(chunks):
+        source = index.get(digest)
+        if source is not None and source[2] == size:
+            copies.append((i, offset, source[0], source[1], size))
+        else:
+            missing.append((offset, offset + size))
+        offset += size
+
+    ranges = []
+    for start, end in missing:
+        if ranges and start - ranges[-1][1] <= max_gap:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+
+    # Chunks swallowed by a merged gap are downloaded, not copied
+    copies = [c for c in copies if not any(start <= c[1] < end for start, end in ranges)]
+    return copies, ranges
+
+
+class DeltaDownloader:
+    """
+    Usage:
+        delta = DeltaDownloader(image["url"], image["chunklist"],
+                                "~/Downloads/MacImages/14.4.1_BaseSystem.dmg",
+                                store_dir="~/Downloads/MacImages", status_callback=print)
+        report = delta.run()
+        print(f"Saved {report['saved']} bytes")
+
+    The new chunklist is stored next to the image, so it becomes part of
+    the store for the next version.
+    """
+
+    def __init__(self, url, chunklist_url, dest_path, store_dir, status_callback=None,
+                 progress_callback=None, cancel_event=None, session=None, max_gap=MAX_GAP,
+                 limiter=None):
+        self.url = url
+        self.chunklist_url = chunklist_url
+        self.dest_path = dest_path
+        self.part_path = dest_path + ".part"
+        self.chunklist_path = os.path.splitext(dest_path)[0] + ".chunklist"
+        self.store_dir = store_dir
+        self.status_callback = status_callback
+        self.progress_callback = progress_callback  # (done, total)
+        self.cancel_event = cancel_event
+        self.session = session or requests.Session()
+        self.max_gap = max_gap
+        self.throttle = (limiter or get_limiter()).stream()
+
+        self.done = 0
+        self.total = 0
+
+    def _status(self, text):
+        if self.status_callback:
+            self.status_callback(text)
+
+    def _advance(self, n):
+        self.done += n
+        if self.progress_callback:
+            self.progress_callback(self.done, self.total)
+
+    def _check_cancel(self):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise DownloadCancelled()
+
+    def _throttle_wait(self, delay):
+        if self.cancel_event is not None:
+            return self.cancel_event.wait(delay)
+        time.sleep(delay)
+        return False
+
+    def _copy_chunk(self, fd, dest_offset, source, source_offset, size, digest):
+        """Copies one chunk from the store. Returns False if it no longer matches."""
+        with open(source, "rb") as f:
+            f.seek(source_offset)
+            data = f.read(size)
+        if len(data) != size or hashlib.sha256(data).digest() != digest:
+            return False
+        os.lseek(fd, dest_offset, os.SEEK_SET)
+        view = memoryview(data)
+        while len(view):
+            view = view[os.write(fd, view):]
+        return True
+
+    def _fetch_range(self, fd, start, end, chunks, offsets):
+        """Downloads [start, end) and checks every chunk inside it."""
+        headers = {"User-Agent": USER_AGENT, "Range": f"bytes={start}-{end - 1}"}
+        response = self.session.get(self.url, headers=headers, stream=True, timeout=TIMEOUT)
+        try:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise IOError("Server does not support Range requests, delta download is not possible")
+
+            # The range starts on a chunk boundary, find that chunk
+            index = offsets.index(start)
+            digest = hashlib.sha256()
+            filled = 0
+            position = start
+            os.lseek(fd, start, os.SEEK_SET)
+            for block in response.iter_content(chunk_size=CHUNK_SIZE):
+                self._check_cancel()
+                view = memoryview(block)
+                while len(view):
+                    if position >= end:
+                        raise IOError(f"Server sent more than the requested range {start}-{end - 1}")
+                    size, expected = chunks[index]
+                    take = min(size - filled, len(view))
+                    piece = view[:take]
+                    digest.update(piece)
+                    while len(piece):
+                        piece = piece[os.write(fd, piece):]
+                    filled += take
+                    position += take
+                    view = view[take:]
+                    if filled == size:
+                        if digest.digest() != expected:
+                            raise ChunklistError(f"Downloaded chunk {index} at offset {offsets[index]} does not match")
+                        index += 1
+                        digest = hashlib.sha256()
+                        filled = 0
+                self.throttle.consume(len(block), self._throttle_wait)
+                self._advance(len(block))
+            if position != end:
+                raise IOError(f"Range {start}-{end - 1} ended at {position}")
+        finally:
+            response.close()
+
+    def run(self):
+        """
+        Builds the new image. Returns a report dict:
+            size        image size
+            copied      bytes reused from the store
+            downloaded  bytes fetched from the network
+            saved       bytes not downloaded (same as copied)
+            ranges      number of Range requests made
+            elapsed     seconds
+        """
+        start = time.time()
+        self._status("Fetching chunklist...")
+        chunklist = fetch_bytes(self.chunklist_url)
+        chunks = parse_chunklist(chunklist)
+        self.total = image_size(chunks)
+
+        offsets = []
+        position = 0
+        for size, _ in chunks:
+            offsets.append(position)
+            position += size
+
+        self._status("Indexing local image store...")
+        index = index_store(self.store_dir, exclude=self.dest_path)
+        copies, ranges = plan_delta(chunks, index, self.max_gap)
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.dest_path)), exist_ok=True)
+        flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        fd = os.open(self.part_path, flags, 0o644)
+        copied = 0
+        try:
+            os.ftruncate(fd, self.total)
+
+            self._status(f"Copying {len(copies)} chunks from the local store...")
+            fallback = []
+            for i, dest_offset, source, source_offset, size in copies:
+                self._check_cancel()
+                if self._copy_chunk(fd, dest_offset, source, source_offset, size, chunks[i][1]):
+                    copied += size
+                    self._advance(size)
+                else:
+                    fallback.append((dest_offset, dest_offset + size))
+
+            # Chunks whose stored copy went bad are downloaded after all
+            if fallback:
+                ranges = sorted(ranges + fallback)
+
+            self._status(f"Downloading {len(ranges)} missing ranges...")
+            for range_start, range_end in ranges:
+                self._check_cancel()
+                self._fetch_range(fd, range_start, range_end, chunks, offsets)
+        finally:
+            os.close(fd)
+
+        os.replace(self.part_path, self.dest_path)
+        with open(self.chunklist_path, "wb") as f:
+            f.write(chunklist)
+
+        elapsed = time.time() - start
+        downloaded = self.total - copied
+        self._status(f"Reused {copied / (1024 * 1024):.1f} MB, downloaded {downloaded / (1024 * 1024):.1f} MB "
+                     f"({100 * copied / self.total if self.total else 0:.0f}% saved)")
+        return {
+            "size": self.total,
+            "copied": copied,
+            "downloaded": downloaded,
+            "saved": copied,
+            "ranges": len(ranges),
+            "elapsed": elapsed,
+        }
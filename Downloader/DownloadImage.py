@@ -0,0 +1,189 @@
+# Downloader/DownloadImage.py
+
+"""
+DownloadImage Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Headless download engine. Same behaviour as the GUI's DownloadWorker
+(HEAD for the size, resume with Range into a .part file, rename when done)
+but without Qt, so it can run inside USB_Builder pipelines and scripts.
+"""
+
+import os
+import time
+import requests
+
+from .Retry import (RetryPolicy, classify_error, resume_headers, response_validator,
+                    IncompleteDownload, ResourceChanged, FATAL, RESTART)
+from .Throttle import get_limiter
+
+CHUNK_SIZE = 256 * 1024
+USER_AGENT = "InternetRecovery/1.0"
+TIMEOUT = 30
+
+
+class DownloadCancelled(Exception):
+    pass
+
+
+def fetch_bytes(url, timeout=TIMEOUT):
+    """Downloads a small file (chunklists, catalogs) into memory."""
+    response = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=timeout)
+    response.raise_for_status()
+    return response.content
+
+
+class ImageDownloader:
+    """
+    Downloads `url` to `dest_path` through `dest_path + ".part"`.
+
+    `data_callback(offset, data)` is called after every block lands in the
+    .part file (and is visible to other readers), which is what lets a USB
+    pipeline start writing before the download is done. Set `cancel_event`
+    (a threading.Event) to stop; the .part file is kept for resuming.
+    With `finalize=False` the .part file is left in place for the caller to rename.
+    Transient failures are retried as described in Downloader.Retry.
+    Bandwidth is shaped by `limiter` (the config.ini one by default).
+    """
+
+    def __init__(self, url, dest_path, status_callback=None, progress_callback=None,
+                 data_callback=None, cancel_event=None, session=None, finalize=True, policy=None,
+                 limiter=None):
+        self.url = url
+        self.dest_path = dest_path
+        self.part_path = dest_path + ".part"
+        self.status_callback = status_callback
+        self.progress_callback = progress_callback
+        self.data_callback = data_callback
+        self.cancel_event = cancel_event
+        self.session = session or requests.Session()
+        self.finalize = finalize
+        self.policy = policy or RetryPolicy()
+        self.throttle = (limiter or get_limiter()).stream()
+        self.validator = None   # ETag or Last-Modified of the file being downloaded
+
+        self.total_size = 0
+        self.downloaded_size = 0
+        if os.path.exists(self.part_path):
+            self.downloaded_size = os.path.getsize(self.part_path)
+
+    def _status(self, text):
+        if self.status_callback:
+            self.status_callback(text)
+
+    def run(self):
+        """
+        Downloads to completion, retrying transient failures per `policy`.
+        Every retry resumes from what is already in the .part file. Returns the final path.
+        """
+        while True:
+            before = self.downloaded_size
+            try:
+                return self._attempt()
+            except DownloadCancelled:
+                raise
+            except Exception as e:
+                action, reason = classify_error(e)
+                # Whatever made it into the .part file is kept
+                self.downloaded_size = self._part_size()
+                delay = self.policy.next_delay(e, progressed=self.downloaded_size > before)
+                if action == FATAL or delay is None:
+                    raise
+                if action == RESTART:
+                    self._status(f"Restarting download ({reason})")
+                    self._restart()
+                self._status(f"Retrying in {delay:.0f}s ({reason})")
+                if self.cancel_event is not None:
+                    if self.cancel_event.wait(delay):
+                        raise DownloadCancelled()
+                else:
+                    time.sleep(delay)
+
+    def _throttle_wait(self, delay):
+        if self.cancel_event is not None:
+            return self.cancel_event.wait(delay)
+        time.sleep(delay)
+        return False
+
+    def _part_size(self):
+        return os.path.getsize(self.part_path) if os.path.exists(self.part_path) else 0
+
+    def _restart(self):
+        self.downloaded_size = 0
+        self.total_size = 0
+        self.validator = None
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+
+    def _attempt(self):
+        headers = {"User-Agent": USER_AGENT}
+        if self.total_size == 0:
+            head = self.session.head(self.url, headers=headers, allow_redirects=True, timeout=self.policy.timeout)
+            head.raise_for_status()
+            if "content-length" in head.headers:
+                self.total_size = int(head.headers["content-length"])
+            if self.validator is None:
+                self.validator = response_validator(head)
+
+        if self.total_size and self.downloaded_size == self.total_size:
+            return self._finish()
+
+        headers.update(resume_headers(self.downloaded_size, self.validator))
+        response = self.session.get(self.url, headers=headers, stream=True, timeout=self.policy.timeout)
+        try:
+            response.raise_for_status()
+
+            validator = response_validator(response)
+            if response.status_code == 206 and self.validator and validator and validator != self.validator:
+                raise ResourceChanged(f"{self.url} changed while resuming")
+            # A 200 instead of 206 means the server ignored Range or If-Range failed, start over
+            if self.downloaded_size > 0 and response.status_code != 206:
+                self.downloaded_size = 0
+                self.total_size = 0
+            if validator:
+                self.validator = validator
+            if self.total_size == 0 and "content-length" in response.headers:
+                self.total_size = int(response.headers["content-length"]) + self.downloaded_size
+
+            self._status("Downloading")
+            start = time.time()
+            session_bytes = 0
+            flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+            fd = os.open(self.part_path, flags, 0o644)
+            try:
+                os.ftruncate(fd, self.downloaded_size)
+                os.lseek(fd, self.downloaded_size, os.SEEK_SET)
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if self.cancel_event is not None and self.cancel_event.is_set():
+                        raise DownloadCancelled()
+                    if not chunk:
+                        continue
+                    offset = self.downloaded_size
+                    view = memoryview(chunk)
+                    while len(view):
+                        view = view[os.write(fd, view):]
+                    self.downloaded_size += len(chunk)
+                    session_bytes += len(chunk)
+                    self.throttle.consume(len(chunk), self._throttle_wait)
+                    if self.data_callback:
+                        self.data_callback(offset, chunk)
+                    if self.progress_callback:
+                        elapsed = time.time() - start
+                        speed = session_bytes / elapsed if elapsed > 0 else 0
+                        self.progress_callback(self.downloaded_size, self.total_size, speed)
+            finally:
+                os.close(fd)
+        finally:
+            response.close()
+
+        if self.total_size and self.downloaded_size != self.total_size:
+            raise IncompleteDownload(f"Download ended at {self.downloaded_size} of {self.total_size} bytes")
+        return self._finish()
+
+    def _finish(self):
+        self._status("Finished")
+        if not self.finalize:
+            return self.part_path
+        os.replace(self.part_path, self.dest_path)
+        return self.dest_path
@@ -0,0 +1,144 @@
+# Downloader/Retry.py
+
+"""
+Retry Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Shared retry rules for the download engines (Downloader.DownloadImage and
+the GUI's DownloadWorker). A failed attempt is classified first:
+
+    retry    network hiccups, stalls, 408/429/5xx and short bodies
+    restart  the file changed on the server (If-Range answered with a 200),
+             the .part file is thrown away and the download starts over
+    fatal    everything else (404, 403, disk full, cancel)
+
+Retries wait with exponential backoff and full jitter. The attempt counter
+resets whenever the failed attempt made progress, so a long download that
+hits the odd TCP reset never runs out of attempts.
+"""
+
+import random
+import requests
+
+MAX_ATTEMPTS = 8
+BASE_DELAY = 1.0
+MAX_DELAY = 60.0
+CONNECT_TIMEOUT = 15
+STALL_TIMEOUT = 30       # No bytes for this long and the attempt is dropped
+
+RETRY = "retry"
+RESTART = "restart"
+FATAL = "fatal"
+
+TRANSIENT_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+class IncompleteDownload(IOError):
+    """The server closed the connection before the whole body arrived."""
+    pass
+
+
+class ResourceChanged(IOError):
+    """The file on the server is not the one the .part file was started from."""
+    pass
+
+
+def classify_error(exc):
+    """Returns (RETRY | RESTART | FATAL, short reason) for an exception from one attempt."""
+    if isinstance(exc, ResourceChanged):
+        return RESTART, "file changed on server"
+    if isinstance(exc, IncompleteDownload):
+        return RETRY, "connection closed early"
+    if isinstance(exc, (requests.exceptions.ReadTimeout, requests.exceptions.ConnectTimeout)):
+        return RETRY, "stalled"
+    if isinstance(exc, requests.exceptions.HTTPError):
+        status = exc.response.status_code if exc.response is not None else None
+        if status == 416:
+            # Range past the end, usually a .part from a different file
+            return RESTART, "range not satisfiable"
+        if status in TRANSIENT_STATUS:
+            return RETRY, f"HTTP {status}"
+        return FATAL, f"HTTP {status}"
+    if isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError)):
+        return RETRY, "connection error"
+    return FATAL, str(exc) or exc.__class__.__name__
+
+
+def retry_after(exc):
+    """Seconds the server asked us to wait (Retry-After on 429/503), or None."""
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if value and value.strip().isdigit():
+        return float(value)
+    return None
+
+
+def resume_headers(offset, validator):
+    """Range headers for resuming at `offset`, guarded by If-Range when we have a validator."""
+    headers = {}
+    if offset > 0:
+        headers["Range"] = f"bytes={offset}-"
+        if validator:
+            headers["If-Range"] = validator
+    return headers
+
+
+def response_validator(response):
+    """Strong ETag, else Last-Modified. Weak ETags cannot be used with If-Range."""
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+class RetryPolicy:
+    """
+    Usage:
+        policy = RetryPolicy()
+        while True:
+            try:
+                attempt()
+                break
+            except Exception as e:
+                action, reason = classify_error(e)
+                delay = policy.next_delay(e, progressed)
+                if action == FATAL or delay is None:
+                    raise
+                wait(delay)
+    """
+
+    def __init__(self, max_attempts=MAX_ATTEMPTS, base_delay=BASE_DELAY, max_delay=MAX_DELAY,
+                 connect_timeout=CONNECT_TIMEOUT, stall_timeout=STALL_TIMEOUT):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.connect_timeout = connect_timeout
+        self.stall_timeout = stall_timeout
+        self.failures = 0
+
+    @property
+    def timeout(self):
+        # requests applies the read timeout between socket reads, which is exactly a stall timeout
+        return (self.connect_timeout, self.stall_timeout)
+
+    def backoff(self, failures):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** failures)))
+
+    def next_delay(self, exc, progressed=False):
+        """
+        Delay before the next attempt, or None when we are out of attempts.
+        `progressed` tells whether the failed attempt got any bytes.
+        """
+        if progressed:
+            self.failures = 0
+        self.failures += 1
+        if self.failures >= self.max_attempts:
+            return None
+        delay = self.backoff(self.failures - 1)
+        requested = retry_after(exc)
+        if requested is not None:
+            delay = max(delay, min(requested, self.max_delay))
+        return delay
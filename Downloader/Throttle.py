@@ -0,0 +1,212 @@
+# Downloader/Throttle.py
+
+"""
+Throttle Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Bandwidth shaping for downloads. Every download has its own token bucket
+and shares one global bucket with all other downloads in the process. A
+block of data takes its size in tokens from both; when a bucket runs dry
+the download sleeps once for exactly the missing time, so a throttled
+download costs no more CPU than an idle one.
+
+Limits come from config.ini (KB/s, 0 means unlimited):
+
+    [Bandwidth]
+    limit = 0
+    per_download_limit = 0
+    schedule = 08:00-18:00=2048, 18:00-22:00=8192
+
+A schedule entry overrides `limit` while it is active. Ranges may wrap
+past midnight (22:00-06:00). The process wide limiter follows changes to
+the section through the settings store.
+"""
+
+import time
+import threading
+import datetime
+import configparser
+
+from Logic.Settings import get_settings
+
+BURST_SECONDS = 0.5          # Bucket size, in seconds worth of the rate
+MIN_BURST = 64 * 1024
+SCHEDULE_REFRESH = 30        # Seconds between schedule checks
+SECTION = "Bandwidth"
+
+
+class TokenBucket:
+    """Thread-safe token bucket. A rate of 0 never throttles."""
+
+    def __init__(self, rate=0, burst=None):
+        self.lock = threading.Lock()
+        self.tokens = 0.0
+        self.set_rate(rate, burst)
+
+    def set_rate(self, rate, burst=None):
+        with self.lock:
+            self.rate = rate or 0
+            self.burst = burst or max(self.rate * BURST_SECONDS, MIN_BURST)
+            self.tokens = min(self.tokens, self.burst) if self.tokens else self.burst
+            self.stamp = time.monotonic()
+
+    def reserve(self, n):
+        """Takes `n` tokens, possibly into debt. Returns how long the caller has to wait."""
+        with self.lock:
+            if not self.rate:
+                return 0.0
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+            self.tokens -= n
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+def parse_time(text):
+    hours, minutes = text.strip().split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def parse_schedule(text):
+    """'08:00-18:00=2048, 22:00-06:00=0' -> [(start minute, end minute, bytes/s)]"""
+    entries = []
+    for item in (text or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        span, _, rate = item.partition("=")
+        start, _, end = span.partition("-")
+        entries.append((parse_time(start), parse_time(end), int(rate.strip()) * 1024))
+    return entries
+
+
+def scheduled_rate(entries, now=None):
+    """Rate of the first schedule entry active at `now`, or None."""
+    now = now or datetime.datetime.now()
+    minute = now.hour * 60 + now.minute
+    for start, end, rate in entries:
+        if start <= end:
+            active = start <= minute < end
+        else:
+            active = minute >= start or minute < end
+        if active:
+            return rate
+    return None
+
+
+class StreamThrottle:
+    """Throttle for one download. Call consume() after every block."""
+
+    def __init__(self, limiter, rate=0):
+        self.limiter = limiter
+        self.bucket = TokenBucket(rate)
+
+    def consume(self, n, wait=None):
+        """
+        Blocks until `n` bytes fit under both limits. `wait(seconds)` can
+        replace time.sleep; when it returns True the wait is cut short
+        (used for pause/cancel).
+        """
+        if self.bucket.rate != self.limiter.per_download_limit:
+            self.bucket.set_rate(self.limiter.per_download_limit)
+        delay = max(self.limiter.reserve(n), self.bucket.reserve(n))
+        if delay <= 0:
+            return
+        if wait is not None:
+            wait(delay)
+        else:
+            time.sleep(delay)
+
+
+class BandwidthLimiter:
+    """
+    Global limit plus a factory for per-download throttles.
+
+    Usage:
+        limiter = BandwidthLimiter.from_config()
+        throttle = limiter.stream()
+        for chunk in response.iter_content(...):
+            throttle.consume(len(chunk))
+    """
+
+    def __init__(self, limit=0, per_download_limit=0, schedule=None):
+        self.bucket = TokenBucket()
+        self.lock = threading.Lock()
+        self.configure(limit, per_download_limit, schedule)
+
+    def configure(self, limit=0, per_download_limit=0, schedule=None):
+        """Changes the limits, running downloads pick them up with their next block."""
+        with self.lock:
+            self.limit = limit
+            self.per_download_limit = per_download_limit
+            self.schedule = schedule or []
+            self._refresh()
+
+    @staticmethod
+    def read_config(config_path=None):
+        """(limit, per_download_limit, schedule) in bytes/s, from the settings store or a given config.ini."""
+        if config_path:
+            config = configparser.ConfigParser()
+            config.read(config_path)
+            section = dict(config[SECTION]) if config.has_section(SECTION) else {}
+        else:
+            section = get_settings().section(SECTION)
+        try:
+            return (int(section.get("limit", 0)) * 1024,
+                    int(section.get("per_download_limit", 0)) * 1024,
+                    parse_schedule(section.get("schedule", "")))
+        except ValueError:
+            # A broken [Bandwidth] section must not stop downloads
+            return 0, 0, []
+
+    @classmethod
+    def from_config(cls, config_path=None):
+        return cls(*cls.read_config(config_path))
+
+    def _refresh(self):
+        rate = scheduled_rate(self.schedule) if self.schedule else None
+        rate = self.limit if rate is None else rate
+        if rate != self.bucket.rate:
+            self.bucket.set_rate(rate)
+        self._next_check = time.monotonic() + SCHEDULE_REFRESH
+
+    def reserve(self, n):
+        if self.schedule and time.monotonic() >= self._next_check:
+            with self.lock:
+                if time.monotonic() >= self._next_check:
+                    self._refresh()
+        return self.bucket.reserve(n)
+
+    @property
+    def rate(self):
+        return self.bucket.rate
+
+    def stream(self):
+        return StreamThrottle(self, self.per_download_limit)
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter():
+    """Process wide limiter, read from config.ini on first use."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = BandwidthLimiter.from_config()
+            get_settings().subscribe(_on_settings_changed)
+        return _limiter
+
+
+def _on_settings_changed(changes):
+    if any(section == SECTION for section, key in changes):
+        reload_limiter()
+
+
+def reload_limiter(config_path=None):
+    """Re-reads the limits; saved settings and edits on disk trigger this on their own."""
+    limiter = get_limiter()
+    limiter.configure(*BandwidthLimiter.read_config(config_path))
+    return limiter
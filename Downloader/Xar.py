@@ -0,0 +1,367 @@
+# Downloader/Xar.py
+
+"""
+Xar Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Streaming reader for XAR archives (flat .pkg files like InstallAssistant.pkg).
+
+Layout (big endian):
+    header   "xar!", header size (uint16), version (uint16),
+             TOC compressed length (uint64), TOC uncompressed length (uint64),
+             checksum algorithm (uint32; 0 none, 1 sha1, 2 md5, 3 named)
+    TOC      zlib compressed XML listing every file with its heap offset,
+             length, encoding and checksums
+    heap     file data; the TOC checksum is stored in the heap too
+
+The header and TOC sit at the front of the file, so a member can be
+located as soon as the first few KB of the download are in, and then
+copied out while the rest arrives. PkgExtractor does exactly that for
+SharedSupport.dmg: the member goes straight to its destination, hashed on
+the way, instead of extracting a 12 GB package after the download.
+"""
+
+import os
+import bz2
+import sys
+import lzma
+import zlib
+import struct
+import hashlib
+import threading
+import xml.etree.ElementTree as ET
+
+XAR_MAGIC = b"xar!"
+HEADER_FORMAT = ">4sHHQQI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)  # 28
+CHECKSUM_ALGORITHMS = {0: None, 1: "sha1", 2: "md5"}
+READ_BLOCK = 4 * 1024 * 1024
+
+ENCODING_NONE = "application/octet-stream"
+DECOMPRESSORS = {
+    "application/x-gzip": lambda: zlib.decompressobj(),
+    "application/x-bzip2": lambda: bz2.BZ2Decompressor(),
+    "application/x-xz": lambda: lzma.LZMADecompressor(),
+    "application/x-lzma": lambda: lzma.LZMADecompressor(),
+}
+
+
+class XarError(Exception):
+    pass
+
+
+class FileSource:
+    """Random access to a complete file."""
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+
+    def read_at(self, offset, size):
+        self.file.seek(offset)
+        return self.file.read(size)
+
+    def close(self):
+        self.file.close()
+
+
+class GrowingFile:
+    """
+    Random access to a file that is still being downloaded. read_at() blocks
+    until the requested range has arrived, and raises once the download failed.
+    Call advance() with the number of bytes on disk as the download goes.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.available = 0
+        self.finished = False
+        self.error = None
+        self.cond = threading.Condition()
+        self.file = None
+
+    def advance(self, available):
+        with self.cond:
+            self.available = max(self.available, available)
+            self.cond.notify_all()
+
+    def fail(self, error):
+        with self.cond:
+            self.error = error
+            self.cond.notify_all()
+
+    def finish(self):
+        with self.cond:
+            self.finished = True
+            self.cond.notify_all()
+
+    def read_at(self, offset, size):
+        with self.cond:
+            while self.available < offset + size and self.error is None and not self.finished:
+                self.cond.wait()
+            if self.error is not None:
+                raise IOError(f"Download failed: {self.error}")
+        if self.file is None:
+            self.file = open(self.path, "rb")
+        self.file.seek(offset)
+        return self.file.read(size)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class XarMember:
+    """One file in the archive. `offset` is relative to the heap."""
+
+    def __init__(self, path, offset, length, size, encoding, archived_checksum, extracted_checksum):
+        self.path = path
+        self.offset = offset
+        self.length = length                    # Bytes in the heap
+        self.size = size                        # Bytes once extracted
+        self.encoding = encoding
+        self.archived_checksum = archived_checksum    # (algorithm, hexdigest) or None
+        self.extracted_checksum = extracted_checksum
+
+    def __repr__(self):
+        return f"XarMember({self.path!r}, offset={self.offset}, length={self.length}, encoding={self.encoding!r})"
+
+
+def _checksum(elem):
+    if elem is None or not (elem.text or "").strip():
+        return None
+    return elem.get("style", "sha1").lower(), elem.text.strip().lower()
+
+
+def _members(elem, parent=""):
+    for file_elem in elem.findall("file"):
+        name = file_elem.findtext("name", "")
+        path = f"{parent}/{name}" if parent else name
+        data = file_elem.find("data")
+        if data is not None:
+            encoding = data.find("encoding")
+            yield XarMember(
+                path,
+                int(data.findtext("offset", "0")),
+                int(data.findtext("length", "0")),
+                int(data.findtext("size", "0")),
+                encoding.get("style", ENCODING_NONE) if encoding is not None else ENCODING_NONE,
+                _checksum(data.find("archived-checksum")),
+                _checksum(data.find("extracted-checksum")),
+            )
+        yield from _members(file_elem, path)
+
+
+class XarArchive:
+    """
+    Usage:
+        archive = XarArchive(FileSource("InstallAssistant.pkg"))
+        member = archive.find("SharedSupport.dmg")
+        archive.extract(member, "SharedSupport.dmg")
+    """
+
+    def __init__(self, source):
+        self.source = source
+        header = source.read_at(0, HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise XarError("File is too short for a XAR header")
+        magic, header_size, version, toc_length, toc_size, algorithm = struct.unpack(HEADER_FORMAT, header)
+        if magic != XAR_MAGIC:
+            raise XarError(f"Bad XAR magic {magic!r}")
+        if algorithm == 3:
+            name = source.read_at(HEADER_SIZE, header_size - HEADER_SIZE)
+            self.toc_algorithm = name.split(b"\0", 1)[0].decode("ascii").lower()
+        else:
+            self.toc_algorithm = CHECKSUM_ALGORITHMS.get(algorithm)
+        self.version = version
+        self.heap_offset = header_size + toc_length
+
+        toc_compressed = source.read_at(header_size, toc_length)
+        if len(toc_compressed) != toc_length:
+            raise XarError("Archive ends inside the TOC")
+        toc_xml = zlib.decompress(toc_compressed)
+        if len(toc_xml) != toc_size:
+            raise XarError("TOC size does not match the header")
+        self.toc = ET.fromstring(toc_xml).find("toc")
+        if self.toc is None:
+            raise XarError("TOC has no <toc> element")
+        self._check_toc(toc_compressed)
+        self.members = list(_members(self.toc))
+
+    def _check_toc(self, toc_compressed):
+        checksum = self.toc.find("checksum")
+        if checksum is None or self.toc_algorithm is None:
+            return
+        offset = int(checksum.findtext("offset", "0"))
+        size = int(checksum.findtext("size", "0"))
+        stored = self.source.read_at(self.heap_offset + offset, size)
+        if hashlib.new(self.toc_algorithm, toc_compressed).digest() != stored:
+            raise XarError("TOC checksum does not match")
+
+    def find(self, name):
+        """Member by full path, or by file name if that is unique."""
+        for member in self.members:
+            if member.path == name:
+                return member
+        matches = [member for member in self.members if member.path.rsplit("/", 1)[-1] == name]
+        if len(matches) == 1:
+            return matches[0]
+        return None
+
+    def extract(self, member, dest_path, progress_callback=None, cancel_event=None):
+        """
+        Streams `member` to `dest_path` (through a .part file), decompressing
+        and checking both checksums on the way. Returns `dest_path`.
+        """
+        archived = hashlib.new(member.archived_checksum[0]) if member.archived_checksum else None
+        extracted = hashlib.new(member.extracted_checksum[0]) if member.extracted_checksum else None
+        decompressor = None
+        if member.encoding != ENCODING_NONE:
+            factory = DECOMPRESSORS.get(member.encoding)
+            if factory is None:
+                raise XarError(f"Unsupported encoding {member.encoding} for {member.path}")
+            decompressor = factory()
+
+        part_path = dest_path + ".part"
+        written = 0
+        position = self.heap_offset + member.offset
+        remaining = member.length
+        with open(part_path, "wb") as out:
+            while remaining > 0:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise XarError("Extraction cancelled")
+                data = self.source.read_at(position, min(READ_BLOCK, remaining))
+                if not data:
+                    raise XarError(f"Archive ends inside {member.path}")
+                position += len(data)
+                remaining -= len(data)
+                if archived:
+                    archived.update(data)
+                if decompressor is not None:
+                    data = decompressor.decompress(data)
+                if extracted:
+                    extracted.update(data)
+                out.write(data)
+                written += len(data)
+                if progress_callback:
+                    progress_callback(member.length - remaining, member.length)
+
+        if archived and archived.hexdigest() != member.archived_checksum[1]:
+            os.remove(part_path)
+            raise XarError(f"Archived checksum of {member.path} does not match")
+        if extracted and extracted.hexdigest() != member.extracted_checksum[1]:
+            os.remove(part_path)
+            raise XarError(f"Extracted checksum of {member.path} does not match")
+        if member.size and written != member.size:
+            os.remove(part_path)
+            raise XarError(f"{member.path} extracted to {written} bytes, expected {member.size}")
+        os.replace(part_path, dest_path)
+        return dest_path
+
+
+class PkgExtractor:
+    """
+    Downloads a .pkg and extracts one member while the download runs.
+
+    Usage:
+        job = PkgExtractor(installer["installer_url"], "~/Downloads/InstallAssistant.pkg",
+                           "~/Downloads/SharedSupport.dmg", status_callback=print)
+        job.run()
+
+    The member is usually done moments after the last byte of the download.
+    With keep_pkg=False the package is deleted afterwards.
+    """
+
+    def __init__(self, url, pkg_path, dest_path, member="SharedSupport.dmg", keep_pkg=True,
+                 status_callback=None, progress_callback=None, downloader=None):
+        # Imported here so the reader itself has no requests dependency
+        from .DownloadImage import ImageDownloader
+
+        self.url = url
+        self.pkg_path = pkg_path
+        self.dest_path = dest_path
+        self.member = member
+        self.keep_pkg = keep_pkg
+        self.status_callback = status_callback
+        self.progress_callback = progress_callback  # (stage, done, total)
+        self.cancel_event = threading.Event()
+        self.growing = GrowingFile(pkg_path + ".part")
+        self.downloader = downloader or ImageDownloader(
+            url, pkg_path, data_callback=self._on_data, cancel_event=self.cancel_event, finalize=False,
+            progress_callback=lambda done, total, speed: self._progress("download", done, total),
+        )
+        self.growing.advance(self.downloader.downloaded_size)
+        self.expected_offset = self.downloader.downloaded_size
+
+    def _status(self, text):
+        if self.status_callback:
+            self.status_callback(text)
+
+    def _progress(self, stage, done, total):
+        if self.progress_callback:
+            self.progress_callback(stage, done, total)
+
+    def _on_data(self, offset, data):
+        if offset != self.expected_offset:
+            # The downloader restarted (the pkg changed on the server, or a resume was refused). The
+            # extraction has read the old bytes, and GrowingFile only grows, so give up instead of
+            # mixing the two files. XarError is fatal to the downloader, the next run starts clean.
+            raise XarError(f"Download restarted at byte {offset} instead of continuing at "
+                           f"{self.expected_offset}, the package changed; run the extraction again")
+        self.expected_offset += len(data)
+        self.growing.advance(offset + len(data))
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        def download():
+            try:
+                self.downloader.run()
+                self.growing.finish()
+            except Exception as e:
+                self.growing.fail(e)
+
+        thread = threading.Thread(target=download, name="PkgDownload", daemon=True)
+        thread.start()
+        try:
+            archive = XarArchive(self.growing)
+            member = archive.find(self.member)
+            if member is None:
+                raise XarError(f"{self.member} is not in {self.url}")
+            self._status(f"Extracting {member.path} ({member.length / (1024 ** 3):.1f} GB) during download")
+            archive.extract(member, self.dest_path, cancel_event=self.cancel_event,
+                            progress_callback=lambda done, total: self._progress("extract", done, total))
+        except Exception:
+            self.cancel()
+            raise
+        finally:
+            thread.join()
+            self.growing.close()
+
+        if self.growing.error is not None:
+            raise self.growing.error
+        if self.keep_pkg:
+            os.replace(self.pkg_path + ".part", self.pkg_path)
+        else:
+            os.remove(self.pkg_path + ".part")
+        self._status(f"{self.member} ready")
+        return self.dest_path
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m Downloader.Xar <archive.pkg> [member dest]")
+        sys.exit(2)
+    archive = XarArchive(FileSource(sys.argv[1]))
+    if len(sys.argv) == 4:
+        found = archive.find(sys.argv[2])
+        if found is None:
+            print(f"{sys.argv[2]} not found")
+            sys.exit(1)
+        archive.extract(found, sys.argv[3])
+        print(f"Extracted {found.path} to {sys.argv[3]}")
+    else:
+        for item in archive.members:
+            print(f"{item.length:>14}  {item.encoding:<26}  {item.path}")
@@ -0,0 +1,154 @@
+# GUI_Screens/ConfigureKexts.py
+
+"""
+Configure Kexts Screen for hackintoshify GUI tool
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Picks the kexts, UEFI drivers and SSDTs for the EFI. The whole catalog
+(Logic/KextCatalog.py) is one list with search-as-you-type. What the
+recommendation engine (Logic/KextRecommender.py) finds for this machine
+is checked when the screen opens, with the reason on its row.
+"""
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QLineEdit, QListView, QAbstractItemView
+)
+from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QObject, Signal
+import threading
+
+from Logic.KextCatalog import get_catalog
+from .Functionality.KextList import KextCatalogModel, KextSearchProxy, KextItemDelegate
+from .Functionality import Themes
+
+
+class RecommendWorker(QObject):
+    """Recommends on a daemon thread, which may outlive the screen and the app (see Setup.HardwareWorker)."""
+    recommendations_ready = Signal(list)    # [{"name", "kind", "why"}]
+
+    def __init__(self):
+        super().__init__()
+        self.thread = threading.Thread(target=self.run, name="RecommendWorker", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def is_running(self):
+        return self.thread.is_alive()
+
+    def run(self):
+        from Detection.DetectOS import detect_hardware
+        from Logic.KextRecommender import recommend, explain
+        try:
+            info = detect_hardware()
+        except Exception:
+            info = {}
+        self.recommendations_ready.emit([{"name": item["name"], "kind": item["kind"], "why": explain(item)}
+                                         for item in recommend(info)])
+
+
+class ConfigureKextsScreen(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Configure Kexts")
+        self.setObjectName("kexts_screen")
+        self.resize(800, 650)
+        self.setWindowFlags(Qt.Dialog | Qt.CustomizeWindowHint | Qt.WindowTitleHint | Qt.WindowCloseButtonHint)
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self._build_ui()
+        self.apply_theme(Themes.current_theme() or "Dark")
+
+        self.recommend_worker = RecommendWorker()
+        self.recommend_worker.recommendations_ready.connect(self.on_recommendations)
+        self.recommend_worker.start()
+
+    def _build_ui(self):
+        # --- Header ---
+        header = QFrame()
+        header.setObjectName("header")
+        header.setFixedHeight(70)
+        h_layout = QHBoxLayout(header)
+        title = QLabel("Configure Kexts")
+        title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        title.setObjectName("title")
+        close_btn = QPushButton("✕")
+        close_btn.setFixedSize(30, 30)
+        close_btn.clicked.connect(self.close)
+        close_btn.setObjectName("close_btn")
+
+        h_layout.addWidget(title)
+        h_layout.addStretch()
+        h_layout.addWidget(close_btn)
+        self.layout.addWidget(header)
+
+        # --- Search ---
+        top_area = QFrame()
+        top_area.setObjectName("top_area")
+        top_layout = QVBoxLayout(top_area)
+        top_layout.setContentsMargins(30, 20, 30, 15)
+
+        self.search_field = QLineEdit()
+        self.search_field.setObjectName("kext_search")
+        self.search_field.setPlaceholderText("Search kexts, bundle IDs and descriptions")
+        self.search_field.setFixedHeight(40)
+        self.search_field.setClearButtonEnabled(True)
+
+        self.status_label = QLabel("Detecting hardware...")
+        self.status_label.setObjectName("label_sub")
+
+        top_layout.addWidget(self.search_field)
+        top_layout.addWidget(self.status_label)
+        self.layout.addWidget(top_area)
+
+        # --- Catalog ---
+        self.list_view = QListView()
+        self.list_view.setObjectName("kext_list")
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.list_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.catalog_model = KextCatalogModel(get_catalog(), self.list_view)
+        self.search_proxy = KextSearchProxy(self.list_view)
+        self.search_proxy.setSourceModel(self.catalog_model)
+        self.list_view.setModel(self.search_proxy)
+        self.list_view.setItemDelegate(KextItemDelegate(self.list_view))
+        self.layout.addWidget(self.list_view)
+
+        self.search_field.textChanged.connect(self.on_search)
+        self.catalog_model.dataChanged.connect(self.update_status)
+
+    def on_search(self, text):
+        self.search_proxy.set_query(text)
+        self.list_view.scrollToTop()
+        self.update_status()
+
+    def on_recommendations(self, recommendations):
+        self.catalog_model.set_recommendations(recommendations)
+
+    def update_status(self):
+        shown = self.search_proxy.rowCount()
+        total = self.catalog_model.rowCount()
+        selected = len(self.catalog_model.checked)
+        matches = f"{shown} of {total} shown" if self.search_proxy.query.strip() else f"{total} items"
+        recommended = len(self.catalog_model.reasons)
+        self.status_label.setText(f"{matches} • {selected} selected, {recommended} recommended for this machine")
+
+    def selected_kexts(self):
+        """Names of the checked items, for the EFI builder."""
+        return self.catalog_model.selected()
+
+    def closeEvent(self, event):
+        # Do not block on a slow WMI query, let the thread finish on its own
+        if self.recommend_worker.is_running():
+            try:
+                self.recommend_worker.recommendations_ready.disconnect(self.on_recommendations)
+            except (RuntimeError, TypeError):
+                pass    # Closed before
+        super().closeEvent(event)
+
+    def apply_theme(self, theme_name='Dark'):
+        # Rows read the palette when painted
+        Themes.apply_theme(theme_name)
+        self.list_view.viewport().update()
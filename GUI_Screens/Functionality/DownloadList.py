@@ -0,0 +1,276 @@
+# GUI_Screens/Functionality/DownloadList.py
+
+"""
+DownloadList Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+The download queue as model/view. Every download is one row of plain
+data in DownloadListModel. DownloadItemDelegate paints the rows (name,
+status, progress bar, speed and the pause/cancel buttons), and the view
+only asks it for the rows that are on screen. A hundred queued downloads
+cost a hundred small dicts, not a hundred widget trees with their own
+layouts.
+
+Workers report progress once per chunk. The model only stores the latest
+values and marks the row dirty. Every FLUSH_INTERVAL_MS the dirty rows go
+out as one dataChanged range per run of neighbouring rows, so the view
+repaints a few rows a few times a second, however fast the chunks come.
+
+Rows are kept in the order they were added and shown newest first, so a
+worker's slot in `rows` never moves and needs no lookup when it reports.
+
+Usage:
+    model = DownloadListModel(view)
+    view.setModel(model)
+    view.setItemDelegate(DownloadItemDelegate(view))
+    model.add_download("macOS Sonoma", worker)
+"""
+
+from PySide6.QtCore import (Qt, QAbstractListModel, QModelIndex, QEvent, QRect, QRectF,
+                            QSize, QTimer, Slot)
+from PySide6.QtGui import QColor, QFont, QPainter, QPen
+from PySide6.QtWidgets import QStyledItemDelegate
+
+from . import Themes
+
+FLUSH_INTERVAL_MS = 100     # How often progress reaches the screen
+MB = 1024 * 1024
+
+# Roles
+NameRole = Qt.DisplayRole
+StatusRole = Qt.UserRole + 1
+ProgressRole = Qt.UserRole + 2
+SpeedRole = Qt.UserRole + 3
+ErrorRole = Qt.UserRole + 4
+PausedRole = Qt.UserRole + 5
+ActiveRole = Qt.UserRole + 6     # False once finished or cancelled, the buttons are off
+CancelledRole = Qt.UserRole + 7
+
+ROLE_KEYS = {
+    NameRole: "name", StatusRole: "status", ProgressRole: "pct", SpeedRole: "speed",
+    ErrorRole: "error", PausedRole: "paused", ActiveRole: "active", CancelledRole: "cancelled",
+}
+PROGRESS_ROLES = [ProgressRole, SpeedRole]
+STATE_ROLES = [StatusRole, ProgressRole, SpeedRole, ErrorRole, PausedRole, ActiveRole, CancelledRole]
+
+
+class DownloadListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []              # Oldest first, row i is shown at len(rows) - 1 - i
+        self.slots = {}             # worker -> position in self.rows
+        self.dirty = {}             # position -> roles that changed since the last flush
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush)
+
+    # --- Qt model API ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in ROLE_KEYS:
+            return None
+        return self.row(index)[ROLE_KEYS[role]]
+
+    def roleNames(self):
+        return {role: key.encode() for role, key in ROLE_KEYS.items()}
+
+    # --- Rows ---
+
+    def _slot_of(self, index):
+        return len(self.rows) - 1 - index.row()
+
+    def _view_row(self, slot):
+        return len(self.rows) - 1 - slot
+
+    def row(self, index):
+        return self.rows[self._slot_of(index)]
+
+    def add_download(self, name, worker):
+        """Adds a row at the top for `worker` and follows its signals."""
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self.slots[worker] = len(self.rows)
+        self.rows.append({
+            "name": name, "worker": worker, "status": "Starting...", "pct": 0, "speed": "",
+            "error": False, "paused": False, "active": True, "cancelled": False,
+        })
+        self.endInsertRows()
+
+        # Bound slots of a GUI thread object, so these arrive queued from the worker thread
+        worker.progress.connect(self.on_progress)
+        worker.status_changed.connect(self.on_status)
+        worker.finished.connect(self.on_finished)
+        worker.error.connect(self.on_error)
+
+    def _update(self, worker, roles, **values):
+        slot = self.slots.get(worker)
+        if slot is None:
+            return
+        self.rows[slot].update(values)
+        self.dirty.setdefault(slot, set()).update(roles)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self):
+        """Announces the dirty rows as one dataChanged per run of neighbouring rows."""
+        if not self.dirty:
+            return
+        dirty, self.dirty = self.dirty, {}
+        runs = []                   # [first view row, last view row, roles]
+        for slot in sorted(dirty, reverse=True):
+            view_row = self._view_row(slot)
+            if runs and view_row == runs[-1][1] + 1:
+                runs[-1][1] = view_row
+                runs[-1][2] |= dirty[slot]
+            else:
+                runs.append([view_row, view_row, set(dirty[slot])])
+        for first, last, roles in runs:
+            self.dataChanged.emit(self.index(first), self.index(last), list(roles))
+
+    # --- Worker signals ---
+
+    @Slot(int, str, int, int)
+    def on_progress(self, pct, speed, dl, total):
+        self._update(self.sender(), PROGRESS_ROLES, pct=pct,
+                     speed=f"{speed} • {dl // MB}MB / {total // MB}MB")
+
+    @Slot(str)
+    def on_status(self, status):
+        values = {"status": status}
+        if status == "Paused":
+            values["paused"] = True
+        elif status == "Downloading":
+            values.update(paused=False, error=False)
+        elif status == "Finished":
+            values.update(active=False, speed="Complete")
+        self._update(self.sender(), STATE_ROLES, **values)
+
+    @Slot()
+    def on_finished(self):
+        self._update(self.sender(), STATE_ROLES, status="Success", pct=100)
+
+    @Slot(str)
+    def on_error(self, err):
+        self._update(self.sender(), STATE_ROLES, status=f"Error: {err}", error=True)
+
+    # --- Row actions (from the delegate's buttons) ---
+
+    def toggle_pause(self, index):
+        # Only posts a command, the worker handles it on its own thread
+        row = self.row(index)
+        if row["paused"] or row["error"]:
+            # A failed download is retried with resume(), pause() means nothing to it
+            row["worker"].resume()
+        else:
+            row["worker"].pause()
+
+    def cancel(self, index):
+        row = self.row(index)
+        row["worker"].cancel()
+        self._update(row["worker"], STATE_ROLES, status="Cancelled", active=False, cancelled=True)
+
+
+class DownloadItemDelegate(QStyledItemDelegate):
+    """Paints one download card; the pause and cancel buttons are hit-tested in editorEvent()."""
+
+    ITEM_HEIGHT = 100
+    SPACING = 15
+    MARGIN = 30
+    PADDING = 12
+    BUTTON = 30
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.name_font = QFont("Segoe UI", 11, QFont.Bold)
+        self.status_font = QFont("Segoe UI", 10)
+        self.speed_font = QFont("Consolas", 9)
+        self.button_font = QFont("Segoe UI", 11)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ITEM_HEIGHT + self.SPACING)
+
+    def _card(self, rect):
+        return rect.adjusted(self.MARGIN, self.SPACING, -self.MARGIN, 0)
+
+    def _buttons(self, card):
+        """(pause, cancel) rects at the bottom right of the card."""
+        y = card.bottom() - self.PADDING - self.BUTTON + 1
+        cancel = QRect(card.right() - self.PADDING - self.BUTTON + 1, y, self.BUTTON, self.BUTTON)
+        pause = cancel.translated(-(self.BUTTON + 6), 0)
+        return pause, cancel
+
+    def paint(self, painter, option, index):
+        colors = Themes.palette(Themes.current_theme() or "Dark")
+        row = index.model().row(index)
+        card = self._card(option.rect)
+        inner = card.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        if row["cancelled"]:
+            painter.setOpacity(0.5)
+
+        # Card
+        painter.setPen(QPen(QColor(colors["border"]), 1))
+        painter.setBrush(QColor(colors["card_bg"]))
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+
+        # Name and status
+        top = QRect(inner.left(), inner.top(), inner.width(), 22)
+        painter.setFont(self.status_font)
+        painter.setPen(QColor("#ef4444" if row["error"] else colors["text_secondary"]))
+        status_width = painter.fontMetrics().horizontalAdvance(row["status"])
+        painter.drawText(top, Qt.AlignRight | Qt.AlignVCenter, row["status"])
+        painter.setFont(self.name_font)
+        painter.setPen(QColor(colors["text_primary"]))
+        name_rect = top.adjusted(0, 0, -(status_width + 12), 0)
+        name = painter.fontMetrics().elidedText(row["name"], Qt.ElideRight, name_rect.width())
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, name)
+
+        # Progress bar
+        bar = QRectF(inner.left(), inner.top() + 28, inner.width(), 8)
+        painter.setPen(QPen(QColor(colors["border"]), 1))
+        painter.setBrush(QColor(colors["bg"]))
+        painter.drawRoundedRect(bar, 4, 4)
+        if row["pct"] > 0:
+            chunk = QRectF(bar.left(), bar.top(), bar.width() * min(row["pct"], 100) / 100, bar.height())
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(colors["accent"]))
+            painter.drawRoundedRect(chunk, 4, 4)
+
+        # Speed and buttons
+        pause, cancel = self._buttons(card)
+        painter.setFont(self.speed_font)
+        painter.setPen(QColor(colors["text_muted"]))
+        painter.drawText(QRect(inner.left(), pause.top(), pause.left() - inner.left() - 6, pause.height()),
+                         Qt.AlignLeft | Qt.AlignVCenter, row["speed"] or "0 KB/s")
+
+        painter.setFont(self.button_font)
+        for rect, glyph in ((pause, "▶" if row["paused"] or row["error"] else "⏸"), (cancel, "✕")):
+            painter.setOpacity((0.5 if row["cancelled"] else 1.0) * (1.0 if row["active"] else 0.4))
+            painter.setPen(QPen(QColor(colors["border"]), 1))
+            painter.setBrush(QColor(colors["bg"]))
+            painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 6, 6)
+            painter.setPen(QColor(colors["text_primary"]))
+            painter.drawText(rect, Qt.AlignCenter, glyph)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return False
+        if not model.row(index)["active"]:
+            return False
+        pause, cancel = self._buttons(self._card(option.rect))
+        pos = event.position().toPoint()
+        if pause.contains(pos):
+            model.toggle_pause(index)
+            return True
+        if cancel.contains(pos):
+            model.cancel(index)
+            return True
+        return False
@@ -4,123 +4,312 @@ import os
 import json
 import time
 import requests
-from PySide6.QtCore import QObject, Signal, QThread,  QMutex, QMutexLocker
+from PySide6.QtCore import QObject, Signal, Slot, QThread,  QMutex, QMutexLocker, QWaitCondition
+
+from Downloader.Retry import (RetryPolicy, classify_error, resume_headers, response_validator,
+                              IncompleteDownload, ResourceChanged, FATAL, RESTART)
+from Downloader.Throttle import get_limiter
 
 DOWNLOAD_STATE_FILE = "download_state.json"
 CHUNK_SIZE = 8192
 
+# Worker states
+QUEUED = "queued"
+RUNNING = "running"
+PAUSED = "paused"
+CANCELLED = "cancelled"
+DONE = "done"
+FAILED = "error"
+
+# Commands
+CMD_PAUSE = "pause"
+CMD_RESUME = "resume"
+CMD_CANCEL = "cancel"
+
+# Which commands each state accepts, and where they lead
+TRANSITIONS = {
+    QUEUED: {CMD_RESUME: RUNNING, CMD_PAUSE: PAUSED, CMD_CANCEL: CANCELLED},
+    RUNNING: {CMD_PAUSE: PAUSED, CMD_CANCEL: CANCELLED},
+    PAUSED: {CMD_RESUME: RUNNING, CMD_CANCEL: CANCELLED},
+    FAILED: {CMD_RESUME: RUNNING, CMD_CANCEL: CANCELLED},
+    CANCELLED: {},
+    DONE: {},
+}
+
 class DownloadWorker(QObject):
+    """
+    Download state machine, lives on its own QThread.
+
+    pause(), resume() and cancel() may be called from any thread. They only
+    post a command: a running download picks it up between two chunks, an
+    idle worker (queued, paused, failed) handles it as a queued slot on its
+    own thread. The GUI thread never runs any download code.
+    """
+
     # Signals
     progress = Signal(int, str, int, int) # progress_pct, speed_str, bytes_downloaded, total_bytes
     finished = Signal()
+    cancelled = Signal()
     error = Signal(str)
-    status_changed = Signal(str) # "Downloading", "Paused", "Finished", "Error"
+    status_changed = Signal(str) # "Queued", "Downloading", "Paused", "Cancelled", "Finished", "Error", "Retrying in ..."
+    state_changed = Signal(str) # One of the states above
+    command_posted = Signal(str) # Internal, delivers commands to the worker thread
 
     def __init__(self, url, dest_path, parent=None):
         super().__init__(parent)
         self.url = url
         self.dest_path = dest_path
         self.part_path = dest_path + ".part"
-        
-        self.is_paused = False
-        self.is_cancelled = False
-        self.is_running = False
+
+        self.mutex = QMutex()
+        self.wakeup = QWaitCondition()
+        self._state = QUEUED
+        self._pending = None # Command not yet picked up by the worker thread
+        self.command_posted.connect(self._handle_command)
         
         self.total_size = 0
         self.downloaded_size = 0
         self.start_time = 0
         self.speed = "0 KB/s"
+
+        # Network errors are retried and resumed, see Downloader/Retry.py
+        self.policy = RetryPolicy()
+        self.validator = None # ETag / Last-Modified guarding resumes
+
+        # Global + per-download bandwidth caps from config.ini [Bandwidth]
+        self.throttle = get_limiter().stream()
         
         # Init state
         if os.path.exists(self.part_path):
             self.downloaded_size = os.path.getsize(self.part_path)
             
+    # --- State ---
+
+    @property
+    def state(self):
+        with QMutexLocker(self.mutex):
+            return self._state
+
+    @property
+    def is_paused(self):
+        return self.state == PAUSED
+
+    @property
+    def is_cancelled(self):
+        return self.state == CANCELLED
+
+    @property
+    def is_running(self):
+        return self.state == RUNNING
+
+    def _set_state(self, state, status):
+        with QMutexLocker(self.mutex):
+            self._state = state
+        self.state_changed.emit(state)
+        self.status_changed.emit(status)
+
+    # --- Commands (any thread) ---
+
+    def pause(self):
+        self._post(CMD_PAUSE)
+
+    def resume(self):
+        self._post(CMD_RESUME)
+
+    def cancel(self):
+        self._post(CMD_CANCEL)
+
+    def _post(self, command):
+        with QMutexLocker(self.mutex):
+            if self._pending is not None:
+                pending_target = TRANSITIONS[self._state].get(self._pending)
+                if pending_target is not None and TRANSITIONS[pending_target].get(command) == self._state:
+                    # Pause then resume (or the other way round) before the worker saw the first: a no-op
+                    self._pending = None
+                    return
+            if command not in TRANSITIONS[self._state]:
+                return
+            self._pending = command
+            self.wakeup.wakeAll()
+        # Queued to the worker thread, runs there once no download loop is active
+        self.command_posted.emit(command)
+
+    def _take_command(self):
+        """Called by the download loop on the worker thread."""
+        with QMutexLocker(self.mutex):
+            command, self._pending = self._pending, None
+            return command
+
+    def _apply(self, command):
+        """Acts on a command inside the download loop. Returns True when the loop has to stop."""
+        if command == CMD_PAUSE:
+            self._set_state(PAUSED, "Paused") # Exit run loop, state is saved on disk
+            return True
+        if command == CMD_CANCEL:
+            self.cleanup()
+            self._set_state(CANCELLED, "Cancelled")
+            self.cancelled.emit()
+            return True
+        return False
+
+    @Slot(str)
+    def _handle_command(self, command):
+        with QMutexLocker(self.mutex):
+            if self._pending != command:
+                return # Already handled by the download loop
+            self._pending = None
+            target = TRANSITIONS[self._state].get(command)
+        if target is None:
+            return
+        if command == CMD_RESUME:
+            self.start_download()
+        else:
+            self._apply(command)
+
+    # --- Download (worker thread) ---
+
+    @Slot()
     def start_download(self):
-        self.is_running = True
-        self.is_paused = False
-        self.is_cancelled = False
-        self.status_changed.emit("Downloading")
-        
+        with QMutexLocker(self.mutex):
+            if RUNNING not in TRANSITIONS[self._state].values():
+                return
+            # A pause or cancel posted before the thread got here (e.g. while still queued) wins,
+            # its queued _handle_command would find nothing pending and drop it
+            command, self._pending = self._pending, None
+            if self._state == FAILED:
+                # Retrying by hand gets a full set of attempts again
+                self.policy.failures = 0
+        if self._apply(command):
+            return
+        self._set_state(RUNNING, "Downloading")
+
+        while True:
+            before = self.downloaded_size
+            try:
+                self._attempt()
+                return
+            except Exception as e:
+                action, reason = classify_error(e)
+                # Resume from what actually made it to disk
+                if os.path.exists(self.part_path):
+                    self.downloaded_size = os.path.getsize(self.part_path)
+                delay = self.policy.next_delay(e, progressed=self.downloaded_size > before)
+                if action == FATAL or delay is None:
+                    self._set_state(FAILED, "Error")
+                    self.error.emit(str(e))
+                    return
+                if action == RESTART:
+                    self.restart()
+                self.status_changed.emit(f"Retrying in {delay:.0f}s ({reason})")
+                if not self._wait(delay):
+                    return
+                self.status_changed.emit("Downloading")
+
+    def _wait(self, delay):
+        """Sleeps between retries. Returns False when paused or cancelled meanwhile."""
+        with QMutexLocker(self.mutex):
+            if self._pending is None:
+                # pause()/cancel() wake this up right away
+                self.wakeup.wait(self.mutex, int(delay * 1000))
+        return not self._apply(self._take_command())
+
+    def _throttle_wait(self, delay):
+        """Throttle sleep that pause()/cancel() cut short."""
+        with QMutexLocker(self.mutex):
+            if self._pending is None:
+                self.wakeup.wait(self.mutex, max(1, int(delay * 1000)))
+            return self._pending is not None
+
+    def restart(self):
+        self.downloaded_size = 0
+        self.total_size = 0
+        self.validator = None
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+
+    def _attempt(self):
+        headers = {
+            'User-Agent': 'InternetRecovery/1.0'
+        }
+
+        # Check total size if possible (HEAD request)
+        if self.total_size == 0:
+            head = requests.head(self.url, headers=headers, allow_redirects=True, timeout=self.policy.timeout)
+            head.raise_for_status()
+            if 'content-length' in head.headers:
+                self.total_size = int(head.headers.get('content-length'))
+            if self.validator is None:
+                self.validator = response_validator(head)
+
+        mode = 'wb'
+        if self.downloaded_size > 0:
+            headers.update(resume_headers(self.downloaded_size, self.validator))
+            mode = 'ab' # Append
+
+        response = requests.get(self.url, headers=headers, stream=True, timeout=self.policy.timeout)
         try:
-            # Check total size if possible (HEAD request)
-            if self.total_size == 0:
-                head = requests.head(self.url, allow_redirects=True)
-                if 'content-length' in head.headers:
-                    self.total_size = int(head.headers.get('content-length'))
-            
-            headers = {
-                'User-Agent': 'InternetRecovery/1.0'
-            }
-            mode = 'wb'
-            if self.downloaded_size > 0:
-                headers['Range'] = f"bytes={self.downloaded_size}-"
-                mode = 'ab' # Append
-                
-            response = requests.get(self.url, headers=headers, stream=True, timeout=30)
             response.raise_for_status()
-            
-            # If server doesn't support range, it sends 200 instead of 206
+
+            validator = response_validator(response)
+            if response.status_code == 206 and self.validator and validator and validator != self.validator:
+                raise ResourceChanged(f"{self.url} changed while resuming")
+
+            # If server doesn't support range (or If-Range failed), it sends 200 instead of 206
             # We must detect this to verify resume support
             is_resumed = (response.status_code == 206)
             if self.downloaded_size > 0 and not is_resumed:
                 # Server ignored range, must restart
                 self.downloaded_size = 0
+                self.total_size = 0
                 mode = 'wb'
-            
+            if validator:
+                self.validator = validator
+
             # If total size was missing from HEAD, get from GET
             if self.total_size == 0 and 'content-length' in response.headers:
                 self.total_size = int(response.headers['content-length']) + self.downloaded_size
-            
+
             self.start_time = time.time()
             bytes_in_session = 0
-            
+
             with open(self.part_path, mode) as f:
                 for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
-                    if self.is_cancelled:
+                    command = self._take_command()
+                    if command in (CMD_PAUSE, CMD_CANCEL):
                         f.close()
-                        self.cleanup()
+                        self._apply(command)
                         return
-                        
-                    if self.is_paused:
-                        self.status_changed.emit("Paused")
-                        return # Exit run loop, state is saved on disk
-                        
+
                     if chunk:
                         f.write(chunk)
                         chunk_len = len(chunk)
                         self.downloaded_size += chunk_len
                         bytes_in_session += chunk_len
-                        
+                        self.throttle.consume(chunk_len, self._throttle_wait)
+
                         # Calculate Speed
                         elapsed = time.time() - self.start_time
                         if elapsed > 1.0:
                              speed_val = bytes_in_session / elapsed
                              self.speed = self.format_speed(speed_val)
-                             
+
                         # Emit Progress
                         pct = 0
                         if self.total_size > 0:
                             pct = int((self.downloaded_size / self.total_size) * 100)
-                        
+
                         self.progress.emit(pct, self.speed, self.downloaded_size, self.total_size)
+        finally:
+            response.close()
 
-            # Success
-            os.rename(self.part_path, self.dest_path)
-            self.status_changed.emit("Finished")
-            self.finished.emit()
-            self.is_running = False
+        if self.total_size and self.downloaded_size != self.total_size:
+            raise IncompleteDownload(f"Download ended at {self.downloaded_size} of {self.total_size} bytes")
 
-        except Exception as e:
-            self.status_changed.emit("Error")
-            self.error.emit(str(e))
-            self.is_running = False
+        # Success
+        os.rename(self.part_path, self.dest_path)
+        self._set_state(DONE, "Finished")
+        self.finished.emit()
 
-    def pause(self):
-        self.is_paused = True
-    
-    def cancel(self):
-        self.is_cancelled = True
-        
     def cleanup(self):
         if os.path.exists(self.part_path):
             os.remove(self.part_path)
@@ -151,6 +340,7 @@ class DownloadManager(QObject):
         # Connect
         thread.started.connect(worker.start_download)
         worker.finished.connect(thread.quit)
+        worker.cancelled.connect(thread.quit)
         # worker.finished.connect(worker.deleteLater) # Keep worker alive to see status?
         thread.finished.connect(thread.deleteLater)
         
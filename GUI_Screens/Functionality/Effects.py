@@ -0,0 +1,160 @@
+# GUI_Screens/Functionality/Effects.py
+
+"""
+Effects Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Drop shadows without QGraphicsDropShadowEffect. That effect renders its
+widget offscreen and blurs it again on every repaint, so an animated
+scroll over a few cards re-blurs all of them every frame.
+
+CardShadow is a sibling widget stacked under its card. It draws a
+nine-patch: four corners, four stretched edges and a stretched centre cut
+from one small blurred pixmap. The pixmap is made once per corner radius,
+blur, shadow strength and screen scale, and then shared by every card, so
+a repaint is nine pixmap copies.
+
+The "low-overhead rendering" setting (Settings/low_overhead_rendering)
+turns shadows and animations off. Screens check animations_enabled()
+before they start an animation.
+
+Usage:
+    self.shadow = CardShadow(self, radius=16, blur=20, offset=(0, 4))
+    self.shadow.set_alpha(30)
+"""
+
+from functools import lru_cache
+
+from PySide6.QtCore import Qt, QEvent, QObject, QRectF
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QGraphicsBlurEffect, QGraphicsPixmapItem, QGraphicsScene, QWidget
+
+from Logic.Settings import get_settings
+
+LOW_OVERHEAD_KEY = "low_overhead_rendering"
+
+
+def low_overhead():
+    return get_settings().get("Settings", LOW_OVERHEAD_KEY, False)
+
+
+def animations_enabled():
+    return not low_overhead()
+
+
+@lru_cache(maxsize=64)
+def shadow_pixmap(radius, blur, alpha, scale=1.0):
+    """
+    A blurred rounded square just big enough to hold the corners:
+    (radius + blur) pixels of corner on each side and one stretchable pixel
+    in the middle.
+    """
+    corner = radius + blur
+    side = 2 * corner + 1
+    size = round(side * scale)
+
+    # Solid shape, blurred once through a throwaway scene
+    shape = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    shape.fill(Qt.transparent)
+    painter = QPainter(shape)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(0, 0, 0, alpha))
+    painter.scale(scale, scale)
+    painter.drawRoundedRect(QRectF(blur, blur, 2 * radius + 1, 2 * radius + 1), radius, radius)
+    painter.end()
+
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(QPixmap.fromImage(shape))
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur * scale)
+    effect.setBlurHints(QGraphicsBlurEffect.QualityHint)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+
+    blurred = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    blurred.fill(Qt.transparent)
+    painter = QPainter(blurred)
+    scene.render(painter, QRectF(0, 0, size, size), QRectF(0, 0, size, size))
+    painter.end()
+
+    pixmap = QPixmap.fromImage(blurred)
+    pixmap.setDevicePixelRatio(scale)
+    return pixmap
+
+
+def draw_nine_patch(painter, rect, pixmap, corner):
+    """Draws `pixmap` over `rect` with `corner`-sized corners kept unscaled."""
+    scale = pixmap.devicePixelRatio()
+    side = pixmap.width() / scale
+    corner = min(corner, rect.width() / 2, rect.height() / 2)
+    x = (rect.left(), rect.left() + corner, rect.right() - corner, rect.right())
+    y = (rect.top(), rect.top() + corner, rect.bottom() - corner, rect.bottom())
+    sx = (0, corner, side - corner, side)
+    for row in range(3):
+        for col in range(3):
+            target = QRectF(x[col], y[row], x[col + 1] - x[col], y[row + 1] - y[row])
+            if target.isEmpty():
+                continue
+            # Source rects are in device pixels
+            source = QRectF(sx[col] * scale, sx[row] * scale,
+                            (sx[col + 1] - sx[col]) * scale, (sx[row + 1] - sx[row]) * scale)
+            painter.drawPixmap(target, pixmap, source)
+
+
+class CardShadow(QWidget):
+    """Paints the shadow of `target` from its parent, one layer below it."""
+
+    def __init__(self, target, radius=12, blur=15, offset=(0, 2), alpha=30):
+        super().__init__(target.parentWidget())
+        self.target = target
+        self.radius = radius
+        self.blur = blur
+        self.offset = offset
+        self.alpha = alpha
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.tracker = _TargetTracker(self)
+        target.installEventFilter(self.tracker)
+        target.destroyed.connect(self.deleteLater)
+        self.follow()
+
+    def set_alpha(self, alpha):
+        if alpha != self.alpha:
+            self.alpha = alpha
+            self.update()
+
+    def follow(self):
+        """Matches the target's parent, geometry, visibility and stacking."""
+        target = self.target
+        if self.parentWidget() is not target.parentWidget():
+            self.setParent(target.parentWidget())
+        if self.parentWidget() is None:
+            return
+        margin = self.blur
+        self.setGeometry(target.geometry().adjusted(-margin, -margin, margin, margin)
+                         .translated(*self.offset))
+        self.setVisible(target.isVisible())
+        self.stackUnder(target)
+
+    def paintEvent(self, event):
+        if self.alpha <= 0 or low_overhead():
+            return
+        painter = QPainter(self)
+        pixmap = shadow_pixmap(self.radius, self.blur, self.alpha, self.devicePixelRatioF())
+        draw_nine_patch(painter, QRectF(self.rect()), pixmap, self.radius + self.blur)
+        painter.end()
+
+
+class _TargetTracker(QObject):
+    EVENTS = (QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide, QEvent.ParentChange, QEvent.ZOrderChange)
+
+    def __init__(self, shadow):
+        super().__init__(shadow)
+        self.shadow = shadow
+
+    def eventFilter(self, obj, event):
+        if event.type() in self.EVENTS:
+            self.shadow.follow()
+        return False
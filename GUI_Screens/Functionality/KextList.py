@@ -0,0 +1,270 @@
+# GUI_Screens/Functionality/KextList.py
+
+"""
+KextList Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+The kext catalog as model/view for ConfigureKexts.
+
+KextCatalogModel holds every catalog entry once, with whether it is
+checked and why it was recommended. KextSearchProxy puts a search in
+front of it. It does not filter row by row like QSortFilterProxyModel,
+which would call back into Python for every row and every comparison on
+each keystroke. It asks Logic/KextSearch.py for the ranked rows and maps
+proxy row i to source row rows[i]. A keystroke costs the index lookup
+and one model reset, and the view paints only the rows on screen.
+
+Usage:
+    model = KextCatalogModel(get_catalog(), view)
+    proxy = KextSearchProxy(view)
+    proxy.setSourceModel(model)
+    search_field.textChanged.connect(proxy.set_query)
+"""
+
+from PySide6.QtCore import (Qt, QAbstractListModel, QAbstractProxyModel, QModelIndex, QEvent, QPointF, QRect,
+                            QRectF, QSize)
+from PySide6.QtGui import QColor, QFont, QPainter, QPen
+from PySide6.QtWidgets import QStyledItemDelegate
+
+from Logic.KextSearch import SearchIndex, IncrementalSearch
+from . import Themes
+
+# Roles
+NameRole = Qt.DisplayRole
+KindRole = Qt.UserRole + 1
+CategoryRole = Qt.UserRole + 2
+BundleIdRole = Qt.UserRole + 3
+DescriptionRole = Qt.UserRole + 4
+ReasonRole = Qt.UserRole + 5        # Why the recommendation engine wants it, "" if it does not
+
+ROLE_KEYS = {
+    NameRole: "name", KindRole: "kind", CategoryRole: "category", BundleIdRole: "bundle_id",
+    DescriptionRole: "description",
+}
+
+
+class KextCatalogModel(QAbstractListModel):
+    def __init__(self, entries, parent=None):
+        super().__init__(parent)
+        self.entries = entries
+        self.checked = set()        # Names
+        self.reasons = {}           # Name -> explanation from Logic.KextRecommender
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        if role in ROLE_KEYS:
+            return entry[ROLE_KEYS[role]]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if entry["name"] in self.checked else Qt.Unchecked
+        if role == ReasonRole:
+            return self.reasons.get(entry["name"], "")
+        if role == Qt.ToolTipRole:
+            return self.reasons.get(entry["name"]) or entry["description"]
+        return None
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemIsUserCheckable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid():
+            return False
+        name = self.entries[index.row()]["name"]
+        if Qt.CheckState(value) == Qt.Checked:
+            self.checked.add(name)
+        else:
+            self.checked.discard(name)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def set_recommendations(self, recommendations):
+        """Checks the recommended items and keeps their reasons for the rows."""
+        self.reasons = {item["name"]: item["why"] for item in recommendations}
+        self.checked |= set(self.reasons)
+        if self.entries:
+            self.dataChanged.emit(self.index(0), self.index(len(self.entries) - 1),
+                                  [Qt.CheckStateRole, ReasonRole, Qt.ToolTipRole])
+
+    def row_state(self, row):
+        """(entry, checked, reason) of a source row, for the delegate."""
+        entry = self.entries[row]
+        return entry, entry["name"] in self.checked, self.reasons.get(entry["name"], "")
+
+    def selected(self):
+        """Checked names in catalog order."""
+        return [entry["name"] for entry in self.entries if entry["name"] in self.checked]
+
+
+class KextSearchProxy(QAbstractProxyModel):
+    """The source rows that match the query, best match first; every row for an empty query."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.search = None
+        self.query = ""
+        self.rows = None            # Source rows in proxy order, None for all of them
+        self.proxy_rows = None      # Source row -> proxy row, built when first needed
+
+    def setSourceModel(self, model):
+        if self.sourceModel() is not None:
+            self.sourceModel().dataChanged.disconnect(self._on_source_changed)
+            self.sourceModel().modelReset.disconnect(self._rebuild)
+        self.beginResetModel()
+        super().setSourceModel(model)
+        self.search = IncrementalSearch(SearchIndex(model.entries))
+        self.rows = self.search.search(self.query)
+        self.proxy_rows = None
+        self.endResetModel()
+        model.dataChanged.connect(self._on_source_changed)
+        model.modelReset.connect(self._rebuild)
+
+    def _rebuild(self):
+        self.setSourceModel(self.sourceModel())
+
+    def set_query(self, text):
+        if text == self.query or self.search is None:
+            return
+        self.query = text
+        rows = self.search.search(text)
+        self.beginResetModel()
+        self.rows = rows
+        self.proxy_rows = None
+        self.endResetModel()
+
+    def row_state(self, index):
+        return self.sourceModel().row_state(self._source_row(index.row()))
+
+    # --- Mapping ---
+
+    def _source_row(self, proxy_row):
+        return proxy_row if self.rows is None else self.rows[proxy_row]
+
+    def _proxy_row(self, source_row):
+        if self.rows is None:
+            return source_row
+        if self.proxy_rows is None:
+            self.proxy_rows = {row: i for i, row in enumerate(self.rows)}
+        return self.proxy_rows.get(source_row)
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or self.sourceModel() is None:
+            return QModelIndex()
+        return self.sourceModel().index(self._source_row(proxy_index.row()), 0)
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = self._proxy_row(source_index.row())
+        return QModelIndex() if row is None else self.createIndex(row, 0)
+
+    def index(self, row, column=0, parent=QModelIndex()):
+        if parent.isValid() or column != 0 or not 0 <= row < self.rowCount():
+            return QModelIndex()
+        return self.createIndex(row, 0)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().rowCount() if self.rows is None else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def _on_source_changed(self, top_left, bottom_right, roles=()):
+        if self.rows is None:
+            self.dataChanged.emit(self.index(top_left.row()), self.index(bottom_right.row()), roles)
+        elif top_left == bottom_right:
+            index = self.mapFromSource(top_left)
+            if index.isValid():
+                self.dataChanged.emit(index, index, roles)
+        elif self.rows:
+            # A range of source rows is scattered over the results, repaint them all
+            self.dataChanged.emit(self.index(0), self.index(len(self.rows) - 1), roles)
+
+
+class KextItemDelegate(QStyledItemDelegate):
+    """Paints one catalog row: check box, name, kind, bundle ID and the description or recommendation."""
+
+    ITEM_HEIGHT = 56
+    PADDING = 10
+    CHECK = 16
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.name_font = QFont("Segoe UI", 10, QFont.Bold)
+        self.detail_font = QFont("Segoe UI", 9)
+        self.bundle_font = QFont("Consolas", 9)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ITEM_HEIGHT)
+
+    def _check_rect(self, rect):
+        return QRect(rect.left() + self.PADDING, rect.center().y() - self.CHECK // 2, self.CHECK, self.CHECK)
+
+    def paint(self, painter, option, index):
+        colors = Themes.palette(Themes.current_theme() or "Dark")
+        rect = option.rect
+        # Straight from the model's dicts, not role by role through QVariants
+        entry, checked, reason = index.model().row_state(index)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(colors["border_soft"]), 1))
+        painter.drawLine(rect.left(), rect.bottom(), rect.right(), rect.bottom())
+
+        # Check box
+        box = QRectF(self._check_rect(rect)).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setPen(QPen(QColor(colors["accent"] if checked else colors["border"]), 1))
+        painter.setBrush(QColor(colors["accent"] if checked else colors["input_bg"]))
+        painter.drawRoundedRect(box, 4, 4)
+        if checked:
+            painter.setPen(QPen(QColor(colors["accent_text"]), 2))
+            painter.drawPolyline([QPointF(box.left() + x, box.top() + y) for x, y in ((4, 8.5), (7, 11.5), (12, 4.5))])
+
+        left = rect.left() + 2 * self.PADDING + self.CHECK
+        text_width = rect.right() - self.PADDING - left
+        top = QRect(left, rect.top() + 8, text_width, 20)
+        bottom = QRect(left, rect.top() + 28, text_width, 20)
+
+        # Kind on the right, then name and bundle ID in what is left
+        painter.setFont(self.detail_font)
+        painter.setPen(QColor(colors["text_muted"]))
+        kind = f"{entry['kind'].upper()} · {entry['category']}"
+        kind_width = painter.fontMetrics().horizontalAdvance(kind)
+        painter.drawText(top, Qt.AlignRight | Qt.AlignVCenter, kind)
+
+        painter.setFont(self.name_font)
+        painter.setPen(QColor(colors["text_primary"]))
+        name = entry["name"]
+        name_width = painter.fontMetrics().horizontalAdvance(name)
+        painter.drawText(top, Qt.AlignLeft | Qt.AlignVCenter, name)
+
+        bundle_id = entry["bundle_id"]
+        if bundle_id:
+            painter.setFont(self.bundle_font)
+            painter.setPen(QColor(colors["text_muted"]))
+            bundle_rect = top.adjusted(name_width + 10, 0, -(kind_width + 10), 0)
+            painter.drawText(bundle_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                             painter.fontMetrics().elidedText(bundle_id, Qt.ElideRight, bundle_rect.width()))
+
+        painter.setFont(self.detail_font)
+        painter.setPen(QColor(colors["accent"] if reason else colors["text_secondary"]))
+        detail = f"Recommended: {reason}" if reason else entry["description"]
+        painter.drawText(bottom, Qt.AlignLeft | Qt.AlignVCenter,
+                         painter.fontMetrics().elidedText(detail, Qt.ElideRight, bottom.width()))
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        # The whole row toggles, the check box is only the indicator
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return False
+        checked = model.row_state(index)[1]
+        return model.setData(index, Qt.Unchecked if checked else Qt.Checked, Qt.CheckStateRole)
@@ -0,0 +1,70 @@
+# GUI_Screens/Functionality/LazyScreens.py
+
+"""
+LazyScreens Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Screens are imported when they are first opened, not at startup, so the
+first window only pays for the modules it needs itself. load_screen()
+imports a screen class by name from SCREENS.
+
+Once the main window is up, preload() imports the screens and their heavy
+dependencies (requests, the download engine) on a background thread, so
+by the time the user clicks something it is usually in sys.modules
+already. A click during the preload just waits for that one import.
+"""
+
+import sys
+import time
+import importlib
+import threading
+
+SCREENS = {
+    "download": ("GUI_Screens.DownloadImage", "DownloadImageScreen"),
+    "settings": ("GUI_Screens.SettingsScreen", "SettingsScreen"),
+    "configure_kexts": ("GUI_Screens.ConfigureKexts", "ConfigureKextsScreen"),
+    # EFI screens go here as they are written, e.g.
+    # "create_efi": ("GUI_Screens.CreateEFI", "CreateEFIScreen"),
+}
+
+# Imported in the background after the first paint, most likely needed first
+PRELOAD_MODULES = [
+    "GUI_Screens.Functionality.DownloadManager",   # pulls in requests and the Downloader engine
+    "GUI_Screens.Functionality.FetchAppleImages",
+    "GUI_Screens.DownloadImage",
+    "GUI_Screens.SettingsScreen",
+]
+PRELOAD_DELAY_MS = 250      # Let the first window settle before competing for the GIL
+
+preload_times = {}          # module -> seconds its background import took
+_preload_thread = None
+
+
+def load_screen(name):
+    """The screen class registered as `name`, imported on first use."""
+    module_name, class_name = SCREENS[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def preload(modules=None):
+    """Imports `modules` (PRELOAD_MODULES by default) on a daemon thread, once."""
+    global _preload_thread
+    if _preload_thread is not None:
+        return _preload_thread
+
+    def run():
+        for module_name in modules or PRELOAD_MODULES:
+            if module_name in sys.modules:
+                continue
+            start = time.perf_counter()
+            try:
+                importlib.import_module(module_name)
+            except ImportError:
+                # Reported by load_screen when the screen is actually opened
+                continue
+            preload_times[module_name] = time.perf_counter() - start
+
+    _preload_thread = threading.Thread(target=run, name="ScreenPreload", daemon=True)
+    _preload_thread.start()
+    return _preload_thread
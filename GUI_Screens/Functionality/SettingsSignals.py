@@ -0,0 +1,78 @@
+# GUI_Screens/Functionality/SettingsSignals.py
+
+"""
+SettingsSignals Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Qt side of Logic/Settings.py. Changes to the settings store come out as
+signals, and the config folder and both files are watched with
+QFileSystemWatcher so an edit made outside the app reaches open screens
+right away. That is inotify on Linux, FSEvents on macOS and change
+notifications on Windows. The folder catches files that are replaced
+(os.replace, most editors), the files catch edits made in place, which
+do not touch the folder. A replaced file drops out of the watcher, so
+the files are added again after every reload.
+
+Usage:
+    notifier = get_notifier()
+    notifier.theme_changed.connect(self.apply_theme)
+"""
+
+import os
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+
+from Logic.Settings import get_settings
+
+RELOAD_DELAY_MS = 100       # Editors save in several steps, reload once they are done
+
+
+class SettingsNotifier(QObject):
+    changed = Signal(str, str)      # section, key ("setup" for setup_details.json)
+    theme_changed = Signal(str)
+
+    def __init__(self, settings=None, parent=None):
+        super().__init__(parent)
+        self.settings = settings or get_settings()
+        self.settings.subscribe(self._on_changes)
+
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(RELOAD_DELAY_MS)
+        self.reload_timer.timeout.connect(self._reload)
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(lambda path: self.reload_timer.start())
+        self.watcher.fileChanged.connect(lambda path: self.reload_timer.start())
+        self.settings.ensure_files()
+        self.watcher.addPath(self.settings.config_dir)
+        self._watch_files()
+
+    def _watch_files(self):
+        watched = set(self.watcher.files())
+        missing = [path for path in self.settings.paths.values() if path not in watched and os.path.exists(path)]
+        if missing:
+            self.watcher.addPaths(missing)
+
+    def _reload(self):
+        self.settings.reload()
+        self._watch_files()
+
+    def _on_changes(self, changes):
+        # May run on any thread, signals are queued across threads
+        for section, key in changes:
+            self.changed.emit(section, key)
+            if (section, key) == ("Settings", "theme"):
+                self.theme_changed.emit(self.settings.get("Settings", "theme", "Dark"))
+
+
+_notifier = None
+
+
+def get_notifier():
+    """App wide notifier, created on first use from the GUI thread."""
+    global _notifier
+    if _notifier is None:
+        _notifier = SettingsNotifier()
+    return _notifier
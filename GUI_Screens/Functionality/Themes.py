@@ -0,0 +1,330 @@
+# GUI_Screens/Functionality/Themes.py
+
+"""
+Themes Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+All screen styles in one place. Every screen has a template below. Its
+selectors are scoped to the screen's objectName (#main_screen,
+#settings_screen, ...), so the templates can be joined into a single
+application stylesheet per theme. That stylesheet is compiled once per
+theme and cached, and switching themes is one QApplication.setStyleSheet()
+call that does nothing if the theme is already active.
+
+State changes (hover, a selected path) do not build new style
+strings. The widget flips a dynamic property, which the templates select
+on ([hover="true"]), and is re-polished with set_state().
+"""
+
+import re
+from functools import lru_cache
+
+from PySide6.QtWidgets import QApplication
+
+PALETTES = {
+    "Dark": {
+        "bg": "#0f172a",                # Slate 900
+        "card_bg": "#1e293b",           # Slate 800
+        "border": "#334155",            # Slate 700
+        "border_soft": "#334155",
+        "text_primary": "#f1f5f9",      # Slate 100
+        "text_secondary": "#94a3b8",    # Slate 400
+        "text_muted": "#64748b",        # Slate 500
+        "accent": "#38bdf8",            # Sky 400
+        "accent_hover": "#7dd3fc",      # Sky 300
+        "accent_bg": "rgba(56, 189, 248, 0.1)",
+        "accent_text": "#0f172a",       # Text on a filled accent button
+        "input_bg": "#020617",          # Slate 950
+        "input_fill": "rgba(0,0,0,0.2)",
+        "toggle_inactive": "#334155",
+        "card_shadow_alpha": 60,
+        "frame_shadow_alpha": 60,
+    },
+    "Light": {
+        "bg": "#f8fafc",                # Slate 50
+        "card_bg": "#ffffff",
+        "border": "#cbd5e1",            # Slate 300
+        "border_soft": "#e2e8f0",       # Slate 200
+        "text_primary": "#0f172a",      # Slate 900
+        "text_secondary": "#64748b",    # Slate 500
+        "text_muted": "#64748b",
+        "accent": "#0284c7",            # Sky 600
+        "accent_hover": "#0369a1",      # Sky 700
+        "accent_bg": "rgba(2, 132, 199, 0.1)",
+        "accent_text": "#ffffff",
+        "input_bg": "#f1f5f9",          # Slate 100
+        "input_fill": "rgba(0,0,0,0.08)",
+        "toggle_inactive": "#cbd5e1",
+        "card_shadow_alpha": 30,
+        "frame_shadow_alpha": 20,
+    },
+}
+
+MAIN_TEMPLATE = """
+    QWidget {{
+        background-color: {bg};
+        font-family: 'Segoe UI', sans-serif;
+        color: {text_primary};
+    }}
+    QFrame#top_bar {{ background-color: {bg}; border: none; }}
+    QFrame#nav_sep {{ background-color: {border}; }}
+    QLabel#app_title {{ color: {text_primary}; }}
+    QPushButton#settings_btn {{
+        background-color: {accent_bg};
+        color: {accent};
+        border: 1px solid {accent};
+        border-radius: 6px;
+        font-weight: 600;
+    }}
+    QPushButton#settings_btn:hover {{ background-color: {accent}; color: {accent_text}; }}
+    QLabel#hero_title {{ color: {text_primary}; }}
+    QLabel#hero_sub {{ color: {text_secondary}; }}
+
+    QFrame#ActionCard {{
+        background-color: {card_bg};
+        border: 1px solid {border};
+        border-radius: 16px;
+    }}
+    QFrame#ActionCard[hover="true"] {{ border: 1px solid {accent}; }}
+    QLabel#card_icon {{ background: transparent; border: none; }}
+    QLabel#card_title {{ background: transparent; border: none; color: {text_primary}; }}
+    QLabel#card_desc {{ background: transparent; border: none; color: {text_secondary}; }}
+"""
+
+DOWNLOAD_TEMPLATE = """
+    QWidget {{ background-color: {bg}; font-family: 'Segoe UI'; color: {text_primary}; }}
+    QFrame#header, QFrame#top_area {{ background-color: {bg}; border-bottom: 1px solid {border}; }}
+    QListView#download_list {{ border: none; }}
+    QComboBox {{ background-color: {card_bg}; border: 1px solid {border}; padding: 5px; color: {text_primary}; }}
+    QPushButton#btn_primary {{ background-color: {accent}; color: white; border-radius: 6px; font-weight: bold; }}
+    QPushButton#close_btn {{ background: transparent; border: none; color: {text_primary}; font-size: 16px; }}
+    QProgressBar {{ border: 1px solid {border}; border-radius: 4px; background: {bg}; text-align: center; }}
+    QProgressBar::chunk {{ background-color: {accent}; border-radius: 4px; }}
+
+    QFrame#overlay_bg {{ background-color: rgba(0, 0, 0, 180); border-radius: 8px; }}
+    QLabel#overlay_title {{ color: white; background: transparent; }}
+    QLabel#overlay_details {{ color: #cbd5e1; background: transparent; }}
+    QProgressBar#overlay_bar {{ background: #334155; border-radius: 3px; }}
+    QProgressBar#overlay_bar::chunk {{ background: #38bdf8; border-radius: 3px; }}
+"""
+
+KEXTS_TEMPLATE = """
+    QWidget {{ background-color: {bg}; font-family: 'Segoe UI'; color: {text_primary}; }}
+    QFrame#header, QFrame#top_area {{ background-color: {bg}; border-bottom: 1px solid {border}; }}
+    QLabel#label_sub {{ color: {text_secondary}; }}
+    QLineEdit#kext_search {{
+        background-color: {input_bg}; border: 1px solid {border}; border-radius: 6px;
+        padding: 0 10px; color: {text_primary}; font-size: 13px;
+    }}
+    QLineEdit#kext_search:focus {{ border: 1px solid {accent}; }}
+    QListView#kext_list {{ border: none; }}
+    QPushButton#close_btn {{ background: transparent; border: none; color: {text_primary}; font-size: 16px; }}
+"""
+
+SETTINGS_TEMPLATE = """
+    QDialog {{ background-color: {bg}; color: {text_primary}; }}
+    QFrame#header {{ background-color: {bg}; }}
+    QFrame#footer {{ background-color: {card_bg}; border-top: 1px solid {border_soft}; }}
+
+    /* Scroll Area & Bar */
+    QScrollArea {{ background-color: {bg}; border: none; }}
+    QScrollBar:vertical {{ border: none; background: {bg}; width: 8px; margin: 0px 0px 0px 0px; }}
+    QScrollBar::handle:vertical {{ background: {text_secondary}; min-height: 20px; border-radius: 4px; }}
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ border: none; background: none; }}
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background: none; }}
+
+    QWidget#content_container {{ background-color: {bg}; border: none; }}
+    QWidget#content_container > QFrame {{ background-color: {card_bg}; }}
+
+    /* Typography */
+    QLabel {{ color: {text_primary}; font-family: 'Segoe UI'; background: transparent; }}
+    QLabel#window_title {{ font-weight: 800; }}
+    QLabel#window_subtitle {{ color: {text_secondary}; }}
+    QLabel#section_header {{
+        color: {text_secondary};
+        font-weight: 700;
+        text-transform: uppercase;
+        letter-spacing: 1px;
+        font-size: 13px;
+        margin-top: 10px;
+        margin-bottom: 5px;
+    }}
+    QLabel#sub_label {{ color: {text_secondary}; font-size: 12px; }}
+
+    /* Cards */
+    QFrame#card {{ background-color: {card_bg}; border: 1px solid {border_soft}; border-radius: 12px; }}
+    QFrame#divider {{ background-color: {border_soft}; border: none; }}
+
+    /* Inputs */
+    QLineEdit {{
+        background-color: {input_fill};
+        border: 1px solid {border_soft};
+        border-radius: 6px;
+        padding: 0 12px;
+        color: {text_primary};
+    }}
+    QLineEdit:focus {{ border: 1px solid {accent}; }}
+
+    /* Buttons */
+    QPushButton#primary_btn {{
+        background-color: {accent}; color: #ffffff; border: none; border-radius: 6px;
+        padding: 8px 16px; font-weight: 600; font-size: 13px; min-width: 100px;
+    }}
+    QPushButton#primary_btn:hover {{ opacity: 0.9; }}
+    QPushButton#secondary_btn {{
+        background-color: transparent; color: {text_primary};
+        border: 1px solid {border_soft}; border-radius: 6px; padding: 8px 16px;
+        font-weight: 600; font-size: 13px; min-width: 80px;
+    }}
+    QPushButton#secondary_btn:hover {{ background-color: {input_bg}; }}
+    QPushButton#browse_btn {{
+        background-color: {input_bg}; color: {accent}; border: 1px solid {border_soft};
+        border-radius: 6px; font-weight: 600;
+    }}
+    QPushButton#browse_btn:hover {{ border-color: {accent}; }}
+
+    /* Combo */
+    QComboBox {{
+        background-color: {input_bg};
+        border: 1px solid {border_soft};
+        border-radius: 6px;
+        padding: 5px 10px;
+        color: {text_primary};
+    }}
+    QComboBox::drop-down {{ border: none; width: 20px; }}
+    QComboBox::down-arrow {{ image: url("{arrow_icon}"); width: 12px; height: 12px; }}
+"""
+
+SETUP_TEMPLATE = """
+    QDialog {{ background-color: {bg}; }}
+
+    QLabel {{ font-family: 'Segoe UI', sans-serif; color: {text_primary}; }}
+    QLabel#h1 {{ font-size: 24px; font-weight: 700; color: {text_primary}; }}
+    QLabel#h2 {{
+        font-size: 14px; font-weight: 700; text-transform: uppercase; letter-spacing: 0.5px;
+        color: {text_secondary}; margin-bottom: 5px;
+    }}
+    QLabel#subtitle {{ font-size: 14px; color: {text_secondary}; }}
+
+    QFrame#card {{ background-color: {card_bg}; border: 1px solid {border}; border-radius: 12px; }}
+    QFrame#separator {{ background-color: {border}; }}
+
+    QLabel#info_label {{ font-size: 13px; color: {text_secondary}; }}
+    QLabel#info_value {{ font-size: 13px; font-weight: 600; color: {text_primary}; }}
+    QLabel#field_label {{ font-size: 13px; font-weight: 600; color: {text_primary}; }}
+
+    QFrame#input_box {{ background-color: {input_bg}; border: 1px solid {border}; border-radius: 8px; }}
+    QLabel#path_text {{ color: {text_secondary}; font-style: italic; font-size: 12px; }}
+    QLabel#path_text[selected="true"] {{ color: #e2e8f0; }}
+
+    QPushButton#browse_btn {{
+        background-color: {card_bg};
+        color: {accent};
+        border: 1px solid {border};
+        border-radius: 6px;
+        padding: 5px 12px;
+        font-size: 12px;
+        font-weight: 600;
+    }}
+    QPushButton#browse_btn:hover {{ border-color: {accent}; background-color: {input_bg}; }}
+    QPushButton#primary_btn {{
+        background-color: {accent};
+        color: #0f172a;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 24px;
+        font-size: 14px;
+        font-weight: 700;
+    }}
+    QPushButton#primary_btn:hover {{ background-color: {accent_hover}; }}
+    QPushButton#secondary_btn {{
+        background-color: transparent;
+        color: {text_secondary};
+        border: none;
+        font-size: 14px;
+        font-weight: 600;
+    }}
+    QPushButton#secondary_btn:hover {{ color: {text_primary}; }}
+"""
+
+# (objectName of the screen, its own widget type, template, fixed theme or None).
+# Screens opened from another screen come after it so they win ties.
+SCREENS = [
+    ("main_screen", "QWidget", MAIN_TEMPLATE, None),
+    ("download_screen", "QWidget", DOWNLOAD_TEMPLATE, None),
+    ("kexts_screen", "QWidget", KEXTS_TEMPLATE, None),
+    ("settings_screen", "QDialog", SETTINGS_TEMPLATE, None),
+    ("setup_screen", "QDialog", SETUP_TEMPLATE, "Dark"),     # The setup dialog is always dark
+]
+
+_RULE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_current_theme = None
+
+
+def theme_key(theme_name):
+    return "Dark" if (theme_name or "Dark").lower().startswith("dark") else "Light"
+
+
+def palette(theme_name):
+    values = dict(PALETTES[theme_key(theme_name)])
+    accent = values["accent"].replace("#", "%23")
+    values["arrow_icon"] = ("data:image/svg+xml;utf8,<svg xmlns='http://www.w3.org/2000/svg' width='12' height='12' "
+                            f"viewBox='0 0 24 24' fill='none' stroke='{accent}' stroke-width='2' "
+                            "stroke-linecap='round' stroke-linejoin='round'><polyline points='6 9 12 15 18 9'>"
+                            "</polyline></svg>")
+    return values
+
+
+def scope_stylesheet(css, scope, root_type):
+    """
+    Prefixes every selector with #scope. A selector for the screen's own type
+    (QDialog, QWidget) also gets a variant that matches the screen itself.
+    """
+    rules = []
+    for selectors, body in _RULE.findall(_COMMENT.sub("", css)):
+        scoped = []
+        for selector in selectors.split(","):
+            selector = selector.strip()
+            scoped.append(f"#{scope} {selector}")
+            if selector == root_type or selector.startswith(root_type + ":"):
+                scoped.append(f"{root_type}#{scope}{selector[len(root_type):]}")
+        rules.append(f"{', '.join(scoped)} {{ {' '.join(body.split())} }}")
+    return "\n".join(rules)
+
+
+@lru_cache(maxsize=None)
+def compiled_stylesheet(theme_name):
+    """The application stylesheet for a theme, built once."""
+    sections = []
+    for scope, root_type, template, fixed_theme in SCREENS:
+        css = template.format(**palette(fixed_theme or theme_name))
+        sections.append(scope_stylesheet(css, scope, root_type))
+    return "\n".join(sections)
+
+
+def apply_theme(theme_name):
+    """Makes `theme_name` the application theme. Returns False if it already was."""
+    global _current_theme
+    key = theme_key(theme_name)
+    if key == _current_theme:
+        return False
+    QApplication.instance().setStyleSheet(compiled_stylesheet(key))
+    _current_theme = key
+    return True
+
+
+def current_theme():
+    return _current_theme
+
+
+def set_state(widget, name, value):
+    """Sets a dynamic property the stylesheet selects on and re-polishes only that widget."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
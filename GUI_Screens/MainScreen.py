@@ -8,10 +8,14 @@ Date: December 2025
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
-    QPushButton, QMessageBox, QFrame, QGraphicsDropShadowEffect
+    QPushButton, QMessageBox, QFrame
 )
-from PySide6.QtGui import QFont, QColor, QCursor
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect, QPoint, QSize
+from PySide6.QtGui import QFont, QCursor
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect, QPoint, QSize, QTimer
+
+from .Functionality.LazyScreens import load_screen, preload, PRELOAD_DELAY_MS
+from .Functionality import Themes
+from .Functionality.Effects import CardShadow, animations_enabled, LOW_OVERHEAD_KEY
 
 
 
@@ -20,13 +24,8 @@ class ActionCard(QFrame):
         super().__init__(parent)
         self.setCursor(QCursor(Qt.PointingHandCursor))
         self.callback = callback
-        self.setObjectName("ActionCard")
-        
-        # Default Theme Colors (Dark) - Updated via set_theme_colors
-        self.bg_normal = "#1e293b"
-        self.bg_hover = "#1e293b" # Usually same or slightly lighter
-        self.border_normal = "#334155"
-        self.border_hover = "#38bdf8"
+        self.setObjectName("ActionCard")     # Styled by the app stylesheet, see Functionality/Themes.py
+        self.setProperty("hover", False)
         
         # Layout
         self.layout = QVBoxLayout(self)
@@ -36,60 +35,39 @@ class ActionCard(QFrame):
         # Emoji/Icon
         self.icon_label = QLabel(emoji)
         self.icon_label.setFont(QFont("Segoe UI Emoji", 32))
-        self.icon_label.setStyleSheet("background: transparent; border: none;")
+        self.icon_label.setObjectName("card_icon")
         self.layout.addWidget(self.icon_label)
         
         # Title
         self.title_label = QLabel(title)
         self.title_label.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        self.title_label.setStyleSheet("background: transparent; border: none; color: #f1f5f9;")
+        self.title_label.setObjectName("card_title")
         self.layout.addWidget(self.title_label)
         
         # Description
         self.desc_label = QLabel(description)
         self.desc_label.setFont(QFont("Segoe UI", 11))
         self.desc_label.setWordWrap(True)
-        self.desc_label.setStyleSheet("background: transparent; border: none; color: #94a3b8;")
+        self.desc_label.setObjectName("card_desc")
         self.layout.addWidget(self.desc_label)
         
         self.layout.addStretch()
 
-        # Shadow Effect
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(20)
-        self.shadow.setXOffset(0)
-        self.shadow.setYOffset(4)
-        self.shadow.setColor(QColor(0, 0, 0, 60))
-        self.setGraphicsEffect(self.shadow)
+        # Shadow, a cached nine-patch painted under the card
+        self.shadow = CardShadow(self, radius=16, blur=20, offset=(0, 4), alpha=60)
 
         # Animations
+        self.original_pos = None
         self.anim_hover = QPropertyAnimation(self, b"pos")
         self.anim_hover.setDuration(150)
         self.anim_hover.setEasingCurve(QEasingCurve.OutQuad)
 
-    def set_theme_colors(self, bg, border, text_p, text_s, border_h, shadow_alpha=60):
-        self.bg_normal = bg
-        self.border_normal = border
-        self.border_hover = border_h
-        
-        # Apply base style immediately
-        self.update_style(hover=False)
-        self.title_label.setStyleSheet(f"background: transparent; border: none; color: {text_p};")
-        self.desc_label.setStyleSheet(f"background: transparent; border: none; color: {text_s};")
-        
-        # Update Shadow
-        self.shadow.setColor(QColor(0, 0, 0, shadow_alpha))
+    def set_shadow_alpha(self, shadow_alpha=60):
+        self.shadow.set_alpha(shadow_alpha)
 
     def update_style(self, hover=False):
-        border = self.border_hover if hover else self.border_normal
-        # We keep background same for now, or could change it
-        self.setStyleSheet(f"""
-            #ActionCard {{
-                background-color: {self.bg_normal};
-                border: 1px solid {border};
-                border-radius: 16px;
-            }}
-        """)
+        # Flips the [hover="true"] rule instead of re-parsing a new stylesheet
+        Themes.set_state(self, "hover", hover)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -97,54 +75,62 @@ class ActionCard(QFrame):
     
     def enterEvent(self, event):
         # Lift effect
-        self.original_pos = self.pos()
-        self.anim_hover.setStartValue(self.pos())
-        self.anim_hover.setEndValue(self.pos() + QPoint(0, -4))
-        self.anim_hover.start()
+        if animations_enabled():
+            self.original_pos = self.pos()
+            self.anim_hover.setStartValue(self.pos())
+            self.anim_hover.setEndValue(self.pos() + QPoint(0, -4))
+            self.anim_hover.start()
         
         # Highlight border
         self.update_style(hover=True)
 
     def leaveEvent(self, event):
         # Return to position
-        self.anim_hover.setStartValue(self.pos())
-        self.anim_hover.setEndValue(self.original_pos)
-        self.anim_hover.start()
+        if self.original_pos is not None:
+            self.anim_hover.setStartValue(self.pos())
+            self.anim_hover.setEndValue(self.original_pos)
+            self.anim_hover.start()
+            self.original_pos = None
         
         # Remove highlight
         self.update_style(hover=False)
 
-import configparser
-import os
-import sys
-
-def get_config_path():
-    if sys.platform == "win32":
-        return os.path.join(os.getenv("ProgramData"), "Hackintoshify", "config.ini")
-    elif sys.platform == "darwin":
-        return "/Library/Application Support/Hackintoshify/config.ini"
-    else: # linux
-        return os.path.join(os.path.expanduser("~"), ".config", "hackintoshify", "config.ini")
+from Logic.Settings import get_settings
+from .Functionality.SettingsSignals import get_notifier
 
 class MainScreen(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Hackintoshify")
+        self.setObjectName("main_screen")
         self.setGeometry(100, 100, 1100, 750)
         
         # Load Config
-        self.config = configparser.ConfigParser()
-        self.config_path = get_config_path()
-        self.current_theme = 'Dark' # Default
-        try:
-            self.config.read(self.config_path)
-            if 'Settings' in self.config:
-                self.current_theme = self.config['Settings'].get('theme', 'Dark')
-        except Exception:
-            pass
+        self.current_theme = get_settings().get("Settings", "theme", "Dark")
+        self.download_window = None     # Built on first use, then reused
+        self.preload_started = False
         
         self._build_ui()
         self.apply_theme(self.current_theme)
+        # Saved from the settings screen or edited on disk
+        get_notifier().theme_changed.connect(self.on_theme_changed)
+        get_notifier().changed.connect(self.on_setting_changed)
+
+    def on_theme_changed(self, theme_name):
+        self.apply_theme(theme_name)
+        if self.download_window is not None:
+            self.download_window.apply_theme(theme_name)
+
+    def on_setting_changed(self, section, key):
+        if (section, key) == ("Settings", LOW_OVERHEAD_KEY):
+            self.update()       # Card shadows check the setting when they paint
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Other screens load in the background once this one is on screen
+        if not self.preload_started:
+            self.preload_started = True
+            QTimer.singleShot(PRELOAD_DELAY_MS, preload)
 
     def _build_ui(self):
         self.main_layout = QVBoxLayout(self)
@@ -224,75 +210,24 @@ class MainScreen(QWidget):
 
     def apply_theme(self, theme_name='Dark'):
         self.current_theme = theme_name
-        is_dark = theme_name.lower().startswith('dark')
-        
-        # Theme Palette
-        bg_color = "#0f172a" if is_dark else "#f8fafc"      # Slate 900 / Slate 50
-        card_bg = "#1e293b" if is_dark else "#ffffff"       # Slate 800 / White
-        border_color = "#334155" if is_dark else "#cbd5e1"  # Slate 700 / Slate 300
-        text_primary = "#f1f5f9" if is_dark else "#0f172a"  # Slate 100 / Slate 900
-        text_secondary = "#94a3b8" if is_dark else "#64748b"# Slate 400 / Slate 500
-        accent = "#38bdf8" if is_dark else "#0284c7"        # Sky 400 / Sky 600
-        accent_bg = "rgba(56, 189, 248, 0.1)" if is_dark else "rgba(2, 132, 199, 0.1)"
+        Themes.apply_theme(theme_name)
 
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {bg_color};
-                font-family: 'Segoe UI', sans-serif;
-                color: {text_primary};
-            }}
-            
-            QFrame#top_bar {{
-                background-color: {bg_color};
-                border: none;
-            }}
-            
-            QFrame#nav_sep {{
-                background-color: {border_color};
-            }}
-            
-            QLabel#app_title {{
-                color: {text_primary};
-            }}
-            
-            QPushButton#settings_btn {{
-                background-color: {accent_bg};
-                color: {accent};
-                border: 1px solid {accent};
-                border-radius: 6px;
-                font-weight: 600;
-            }}
-            QPushButton#settings_btn:hover {{
-                background-color: {accent};
-                color: {bg_color if is_dark else '#ffffff'};
-            }}
-            
-            QLabel#hero_title {{ color: {text_primary}; }}
-            QLabel#hero_sub {{ color: {text_secondary}; }}
-        """)
-        
-        # Update custom ActionCards
-        children = self.findChildren(QFrame, "ActionCard")
-        for child in children:
-            if hasattr(child, 'set_theme_colors'):
-                child.set_theme_colors(
-                    bg=card_bg,
-                    border=border_color,
-                    text_p=text_primary,
-                    text_s=text_secondary,
-                    border_h=accent,
-                    shadow_alpha=60 if is_dark else 30
-                )
+        # Shadows are CardShadow widgets painted from a cached pixmap, the stylesheet cannot reach them
+        shadow_alpha = Themes.palette(theme_name)["card_shadow_alpha"]
+        for card in self.findChildren(ActionCard):
+            card.set_shadow_alpha(shadow_alpha)
 
     # Actions
     def create_installer(self):
         try:
-            from .DownloadImage import DownloadImageScreen
-            self.download_window = DownloadImageScreen(parent=self)
+            if self.download_window is None:
+                DownloadImageScreen = load_screen("download")
+                self.download_window = DownloadImageScreen(parent=self)
+                self.download_window.setWindowModality(Qt.ApplicationModal)
             # Pass current theme
             self.download_window.apply_theme(self.current_theme)
-            self.download_window.setWindowModality(Qt.ApplicationModal)
             self.download_window.show()
+            self.download_window.raise_()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to open downloader: {e}")
     
@@ -307,7 +242,8 @@ class MainScreen(QWidget):
 
     def open_settings(self):
         try:
-            from .SettingsScreen import SettingsScreen
+            # Rebuilt every time, it reads the config files in its constructor
+            SettingsScreen = load_screen("settings")
             dlg = SettingsScreen(parent=self)
             dlg.setWindowModality(Qt.ApplicationModal)
             dlg.show()
@@ -1,30 +1,13 @@
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QComboBox, QPushButton, QHBoxLayout, QMessageBox, QFrame,
-    QFileDialog, QLineEdit, QScrollArea, QWidget, QGraphicsDropShadowEffect
+    QFileDialog, QLineEdit, QScrollArea, QWidget
 )
 from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QPoint, QSize, Signal, QRect, Property
 from PySide6.QtGui import QFont, QColor, QPainter, QBrush, QPen
-import configparser
-import os
-import sys
-import json
 
-def get_config_path():
-    if sys.platform == "win32":
-        return os.path.join(os.getenv("ProgramData"), "Hackintoshify", "config.ini")
-    elif sys.platform == "darwin":
-        return "/Library/Application Support/Hackintoshify/config.ini"
-    else: # linux
-        return os.path.join(os.path.expanduser("~"), ".config", "hackintoshify", "config.ini")
-
-def get_setup_details_path():
-    if sys.platform == "win32":
-        config_dir = os.path.join(os.getenv("ProgramData"), "Hackintoshify")
-    elif sys.platform == "darwin":
-        config_dir = "/Library/Application Support/Hackintoshify"
-    else:  # Linux
-        config_dir = os.path.join(os.path.expanduser("~"), ".config", "hackintoshify")
-    return os.path.join(config_dir, "setup_details.json")
+from Logic.Settings import get_settings
+from .Functionality import Themes
+from .Functionality.Effects import CardShadow, animations_enabled, LOW_OVERHEAD_KEY
 
 class ToggleSwitch(QWidget):
     def __init__(self, parent=None, checked=False):
@@ -60,7 +43,10 @@ class ToggleSwitch(QWidget):
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton:
             self._checked = not self._checked
-            self.start_animation()
+            if animations_enabled():
+                self.start_animation()
+            else:
+                self._circle_pos = 27.0 if self._checked else 3.0
             self.update()
             
     def start_animation(self):
@@ -103,11 +89,7 @@ class ToggleSwitch(QWidget):
 class ModernFrame(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.graphics_effect = QGraphicsDropShadowEffect(self)
-        self.graphics_effect.setBlurRadius(15)
-        self.graphics_effect.setOffset(0, 2)
-        self.graphics_effect.setColor(QColor(0,0,0,30))
-        self.setGraphicsEffect(self.graphics_effect)
+        self.shadow = CardShadow(self, radius=12, blur=15, offset=(0, 2), alpha=30)
 
 class SmoothScrollArea(QScrollArea):
     def __init__(self, parent=None):
@@ -118,6 +100,9 @@ class SmoothScrollArea(QScrollArea):
         self.animation.setDuration(400) # ms
 
     def wheelEvent(self, event):
+        if not animations_enabled():
+            super().wheelEvent(event)
+            return
         delta = event.angleDelta().y()
         # Default scroll step is often 120. Adjust multiplier for speed.
         scroll_step = -delta 
@@ -137,43 +122,24 @@ class SettingsScreen(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Settings")
+        self.setObjectName("settings_screen")
         self.resize(700, 750)
         
-        # Data
-        self.config_path = get_config_path()
-        self.setup_path = get_setup_details_path()
-        self.config = configparser.ConfigParser()
-        self.setup_details = {}
-        self.current_theme = 'Dark'
+        # Data, served from memory by the settings store
+        self.settings = get_settings()
+        self.setup_details = self.settings.get_setup()
+        self.current_theme = self.settings.get('Settings', 'theme', 'Dark')
         
-        self.load_data()
-        
-         # Determine theme from config
-        if 'Settings' in self.config:
-            self.current_theme = self.config['Settings'].get('theme', 'Dark')
-            
         self._build_ui()
         self.apply_theme(self.current_theme)
 
         # Entrance Animation
-        self.anim_entry = QPropertyAnimation(self, b"windowOpacity")
-        self.anim_entry.setDuration(300)
-        self.anim_entry.setStartValue(0)
-        self.anim_entry.setEndValue(1)
-        self.anim_entry.start()
-
-    def load_data(self):
-        try:
-            self.config.read(self.config_path)
-        except Exception:
-            pass 
-
-        try:
-            if os.path.exists(self.setup_path):
-                with open(self.setup_path, 'r') as f:
-                    self.setup_details = json.load(f)
-        except Exception:
-            self.setup_details = {}
+        if animations_enabled():
+            self.anim_entry = QPropertyAnimation(self, b"windowOpacity")
+            self.anim_entry.setDuration(300)
+            self.anim_entry.setStartValue(0)
+            self.anim_entry.setEndValue(1)
+            self.anim_entry.start()
 
     def _build_ui(self):
         self.main_layout = QVBoxLayout(self)
@@ -242,8 +208,7 @@ class SettingsScreen(QDialog):
         self.theme_combo.setFixedWidth(140)
         self.theme_combo.setCursor(Qt.PointingHandCursor)
         self.theme_combo.currentTextChanged.connect(self.preview_theme)
-        if 'Settings' in self.config:
-            self.theme_combo.setCurrentText(self.config['Settings'].get('theme', 'Dark'))
+        self.theme_combo.setCurrentText(self.current_theme)
             
         theme_row.addLayout(theme_lbl_box)
         theme_row.addStretch()
@@ -295,11 +260,20 @@ class SettingsScreen(QDialog):
         # Updates Toggle
         self.updates_toggle = self._add_toggle_row(sys_layout, "Automatic Updates", 
                                                    "Check for Hackintoshify updates on startup")
+
+        line3 = QFrame()
+        line3.setObjectName("divider")
+        line3.setFixedHeight(1)
+        sys_layout.addWidget(line3)
+
+        # Low-Overhead Toggle
+        self.low_overhead_toggle = self._add_toggle_row(sys_layout, "Low-Overhead Rendering",
+                                                        "Turn off animations and shadows (smoother on slower PCs)")
         
         # Set states
-        if 'Settings' in self.config:
-            self.verbose_toggle.setChecked(self.config['Settings'].getboolean('verbose_logging', False))
-            self.updates_toggle.setChecked(self.config['Settings'].getboolean('check_updates', True))
+        self.verbose_toggle.setChecked(self.settings.get('Settings', 'verbose_logging', False))
+        self.updates_toggle.setChecked(self.settings.get('Settings', 'check_updates', True))
+        self.low_overhead_toggle.setChecked(self.settings.get('Settings', LOW_OVERHEAD_KEY, False))
 
         self.content_layout.addWidget(self.sys_frame)
         self.content_layout.addStretch()
@@ -391,182 +365,44 @@ class SettingsScreen(QDialog):
             line_edit.setText(folder)
 
     def preview_theme(self, text):
+        # The preview restyles the whole app, reject() puts the saved theme back
         self.apply_theme(text)
 
+    def reject(self):
+        self.apply_theme(self.current_theme)
+        super().reject()
+
     def save_settings(self):
-        if not self.config.has_section('Settings'): self.config.add_section('Settings')
         theme = self.theme_combo.currentText()
         verbose = self.verbose_toggle.isChecked()
         updates = self.updates_toggle.isChecked()
+        low_overhead = self.low_overhead_toggle.isChecked()
         
-        self.config.set('Settings', 'theme', theme)
-        self.config.set('Settings', 'verbose_logging', str(verbose))
-        self.config.set('Settings', 'check_updates', str(updates))
-        
+        # One write per file; open screens follow the theme through the change signal
         try:
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            with open(self.config_path, 'w') as configfile:
-                self.config.write(configfile)
-            parent = self.parent()
-            if parent and hasattr(parent, 'apply_theme'):
-                parent.apply_theme(theme)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not save config.ini:\n{e}")
-            return
-
-        new_details = {
-            "download_path": self.download_path_input.text(),
-            "efi_path": self.efi_path_input.text(),
-            "setup_complete": True
-        }
-        self.setup_details.update(new_details)
-        
-        try:
-            os.makedirs(os.path.dirname(self.setup_path), exist_ok=True)
-            with open(self.setup_path, 'w') as f:
-                json.dump(self.setup_details, f, indent=4)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not save setup_details.json:\n{e}")
+            with self.settings.batch():
+                self.settings.set('Settings', 'theme', theme)
+                self.settings.set('Settings', 'verbose_logging', verbose)
+                self.settings.set('Settings', 'check_updates', updates)
+                self.settings.set('Settings', LOW_OVERHEAD_KEY, low_overhead)
+                self.settings.set_setup("download_path", self.download_path_input.text())
+                self.settings.set_setup("efi_path", self.efi_path_input.text())
+                self.settings.set_setup("setup_complete", True)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Could not save settings:\n{e}")
             return
 
         self.accept()
 
     def apply_theme(self, theme_name):
-        is_dark = theme_name.lower().startswith('dark')
-        
-        # Palette
-        bg = '#0f172a' if is_dark else '#f8fafc'         # Slate 900 / Slate 50
-        header_bg = bg
-        card_bg = '#1e293b' if is_dark else '#ffffff'    # Slate 800 / White
-        text_main = '#f1f5f9' if is_dark else '#0f172a'  # Slate 100 / Slate 900
-        text_sub = '#94a3b8' if is_dark else '#64748b'   # Slate 400 / Slate 500
-        accent = '#38bdf8' if is_dark else '#0284c7'     # Sky 400 / Sky 600
-        border = '#334155' if is_dark else '#e2e8f0'     # Slate 700 / Slate 200
-        input_bg = '#020617' if is_dark else '#f1f5f9'   # Slate 950 / Slate 100
-        
-        # Adjusted Input BG for cleaner look
-        # Slightly darker in light mode for better contrast
-        input_bg_css = 'rgba(0,0,0,0.2)' if is_dark else 'rgba(0,0,0,0.08)'
+        Themes.apply_theme(theme_name)
+        colors = Themes.palette(theme_name)
 
-        # Update Toggles
-        toggle_inactive = '#334155' if is_dark else '#cbd5e1'
-        for toggle in [self.verbose_toggle, self.updates_toggle]:
-            toggle.active_color = QColor(accent)
-            toggle.inactive_color = QColor(toggle_inactive)
+        # Toggles and shadows are painted, the stylesheet does not reach them
+        for toggle in [self.verbose_toggle, self.updates_toggle, self.low_overhead_toggle]:
+            toggle.active_color = QColor(colors["accent"])
+            toggle.inactive_color = QColor(colors["toggle_inactive"])
             toggle.update()
 
-        # Update Graphics Effects Shadows
-        shadow_color = QColor(0,0,0, 60 if is_dark else 20)
-        self.appearance_frame.graphics_effect.setColor(shadow_color)
-        self.paths_frame.graphics_effect.setColor(shadow_color)
-        self.sys_frame.graphics_effect.setColor(shadow_color)
-        
-        # Combobox arrow
-        accent_enc = accent.replace('#', '%23')
-        arrow_icon = f"data:image/svg+xml;utf8,<svg xmlns='http://www.w3.org/2000/svg' width='12' height='12' viewBox='0 0 24 24' fill='none' stroke='{accent_enc}' stroke-width='2' stroke-linecap='round' stroke-linejoin='round'><polyline points='6 9 12 15 18 9'></polyline></svg>"
-
-        self.setStyleSheet(f"""
-            QDialog {{ background-color: {bg}; color: {text_main}; }}
-            
-            QFrame#header {{ 
-                background-color: {header_bg}; 
-            }}
-            QFrame#footer {{ 
-                background-color: {card_bg}; 
-                border-top: 1px solid {border}; 
-            }}
-            
-            /* Scroll Area & Bar */
-            QScrollArea {{ background-color: {bg}; border: none; }}
-            QScrollBar:vertical {{
-                border: none;
-                background: {bg};
-                width: 8px;
-                margin: 0px 0px 0px 0px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {text_sub};
-                min-height: 20px;
-                border-radius: 4px;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                border: none;
-                background: none;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: none;
-            }}
-
-            QWidget#content_container {{ background-color: {bg}; border: none; }}
-            QWidget#content_container > QFrame {{ background-color: {card_bg}; }}
-            
-            /* Typography */
-            QLabel {{ color: {text_main}; font-family: 'Segoe UI'; background: transparent; }}
-            QLabel#window_title {{ font-weight: 800; }}
-            QLabel#window_subtitle {{ color: {text_sub}; }}
-            
-            QLabel#section_header {{ 
-                color: {text_sub}; 
-                font-weight: 700; 
-                text-transform: uppercase; 
-                letter-spacing: 1px; 
-                font-size: 13px;
-                margin-top: 10px;
-                margin-bottom: 5px;
-            }}
-            
-            QLabel#sub_label {{ color: {text_sub}; font-size: 12px; }}
-            
-            /* Cards */
-            QFrame#card {{
-                background-color: {card_bg};
-                border: 1px solid {border};
-                border-radius: 12px;
-            }}
-            
-            QFrame#divider {{
-                background-color: {border};
-                border: none;
-            }}
-            
-            /* Inputs */
-            QLineEdit {{
-                background-color: {input_bg_css};
-                border: 1px solid {border};
-                border-radius: 6px;
-                padding: 0 12px;
-                color: {text_main};
-            }}
-            QLineEdit:focus {{ border: 1px solid {accent}; }}
-            
-            /* Buttons */
-            QPushButton#primary_btn {{
-                background-color: {accent}; color: #ffffff; border: none; border-radius: 6px;
-                padding: 8px 16px; font-weight: 600; font-size: 13px; min-width: 100px;
-            }}
-            QPushButton#primary_btn:hover {{ opacity: 0.9; }}
-            
-            QPushButton#secondary_btn {{
-                background-color: transparent; color: {text_main}; 
-                border: 1px solid {border}; border-radius: 6px; padding: 8px 16px; 
-                font-weight: 600; font-size: 13px; min-width: 80px;
-            }}
-            QPushButton#secondary_btn:hover {{ background-color: {input_bg}; }}
-            
-            QPushButton#browse_btn {{
-                background-color: {input_bg}; color: {accent}; border: 1px solid {border};
-                border-radius: 6px; font-weight: 600;
-            }}
-            QPushButton#browse_btn:hover {{ border-color: {accent}; }}
-            
-            /* Combo */
-            QComboBox {{
-                background-color: {input_bg};
-                border: 1px solid {border};
-                border-radius: 6px;
-                padding: 5px 10px;
-                color: {text_main};
-            }}
-            QComboBox::drop-down {{ border: none; width: 20px; }}
-            QComboBox::down-arrow {{ image: url("{arrow_icon}"); width: 12px; height: 12px; }}
-        """)
\ No newline at end of file
+        for frame in [self.appearance_frame, self.paths_frame, self.sys_frame]:
+            frame.shadow.set_alpha(colors["frame_shadow_alpha"])
@@ -11,59 +11,42 @@ from PySide6.QtWidgets import (
     QPushButton, QFrame, QMessageBox
 )
 from PySide6.QtGui import QFont, QColor
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, Signal
 import os
 import sys
-import json
+import threading
+from Logic.Settings import get_settings
+from Detection.DetectOS import detect_hardware, summary, format_cpu, format_gpu, format_memory
+from .Functionality import Themes
 from .buttonlogics.SelectFolderPath_DOWNLOADMAC import SelectFolderPath_DOWNLOADMAC
 from .buttonlogics.SelectFolderPath_EFI import SelectFolderPath_EFI
 
-def get_setup_details_path():
-    """Returns the platform-specific path for setup_details.json."""
-    if sys.platform == "win32":
-        config_dir = os.path.join(os.getenv("ProgramData"), "Hackintoshify")
-    elif sys.platform == "darwin":
-        config_dir = "/Library/Application Support/Hackintoshify"
-    else:  # Linux
-        config_dir = os.path.join(os.path.expanduser("~"), ".config", "hackintoshify")
-    return os.path.join(config_dir, "setup_details.json")
-
 def get_hardware_info():
-    """Gets basic hardware information, attempting to find the dedicated GPU."""
-    if sys.platform != "win32":
-        return {"CPU": "N/A", "GPU": "N/A", "RAM": "N/A (non-Windows)"}
-    
-    try:
-        import wmi
-        c = wmi.WMI()
-        cpu = c.Win32_Processor()[0].Name
-        
-        gpus = c.Win32_VideoController()
-        gpu_name = "N/A"
-        
-        if gpus:
-            # Filter out virtual/mirror drivers
-            bad_keywords = ["mirror", "virtual", "remote", "rdp", "dameware"]
-            real_gpus = [gpu for gpu in gpus if not any(keyword in gpu.Name.lower() for keyword in bad_keywords)]
+    """CPU, GPU and RAM as display strings. Blocks, the dialog uses HardwareWorker instead."""
+    return summary(detect_hardware())
+
+
+class HardwareWorker(QObject):
+    """
+    Detects on a daemon thread, not a QThread: a slow WMI query may still
+    be running when the app exits, and Qt aborts on a running QThread.
+    The signal is emitted from that thread and queued to the dialog.
+    """
+    section_ready = Signal(str, object)     # section of Detection.DetectOS.SECTIONS, its value
+
+    def __init__(self):
+        # No parent, the thread keeps the worker alive after the dialog is gone
+        super().__init__()
+        self.thread = threading.Thread(target=self.run, name="HardwareWorker", daemon=True)
 
-            if real_gpus:
-                # Sort by AdapterRAM if available, to find the most powerful GPU
-                try:
-                    sorted_gpus = sorted(real_gpus, key=lambda x: int(x.AdapterRAM), reverse=True)
-                    gpu_name = sorted_gpus[0].Name
-                except (AttributeError, TypeError):
-                    # Fallback if AdapterRAM is not a reliable property
-                    gpu_name = real_gpus[0].Name
-            else:
-                # If all GPUs were filtered out, fallback to the first one found
-                gpu_name = gpus[0].Name
+    def start(self):
+        self.thread.start()
 
-        ram = f"{round(int(c.Win32_ComputerSystem()[0].TotalPhysicalMemory) / (1024**3))} GB"
-        return {"CPU": cpu, "GPU": gpu_name, "RAM": ram}
-    except ImportError:
-        return {"CPU": "N/A", "GPU": "N/A", "RAM": "WMI module not found"}
-    except Exception as e:
-        return {"CPU": "N/A", "GPU": "N/A", "RAM": f"Error: {e}"}
+    def is_running(self):
+        return self.thread.is_alive()
+
+    def run(self):
+        detect_hardware(progress_callback=self.section_ready.emit, refresh=True)
 
 
 class Setup(QDialog):
@@ -71,6 +54,7 @@ class Setup(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Hackintoshify | Initial Setup")
         self.setFixedWidth(700)
+        self.setObjectName("setup_screen")
         self.current_theme = 'Dark'
         
         self.download_path_selector = SelectFolderPath_DOWNLOADMAC(self)
@@ -79,6 +63,10 @@ class Setup(QDialog):
         self._build_ui()
         self.apply_theme(self.current_theme)
 
+        self.hw_worker = HardwareWorker()
+        self.hw_worker.section_ready.connect(self.on_hardware_section)
+        self.hw_worker.start()
+
     def _build_ui(self):
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
@@ -124,12 +112,14 @@ class Setup(QDialog):
         hw_grid.setContentsMargins(0, 0, 0, 0)
         hw_grid.setSpacing(10)
         
-        info = get_hardware_info()
-        self._add_info_row(hw_grid, "Processor", info.get("CPU", "Unknown"))
+        # Filled in by HardwareWorker as each section is detected
+        self.hw_values = {
+            "cpu": self._add_info_row(hw_grid, "Processor", "Detecting..."),
+        }
         self._add_separator(hw_grid)
-        self._add_info_row(hw_grid, "Graphics", info.get("GPU", "Unknown"))
+        self.hw_values["pci"] = self._add_info_row(hw_grid, "Graphics", "Detecting...")
         self._add_separator(hw_grid)
-        self._add_info_row(hw_grid, "Memory", info.get("RAM", "Unknown"))
+        self.hw_values["memory"] = self._add_info_row(hw_grid, "Memory", "Detecting...")
         
         hw_layout.addWidget(hw_info_container)
         content_layout.addWidget(self.hw_card)
@@ -195,6 +185,21 @@ class Setup(QDialog):
         row.addStretch()
         row.addWidget(value)
         layout.addLayout(row)
+        return value
+
+    def on_hardware_section(self, section, value):
+        formatters = {"cpu": format_cpu, "pci": format_gpu, "memory": format_memory}
+        if section in self.hw_values and value is not None:
+            self.hw_values[section].setText(formatters[section](value))
+
+    def done(self, result):
+        # Do not block on a slow WMI query, let the thread finish on its own
+        if self.hw_worker.is_running():
+            try:
+                self.hw_worker.section_ready.disconnect(self.on_hardware_section)
+            except (RuntimeError, TypeError):
+                pass    # Already disconnected by an earlier done()
+        super().done(result)
 
     def _add_separator(self, layout):
         sep = QFrame()
@@ -238,13 +243,13 @@ class Setup(QDialog):
         path = self.download_path_selector.select_folder()
         if path:
             self.download_path_label.setText(path)
-            self.download_path_label.setStyleSheet("color: #e2e8f0;") # Highlight when selected
+            Themes.set_state(self.download_path_label, "selected", True) # Highlight when selected
 
     def select_efi_path(self):
         path = self.efi_path_selector.select_folder()
         if path:
             self.efi_path_label.setText(path)
-            self.efi_path_label.setStyleSheet("color: #e2e8f0;")
+            Themes.set_state(self.efi_path_label, "selected", True)
 
     def save_configuration(self):
         download_path = self.download_path_selector.get_selected_path()
@@ -262,86 +267,14 @@ class Setup(QDialog):
             "setup_complete": True
         }
         try:
-            os.makedirs(os.path.dirname(get_setup_details_path()), exist_ok=True)
-            with open(get_setup_details_path(), 'w') as f:
-                json.dump(setup_details, f, indent=4)
+            get_settings().update_setup(setup_details)
             self.accept()
         except Exception as e:
             QMessageBox.critical(self, "Configuration Error", f"Could not save settings:\n{str(e)}")
 
     def apply_theme(self, theme_name):
-        # Modern Dark Theme Palette
-        bg_color = "#0f172a"      # Slate 900
-        card_bg = "#1e293b"       # Slate 800
-        text_primary = "#f1f5f9"  # Slate 100
-        text_secondary = "#94a3b8"# Slate 400
-        accent_color = "#38bdf8"  # Sky 400
-        accent_hover = "#7dd3fc"  # Sky 300
-        border_color = "#334155"  # Slate 700
-        input_bg = "#020617"      # Slate 950
-        
-        self.setStyleSheet(f"""
-            QDialog {{ background-color: {bg_color}; }}
-            
-            QLabel {{ font-family: 'Segoe UI', sans-serif; color: {text_primary}; }}
-            QLabel#h1 {{ font-size: 24px; font-weight: 700; color: {text_primary}; }}
-            QLabel#h2 {{ font-size: 14px; font-weight: 700; text-transform: uppercase; letter-spacing: 0.5px; color: {text_secondary}; margin-bottom: 5px; }}
-            QLabel#subtitle {{ font-size: 14px; color: {text_secondary}; }}
-            
-            QFrame#card {{
-                background-color: {card_bg};
-                border: 1px solid {border_color};
-                border-radius: 12px;
-            }}
-            
-            QFrame#separator {{ background-color: {border_color}; }}
-            
-            QLabel#info_label {{ font-size: 13px; color: {text_secondary}; }}
-            QLabel#info_value {{ font-size: 13px; font-weight: 600; color: {text_primary}; }}
-            
-            QLabel#field_label {{ font-size: 13px; font-weight: 600; color: {text_primary}; }}
-            
-            QFrame#input_box {{
-                background-color: {input_bg};
-                border: 1px solid {border_color};
-                border-radius: 8px;
-            }}
-            QLabel#path_text {{ color: {text_secondary}; font-style: italic; font-size: 12px; }}
-            
-            QPushButton#browse_btn {{
-                background-color: {card_bg};
-                color: {accent_color};
-                border: 1px solid {border_color};
-                border-radius: 6px;
-                padding: 5px 12px;
-                font-size: 12px;
-                font-weight: 600;
-            }}
-            QPushButton#browse_btn:hover {{
-                border-color: {accent_color};
-                background-color: {input_bg};
-            }}
-            
-            QPushButton#primary_btn {{
-                background-color: {accent_color};
-                color: #0f172a;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 24px;
-                font-size: 14px;
-                font-weight: 700;
-            }}
-            QPushButton#primary_btn:hover {{ background-color: {accent_hover}; }}
-            
-            QPushButton#secondary_btn {{
-                background-color: transparent;
-                color: {text_secondary};
-                border: none;
-                font-size: 14px;
-                font-weight: 600;
-            }}
-            QPushButton#secondary_btn:hover {{ color: {text_primary}; }}
-        """)
+        # The setup section of the app stylesheet is always the dark palette
+        Themes.apply_theme(theme_name)
 
 if __name__ == '__main__':
     from PySide6.QtWidgets import QApplication
@@ -0,0 +1,231 @@
+# Logic/KextCatalog.py
+
+"""
+KextCatalog Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Every kext, UEFI driver and SSDT ConfigureKexts can add to an EFI, with
+its bundle identifier and a one-line description. Items named in
+Logic/KextRules.py but missing here are added from the rule, so the
+recommendation engine never points at something the list cannot show.
+
+Usage:
+    for entry in get_catalog():
+        print(entry["name"], entry["bundle_id"], entry["description"])
+"""
+
+from functools import lru_cache
+
+from Logic.KextRules import KEXT_RULES, KEXT, DRIVER, SSDT
+
+# (name, kind, category, bundle identifier, description)
+CATALOG = [
+    # --- Core ---
+    ("Lilu", KEXT, "Core", "as.vit9696.Lilu", "Arbitrary kext, library and program patcher, needed by most plugins"),
+    ("VirtualSMC", KEXT, "Core", "as.vit9696.VirtualSMC", "Advanced Apple SMC emulator"),
+    ("FakeSMC", KEXT, "Core", "org.netkas.driver.FakeSMC", "Legacy SMC emulator, replaced by VirtualSMC"),
+    ("RestrictEvents", KEXT, "Core", "as.vit9696.RestrictEvents", "Blocks unwanted processes and unlocks features like CPU renaming"),
+    ("CryptexFixup", KEXT, "Core", "com.dhinakg.CryptexFixup", "Installs the Rosetta cryptex on machines without AVX2"),
+    ("FeatureUnlock", KEXT, "Core", "as.acidanthera.FeatureUnlock", "Enables Sidecar, AirPlay to Mac and Universal Control on unsupported models"),
+    ("DebugEnhancer", KEXT, "Core", "as.acidanthera.DebugEnhancer", "Makes kernel debug logging more reliable"),
+    ("RTCMemoryFixup", KEXT, "Core", "as.lvs1974.RTCMemoryFixup", "Emulates CMOS areas that firmware corrupts or rejects"),
+    ("HibernationFixup", KEXT, "Core", "as.lvs1974.HibernationFixup", "Fixes hibernation with native NVRAM"),
+    ("CpuTscSync", KEXT, "Core", "as.lvs1974.CpuTscSync", "Synchronises the TSC across cores on HEDT and server boards"),
+    ("VoodooTSCSync", KEXT, "Core", "org.voodoo.driver.VoodooTSCSync", "Legacy TSC synchroniser for multi-core CPUs"),
+    ("AMFIPass", KEXT, "Core", "com.dhinakg.AMFIPass", "Boots with AMFI enabled while keeping root patches"),
+    ("AppleMCEReporterDisabler", KEXT, "Core", "com.AppleMCEReporterDisabler", "Keeps AppleMCEReporter from panicking on AMD and multi-socket systems"),
+    ("SystemProfilerMemoryFixup", KEXT, "Core", "as.acidanthera.SystemProfilerMemoryFixup", "Restores the Memory tab of System Information"),
+    ("Innie", KEXT, "Core", "com.cdf.Innie", "Shows PCIe drives as internal disks"),
+    ("NoTouchID", KEXT, "Core", "as.lvs1974.NoTouchID", "Stops hangs at the Touch ID prompt on MacBook SMBIOS"),
+
+    # --- VirtualSMC plugins ---
+    ("SMCProcessor", KEXT, "Sensors", "as.vit9696.SMCProcessor", "Intel CPU temperature monitoring"),
+    ("SMCSuperIO", KEXT, "Sensors", "as.vit9696.SMCSuperIO", "Fan speed monitoring through the Super I/O chip"),
+    ("SMCBatteryManager", KEXT, "Sensors", "as.vit9696.SMCBatteryManager", "Battery status and charge for laptops"),
+    ("SMCLightSensor", KEXT, "Sensors", "as.vit9696.SMCLightSensor", "Ambient light sensor for laptops"),
+    ("SMCDellSensors", KEXT, "Sensors", "as.vit9696.SMCDellSensors", "Fan monitoring and control on Dell machines"),
+    ("SMCAMDProcessor", KEXT, "Sensors", "wtf.spinach.SMCAMDProcessor", "Publishes AMD CPU sensors to VirtualSMC"),
+    ("AMDRyzenCPUPowerManagement", KEXT, "Sensors", "wtf.spinach.AMDRyzenCPUPowerManagement", "Power management and monitoring for AMD Ryzen CPUs"),
+    ("SMCRadeonGPU", KEXT, "Sensors", "com.aluveitie.SMCRadeonGPU", "Publishes AMD GPU temperatures to VirtualSMC"),
+    ("RadeonSensor", KEXT, "Sensors", "com.aluveitie.RadeonSensor", "Reads AMD GPU temperatures"),
+    ("ACPIBatteryManager", KEXT, "Sensors", "org.rehabman.driver.AppleSmartBatteryManager", "Legacy battery status kext"),
+    ("ECEnabler", KEXT, "Sensors", "me.1Revenger1.ECEnabler", "Reads EC fields wider than 8 bits without ACPI patches"),
+    ("YogaSMC", KEXT, "Sensors", "org.zhen.YogaSMC", "Lenovo ThinkPad and IdeaPad hotkeys, fans and sensors"),
+    ("AsusSMC", KEXT, "Sensors", "com.hieplpvip.AsusSMC", "ASUS laptop keyboard backlight, ALS and hotkeys"),
+    ("CPUFriend", KEXT, "Sensors", "org.acidanthera.driver.CPUFriend", "Injects custom CPU power management data"),
+    ("CPUFriendDataProvider", KEXT, "Sensors", "org.acidanthera.driver.CPUFriendDataProvider", "Power management data for CPUFriend, generated per CPU"),
+
+    # --- Graphics ---
+    ("WhateverGreen", KEXT, "Graphics", "as.vit9696.WhateverGreen", "Patches for Intel, AMD and NVIDIA graphics"),
+    ("NootedRed", KEXT, "Graphics", "com.ChefKissInc.NootedRed", "Acceleration for AMD Vega iGPUs in Ryzen APUs"),
+    ("NootRX", KEXT, "Graphics", "com.ChefKissInc.NootRX", "Acceleration for AMD RDNA 2 GPUs without native support"),
+    ("AMDGPUWakeHandler", KEXT, "Graphics", "com.bluesyndrome.AMDGPUWakeHandler", "Turns the discrete AMD GPU back off after sleep"),
+    ("AppleBacklightSmoother", KEXT, "Graphics", "science.FireWolf.AppleBacklightSmoother", "Smooth brightness transitions on Intel iGPUs"),
+    ("FakePCIID", KEXT, "Graphics", "org.rehabman.driver.FakePCIID", "Legacy device ID spoofing"),
+    ("FakePCIID_Intel_HDMI_Audio", KEXT, "Graphics", "org.rehabman.driver.FakePCIID.HDMI.Audio", "Legacy HDMI audio enabler for Intel iGPUs"),
+    ("NVDAEGPUSupport", KEXT, "Graphics", "com.hack.NVDAEGPUSupport", "NVIDIA eGPU support for High Sierra"),
+
+    # --- Audio ---
+    ("AppleALC", KEXT, "Audio", "as.vit9696.AppleALC", "Native HD audio for unsupported codecs"),
+    ("VoodooHDA", KEXT, "Audio", "org.voodoo.driver.VoodooHDA", "Open source audio driver for codecs AppleALC does not cover"),
+    ("CodecCommander", KEXT, "Audio", "org.tw.CodecCommander", "Fixes codec states after sleep"),
+    ("AppleHDAHDMI", KEXT, "Audio", "com.hack.AppleHDAHDMI", "HDMI audio injector for older systems"),
+
+    # --- Ethernet ---
+    ("IntelMausi", KEXT, "Ethernet", "as.acidanthera.mieze.IntelMausi", "Intel 82578, 82579, I217, I218 and I219 Ethernet"),
+    ("IntelSnowMausi", KEXT, "Ethernet", "as.acidanthera.mieze.IntelSnowMausi", "IntelMausi for macOS 10.6 to 10.10"),
+    ("AppleIGB", KEXT, "Ethernet", "com.donatengit.AppleIGB", "Intel I350 and I210 server Ethernet"),
+    ("AppleIGC", KEXT, "Ethernet", "com.sxx.AppleIGC", "Intel I225 and I226 2.5 GbE"),
+    ("SmallTreeIntel82576", KEXT, "Ethernet", "com.SmallTree.driver.SmallTreeIntel82576", "Intel I211 and 82576 Ethernet"),
+    ("RealtekRTL8111", KEXT, "Ethernet", "com.insanelymac.RealtekRTL8111", "Realtek RTL8111 and RTL8168 Gigabit Ethernet"),
+    ("LucyRTL8125Ethernet", KEXT, "Ethernet", "com.insanelymac.LucyRTL8125Ethernet", "Realtek RTL8125 2.5 GbE"),
+    ("RealtekRTL8100", KEXT, "Ethernet", "com.insanelymac.RealtekRTL8100", "Realtek RTL810x Fast Ethernet"),
+    ("AtherosE2200Ethernet", KEXT, "Ethernet", "com.insanelymac.AtherosE2200Ethernet", "Qualcomm Atheros and Killer E2x00 Ethernet"),
+    ("AtherosL1cEthernet", KEXT, "Ethernet", "com.shailua.AtherosL1cEthernet", "Atheros AR8131, AR8132 and AR8151 Ethernet"),
+    ("BCM5722D", KEXT, "Ethernet", "com.kexts.BCM5722D", "Broadcom BCM5722 NetXtreme Ethernet"),
+    ("HoRNDIS", KEXT, "Ethernet", "com.joshuawise.kexts.HoRNDIS", "USB tethering from Android phones"),
+    ("NullEthernet", KEXT, "Ethernet", "org.rehabman.driver.NullEthernet", "Fake en0 for machines without supported Ethernet"),
+    ("AQtion", KEXT, "Ethernet", "com.aquantia.AQtion", "Aquantia AQC107 10 GbE for older macOS"),
+    ("USBWiFi", KEXT, "Ethernet", "com.chris1111.USBWiFi", "Wireless USB adapters with a vendor utility"),
+
+    # --- Wi-Fi and Bluetooth ---
+    ("AirportItlwm", KEXT, "Wi-Fi", "com.zxystd.AirportItlwm", "Intel Wi-Fi with native Airport controls"),
+    ("itlwm", KEXT, "Wi-Fi", "com.zxystd.itlwm", "Intel Wi-Fi as Ethernet, used with the HeliPort app"),
+    ("AirportBrcmFixup", KEXT, "Wi-Fi", "as.lvs1974.AirportBrcmFixup", "Patches for non-native Broadcom Wi-Fi cards"),
+    ("AirPortOpenBSD", KEXT, "Wi-Fi", "com.openbsd.AirPortOpenBSD", "OpenBSD based Intel Wi-Fi port"),
+    ("BlueToolFixup", KEXT, "Bluetooth", "as.acidanthera.BlueToolFixup", "Bluetooth fixes for Monterey and newer"),
+    ("BrcmPatchRAM3", KEXT, "Bluetooth", "as.acidanthera.BrcmPatchRAM3", "Uploads firmware to Broadcom Bluetooth on Big Sur and newer"),
+    ("BrcmPatchRAM2", KEXT, "Bluetooth", "as.acidanthera.BrcmPatchRAM2", "Uploads firmware to Broadcom Bluetooth on 10.11 to 10.14"),
+    ("BrcmPatchRAM", KEXT, "Bluetooth", "as.acidanthera.BrcmPatchRAM", "Uploads firmware to Broadcom Bluetooth on 10.10 and older"),
+    ("BrcmFirmwareData", KEXT, "Bluetooth", "as.acidanthera.BrcmFirmwareStore", "Broadcom Bluetooth firmware, for OpenCore injection"),
+    ("BrcmFirmwareRepo", KEXT, "Bluetooth", "as.acidanthera.BrcmFirmwareRepo", "Broadcom Bluetooth firmware, for installing to /Library/Extensions"),
+    ("BrcmBluetoothInjector", KEXT, "Bluetooth", "as.acidanthera.BrcmBluetoothInjector", "Enables Broadcom Bluetooth without firmware upload"),
+    ("BrcmNonPatchRAM2", KEXT, "Bluetooth", "as.acidanthera.BrcmNonPatchRAM2", "Broadcom Bluetooth without firmware upload, 10.11 to 10.14"),
+    ("IntelBluetoothFirmware", KEXT, "Bluetooth", "com.zxystd.IntelBluetoothFirmware", "Uploads firmware to Intel Bluetooth"),
+    ("IntelBTPatcher", KEXT, "Bluetooth", "com.zxystd.IntelBTPatcher", "Fixes Intel Bluetooth on Big Sur and newer"),
+    ("IntelBluetoothInjector", KEXT, "Bluetooth", "com.zxystd.IntelBluetoothInjector", "Enables Intel Bluetooth on Catalina and older"),
+
+    # --- Input ---
+    ("VoodooPS2Controller", KEXT, "Input", "as.acidanthera.voodoo.driver.PS2Controller", "PS/2 keyboard, mouse and trackpad"),
+    ("VoodooPS2Keyboard", KEXT, "Input", "as.acidanthera.voodoo.driver.PS2Keyboard", "PS/2 keyboard, plugin of VoodooPS2Controller"),
+    ("VoodooPS2Mouse", KEXT, "Input", "as.acidanthera.voodoo.driver.PS2Mouse", "PS/2 mouse, plugin of VoodooPS2Controller"),
+    ("VoodooPS2Trackpad", KEXT, "Input", "as.acidanthera.voodoo.driver.PS2Trackpad", "PS/2 Synaptics and ELAN trackpads"),
+    ("VoodooInput", KEXT, "Input", "org.acidanthera.voodoo.VoodooInput", "Magic Trackpad 2 emulation for trackpad drivers"),
+    ("VoodooI2C", KEXT, "Input", "com.alexandred.VoodooI2C", "I2C controller for trackpads and touchscreens"),
+    ("VoodooI2CHID", KEXT, "Input", "com.alexandred.VoodooI2CHID", "HID over I2C trackpads and touchscreens"),
+    ("VoodooI2CSynaptics", KEXT, "Input", "com.alexandred.VoodooI2CSynaptics", "Synaptics I2C trackpads"),
+    ("VoodooI2CELAN", KEXT, "Input", "com.alexandred.VoodooI2CELAN", "ELAN I2C trackpads"),
+    ("VoodooI2CFTE", KEXT, "Input", "com.alexandred.VoodooI2CFTE", "FocalTech I2C trackpads"),
+    ("VoodooI2CAtmelMXT", KEXT, "Input", "com.alexandred.VoodooI2CAtmelMXT", "Atmel maXTouch I2C touchscreens"),
+    ("VoodooRMI", KEXT, "Input", "me.kishorprins.VoodooRMI", "Synaptics RMI4 trackpads over SMBus or I2C"),
+    ("VoodooSMBus", KEXT, "Input", "com.zhen.VoodooSMBus", "Intel SMBus controller for RMI4 trackpads"),
+    ("AlpsHID", KEXT, "Input", "com.blankmac.AlpsHID", "ALPS HID trackpads"),
+    ("VoodooGPIO", KEXT, "Input", "com.alexandred.VoodooGPIO", "GPIO pin interrupts for I2C devices"),
+    ("BrightnessKeys", KEXT, "Input", "as.acidanthera.BrightnessKeys", "Brightness function keys on laptops"),
+    ("ThinkpadAssistant", KEXT, "Input", "com.MSzturc.ThinkpadAssistant", "ThinkPad function keys and LEDs"),
+
+    # --- USB ---
+    ("USBToolBox", KEXT, "USB", "com.dhinakg.USBToolBox.kext", "USB port mapping without ACPI patches"),
+    ("UTBMap", KEXT, "USB", "com.dhinakg.USBToolBox.map", "USB port map generated by the USBToolBox tool"),
+    ("UTBDefault", KEXT, "USB", "com.dhinakg.USBToolBox.default", "All USB ports enabled, for mapping"),
+    ("USBInjectAll", KEXT, "USB", "com.rehabman.driver.USBInjectAll", "Legacy injector of every USB port"),
+    ("USBMap", KEXT, "USB", "com.corpnewt.USBMap", "Codeless USB port map made by USBMap"),
+    ("XHCI-unsupported", KEXT, "USB", "com.rehabman.injector.XHCI-unsupported", "Attaches AppleUSBXHCIPCI to unsupported USB 3 controllers"),
+    ("GenericUSBXHCI", KEXT, "USB", "net.osx86.kexts.GenericUSBXHCI", "Legacy third-party USB 3 controller driver"),
+    ("USBWakeFixup", KEXT, "USB", "com.osy86.USBWakeFixup", "Wakes the display on the first USB key press"),
+    ("ThunderboltReset", KEXT, "USB", "com.osy86.ThunderboltReset", "Resets Alpine Ridge Thunderbolt controllers"),
+
+    # --- Storage ---
+    ("NVMeFix", KEXT, "Storage", "org.acidanthera.NVMeFix", "Power management and compatibility for non-Apple NVMe drives"),
+    ("CtlnaAHCIPort", KEXT, "Storage", "com.ctlna.CtlnaAHCIPort", "Third-party SATA controllers on Big Sur and newer"),
+    ("SATA-unsupported", KEXT, "Storage", "com.rehabman.injector.SATA-unsupported", "Unsupported SATA controllers on older macOS"),
+    ("AHCIPortInjector", KEXT, "Storage", "com.hack.AHCIPortInjector", "Legacy AHCI port injector"),
+    ("RealtekCardReader", KEXT, "Storage", "science.FireWolf.RealtekCardReader", "Realtek PCIe and USB SD card readers"),
+    ("RealtekCardReaderFriend", KEXT, "Storage", "science.FireWolf.RealtekCardReaderFriend", "Shows Realtek card readers in System Information"),
+    ("Sinetek-rtsx", KEXT, "Storage", "com.sinetek.Sinetek-rtsx", "Realtek SD card readers"),
+    ("EmeraldSDHC", KEXT, "Storage", "com.acidanthera.EmeraldSDHC", "SD host controllers over the SDHCI interface"),
+
+    # --- UEFI drivers ---
+    ("OpenRuntime", DRIVER, "Drivers", "", "OpenCore runtime services, required"),
+    ("HfsPlus", DRIVER, "Drivers", "", "Apple HFS+ file system driver, needed for recovery"),
+    ("OpenHfsPlus", DRIVER, "Drivers", "", "Open source HFS+ driver, slower than HfsPlus"),
+    ("OpenCanopy", DRIVER, "Drivers", "", "Graphical boot picker"),
+    ("AudioDxe", DRIVER, "Drivers", "", "Boot chime and audio assist in the boot picker"),
+    ("OpenUsbKbDxe", DRIVER, "Drivers", "", "USB keyboard in the boot picker on legacy firmware"),
+    ("Ps2KeyboardDxe", DRIVER, "Drivers", "", "PS/2 keyboard in the boot picker"),
+    ("Ps2MouseDxe", DRIVER, "Drivers", "", "PS/2 mouse in the boot picker"),
+    ("UsbMouseDxe", DRIVER, "Drivers", "", "USB mouse in the boot picker"),
+    ("OpenPartitionDxe", DRIVER, "Drivers", "", "Apple partition maps, for 10.7 to 10.9 recovery"),
+    ("OpenLinuxBoot", DRIVER, "Drivers", "", "Finds and boots Linux kernels directly"),
+    ("OpenVariableRuntimeDxe", DRIVER, "Drivers", "", "Emulated NVRAM for firmware without it"),
+    ("ResetNvramEntry", DRIVER, "Drivers", "", "Reset NVRAM entry in the boot picker"),
+    ("ToggleSipEntry", DRIVER, "Drivers", "", "Toggle SIP entry in the boot picker"),
+    ("FirmwareSettingsEntry", DRIVER, "Drivers", "", "Reboot into firmware setup from the boot picker"),
+    ("CrScreenshotDxe", DRIVER, "Drivers", "", "Screenshots in OpenCore with F10"),
+    ("ExFatDxe", DRIVER, "Drivers", "", "exFAT file system driver"),
+    ("Ext4Dxe", DRIVER, "Drivers", "", "ext4 file system driver, for Linux boot"),
+    ("btrfs_x64", DRIVER, "Drivers", "", "Btrfs file system driver, for Linux boot"),
+    ("NvmExpressDxe", DRIVER, "Drivers", "", "NVMe boot on firmware that lacks it"),
+    ("XhciDxe", DRIVER, "Drivers", "", "USB 3 in the boot picker on firmware that lacks it"),
+    ("HiiDatabase", DRIVER, "Drivers", "", "HII services for Ivy Bridge and older firmware"),
+    ("EnableGop", DRIVER, "Drivers", "", "GOP for Mac Pro 5,1 graphics cards without it"),
+
+    # --- SSDTs ---
+    ("SSDT-PLUG", SSDT, "ACPI", "", "Enables XCPM power management on Intel CPUs"),
+    ("SSDT-PLUG-ALT", SSDT, "ACPI", "", "SSDT-PLUG for Alder Lake and newer, whose CPUs are ACPI0007 devices"),
+    ("SSDT-EC", SSDT, "ACPI", "", "Fake embedded controller for Catalina and newer"),
+    ("SSDT-EC-USBX", SSDT, "ACPI", "", "Fake embedded controller and USB power properties"),
+    ("SSDT-EC-LAPTOP", SSDT, "ACPI", "", "Embedded controller rename-free fix for laptops"),
+    ("SSDT-USBX", SSDT, "ACPI", "", "USB power properties for Skylake and newer"),
+    ("SSDT-AWAC", SSDT, "ACPI", "", "Turns the AWAC clock off and re-enables the legacy RTC on 300-series boards"),
+    ("SSDT-AWAC-DISABLE", SSDT, "ACPI", "", "Disables AWAC where the RTC is already present"),
+    ("SSDT-RTC0", SSDT, "ACPI", "", "Fake RTC for boards whose RTC cannot be re-enabled"),
+    ("SSDT-RTC0-RANGE", SSDT, "ACPI", "", "Fixes the RTC I/O range on X99 and X299"),
+    ("SSDT-PMC", SSDT, "ACPI", "", "Native NVRAM on 300-series Intel boards"),
+    ("SSDT-PNLF", SSDT, "ACPI", "", "Backlight control for laptop displays"),
+    ("SSDT-PNLF-CFL", SSDT, "ACPI", "", "Backlight control for Coffee Lake and newer laptops"),
+    ("SSDT-XOSI", SSDT, "ACPI", "", "Makes the firmware believe it runs Windows, for I2C trackpads"),
+    ("SSDT-GPIO", SSDT, "ACPI", "", "Enables the GPIO controller for I2C trackpad interrupts"),
+    ("SSDT-HPET", SSDT, "ACPI", "", "Fixes IRQ conflicts of legacy devices"),
+    ("SSDT-IMEI", SSDT, "ACPI", "", "Fake Intel Management Engine for Sandy Bridge with 7-series boards"),
+    ("SSDT-SBUS-MCHC", SSDT, "ACPI", "", "SMBus and memory controller devices for AppleSMBus"),
+    ("SSDT-UNC", SSDT, "ACPI", "", "Disables uncore bridges that panic X99 and X79 boards"),
+    ("SSDT-CPUR", SSDT, "ACPI", "", "Defines the CPUs for B550 and A520 boards"),
+    ("SSDT-GPU-DISABLE", SSDT, "ACPI", "", "Disables an unsupported desktop GPU"),
+    ("SSDT-dGPU-Off", SSDT, "ACPI", "", "Powers off the discrete GPU of a laptop"),
+    ("SSDT-NoHybGfx", SSDT, "ACPI", "", "Powers off the discrete GPU of a laptop with hybrid graphics"),
+    ("SSDT-BRG0", SSDT, "ACPI", "", "Fake PCI bridge for GPUs behind an unnamed root port"),
+    ("SSDT-ALS0", SSDT, "ACPI", "", "Fake ambient light sensor for laptop brightness saving"),
+    ("SSDT-GPRW", SSDT, "ACPI", "", "Fixes instant wake through the _PRW method"),
+    ("SSDT-UPRW", SSDT, "ACPI", "", "Fixes instant wake through the UPRW method"),
+    ("SSDT-LANC", SSDT, "ACPI", "", "Fixes instant wake caused by the Ethernet controller"),
+    ("SSDT-USB-Reset", SSDT, "ACPI", "", "Resets USB controllers that stall the USB map"),
+    ("SSDT-RHUB", SSDT, "ACPI", "", "Resets the USB root hub on boards with a broken RHUB"),
+    ("SSDT-XHCI", SSDT, "ACPI", "", "Renames the USB controller for macOS"),
+    ("SSDT-DMAC", SSDT, "ACPI", "", "Fake DMA controller, cosmetic"),
+    ("SSDT-MEM2", SSDT, "ACPI", "", "Fake MEM2 device for Intel iGPU memory, cosmetic"),
+    ("SSDT-PPMC", SSDT, "ACPI", "", "Fake platform power management controller, cosmetic"),
+    ("SSDT-TB3", SSDT, "ACPI", "", "Thunderbolt 3 hotplug and native Thunderbolt properties"),
+    ("SSDT-ARTC", SSDT, "ACPI", "", "Apple real time clock for Ice Lake and newer"),
+    ("SSDT-PWRB", SSDT, "ACPI", "", "Power button device for boards without one"),
+    ("SSDT-SLPB", SSDT, "ACPI", "", "Sleep button device for boards without one"),
+    ("SSDT-TPD0", SSDT, "ACPI", "", "Enables an I2C trackpad behind a firmware _STA check"),
+    ("SSDT-PTSWAK", SSDT, "ACPI", "", "Hooks sleep and wake for laptop fixes"),
+    ("SSDT-PS2K", SSDT, "ACPI", "", "Custom key mappings for VoodooPS2Keyboard"),
+    ("SSDT-Sleep", SSDT, "ACPI", "", "Sleep fixes for S0 modern standby laptops"),
+]
+
+
+@lru_cache(maxsize=1)
+def get_catalog():
+    """Catalog entries as dicts, in CATALOG order, plus any rule item CATALOG lacks."""
+    entries = [{"name": name, "kind": kind, "category": category, "bundle_id": bundle_id, "description": description}
+               for name, kind, category, bundle_id, description in CATALOG]
+    names = {entry["name"] for entry in entries}
+    for rule in KEXT_RULES:
+        if rule["name"] not in names:
+            names.add(rule["name"])
+            entries.append({"name": rule["name"], "kind": rule["kind"], "category": "Other",
+                            "bundle_id": "", "description": rule["reason"]})
+    return entries
@@ -0,0 +1,339 @@
+# Logic/KextRecommender.py
+
+"""
+KextRecommender Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Turns a hardware inventory (Detection/DetectOS.py) into the kexts,
+drivers and SSDTs the machine needs, each with the reasons it is needed.
+
+The rules in Logic/KextRules.py are compiled once into RuleIndex, a dict
+from hardware keys to the rule specs that mention them:
+
+    ("pci", vendor, device)      a rule listing that exact device
+    ("pci", vendor, class)       a vendor's devices of one class
+    ("pci", vendor)              any device of a vendor
+    ("pci", None, class)         any vendor's device of one class
+    ("usb", vendor, product) / ("usb", vendor)
+    ("acpi", hid) / ("cpu", vendor)
+
+A PCI device is matched by building its four keys and looking them up,
+so the cost is per device, not per device and rule. The specs found that
+way are checked in full (prog-if, excluded devices) before they count.
+recommend_linear() tries every rule against every device and is kept as
+the reference the index is benchmarked and checked against:
+
+    python -m hackintoshify kexts --bench [PROFILES]
+
+Usage:
+    for item in recommend(detect_hardware()):
+        print(item["name"], explain(item))
+"""
+
+import sys
+import time
+import random
+
+from Logic.KextRules import KEXT_RULES
+
+PCI_CLASS_SHIFT = 8     # class_id is 24 bits (class, subclass, prog-if); rules use the top 16
+
+
+def _pci_class(device):
+    class_id = device.get("class_id")
+    return None if class_id is None else class_id >> PCI_CLASS_SHIFT
+
+
+def pci_spec_matches(spec, device):
+    vendor_id = device.get("vendor_id")
+    if "vendor" in spec and spec["vendor"] != vendor_id:
+        return False
+    if "devices" in spec and device.get("device_id") not in spec["devices"]:
+        return False
+    if device.get("device_id") in spec.get("exclude", ()):
+        return False
+    if "class" in spec and spec["class"] != _pci_class(device):
+        return False
+    if "prog_if" in spec and (device.get("class_id") is None or device["class_id"] & 0xff != spec["prog_if"]):
+        return False
+    return True
+
+
+def usb_spec_matches(spec, device):
+    if spec["vendor"] != device.get("vendor_id"):
+        return False
+    return "products" not in spec or device.get("product_id") in spec["products"]
+
+
+def _sections(info):
+    """The PCI and USB device lists, ACPI IDs and CPU vendor of an inventory; failed sections are empty."""
+    pci = info.get("pci") if isinstance(info.get("pci"), list) else []
+    usb = info.get("usb") if isinstance(info.get("usb"), list) else []
+    acpi = info.get("acpi") if isinstance(info.get("acpi"), list) else []
+    cpu = info.get("cpu") if isinstance(info.get("cpu"), dict) else {}
+    return pci, usb, acpi, cpu.get("vendor", "")
+
+
+class RuleIndex:
+    def __init__(self, rules=KEXT_RULES):
+        self.rules = rules
+        self.positions = {rule["name"]: i for i, rule in enumerate(rules)}
+        self.always = [i for i, rule in enumerate(rules) if rule.get("always")]
+        self.table = {}         # key -> [(rule position, spec)]
+
+        for i, rule in enumerate(rules):
+            for vendor in rule.get("cpu", ()):
+                self._add(("cpu", vendor), i, None)
+            for hid in rule.get("acpi", ()):
+                self._add(("acpi", hid.upper()), i, None)
+            for spec in rule.get("usb", ()):
+                if "products" in spec:
+                    for product in spec["products"]:
+                        self._add(("usb", spec["vendor"], product), i, spec)
+                else:
+                    self._add(("usb", spec["vendor"]), i, spec)
+            for spec in rule.get("pci", ()):
+                for key in self._pci_keys(spec):
+                    self._add(key, i, spec)
+
+    def _add(self, key, position, spec):
+        self.table.setdefault(key, []).append((position, spec))
+
+    @staticmethod
+    def _pci_keys(spec):
+        vendor = spec.get("vendor")
+        if "devices" in spec:
+            return [("pci", vendor, device) for device in spec["devices"]]
+        if vendor is not None and "class" in spec:
+            return [("pci", vendor, ("class", spec["class"]))]
+        if vendor is not None:
+            return [("pci", vendor)]
+        if "class" in spec:
+            return [("pci", None, ("class", spec["class"]))]
+        raise ValueError(f"PCI rule spec matches nothing to index on: {spec}")
+
+    def __len__(self):
+        return len(self.table)
+
+    def match(self, info):
+        """{rule position: [matched item, ...]} for one inventory."""
+        pci, usb, acpi, cpu_vendor = _sections(info)
+        table = self.table
+        found = {i: [] for i in self.always}
+
+        def hit(key, item, check=None):
+            for position, spec in table.get(key, ()):
+                if check is None or check(spec, item):
+                    items = found.setdefault(position, [])
+                    # An item can reach one rule through several of its keys
+                    if not items or items[-1] is not item:
+                        items.append(item)
+
+        if cpu_vendor:
+            hit(("cpu", cpu_vendor), info["cpu"])
+        for hid in acpi:
+            hit(("acpi", hid.upper()), hid)
+        for device in usb:
+            vendor = device.get("vendor_id")
+            hit(("usb", vendor, device.get("product_id")), device, usb_spec_matches)
+            hit(("usb", vendor), device, usb_spec_matches)
+        for device in pci:
+            vendor = device.get("vendor_id")
+            pci_class = ("class", _pci_class(device))
+            hit(("pci", vendor, device.get("device_id")), device, pci_spec_matches)
+            hit(("pci", vendor, pci_class), device, pci_spec_matches)
+            hit(("pci", vendor), device, pci_spec_matches)
+            hit(("pci", None, pci_class), device, pci_spec_matches)
+        return found
+
+
+def match_linear(info, rules=KEXT_RULES):
+    """The same as RuleIndex.match(), by trying every rule on every item."""
+    pci, usb, acpi, cpu_vendor = _sections(info)
+    found = {}
+    for i, rule in enumerate(rules):
+        items = []
+        if rule.get("always"):
+            found[i] = items
+        if cpu_vendor and cpu_vendor in rule.get("cpu", ()):
+            items.append(info["cpu"])
+        rule_hids = {hid.upper() for hid in rule.get("acpi", ())}
+        for hid in acpi:
+            if hid.upper() in rule_hids:
+                items.append(hid)
+        for device in usb:
+            if any(usb_spec_matches(spec, device) for spec in rule.get("usb", ())):
+                items.append(device)
+        for device in pci:
+            if any(pci_spec_matches(spec, device) for spec in rule.get("pci", ())):
+                items.append(device)
+        if items:
+            found[i] = items
+    return found
+
+
+def resolve(found, rules=KEXT_RULES, positions=None):
+    """
+    Recommendations in load order from a match() result, with every
+    `requires` added. Each is {"name", "kind", "reason", "matches",
+    "required_by"}.
+    """
+    if positions is None:
+        positions = {rule["name"]: i for i, rule in enumerate(rules)}
+    required_by = {}
+    pending = list(found)
+    seen = set(found)
+    while pending:
+        rule = rules[pending.pop()]
+        for name in rule.get("requires", ()):
+            position = positions[name]
+            required_by.setdefault(position, []).append(rule["name"])
+            if position not in seen:
+                seen.add(position)
+                pending.append(position)
+
+    result = []
+    for position in sorted(seen):
+        rule = rules[position]
+        result.append({"name": rule["name"], "kind": rule["kind"], "reason": rule["reason"],
+                       "matches": found.get(position, []),
+                       "required_by": sorted(required_by.get(position, []), key=positions.get)})
+    return result
+
+
+_index = None
+
+
+def get_index():
+    global _index
+    if _index is None:
+        _index = RuleIndex()
+    return _index
+
+
+def recommend(info, index=None):
+    index = index or get_index()
+    return resolve(index.match(info), index.rules, index.positions)
+
+
+def recommend_linear(info, rules=KEXT_RULES):
+    return resolve(match_linear(info, rules), rules)
+
+
+def _match_label(item):
+    if isinstance(item, str):
+        return f"ACPI {item}"
+    if "product_id" in item:
+        name = item.get("name") or f"{item['vendor_id']:04x}:{item.get('product_id') or 0:04x}"
+        return f"USB {name}"
+    if "slot" in item:
+        from Detection.DetectOS import device_label
+        return f"{device_label(item)} ({item['slot']})"
+    return item.get("name") or "CPU"
+
+
+def explain(recommendation):
+    """One line on why an item was recommended."""
+    parts = [recommendation["reason"]]
+    if recommendation["matches"]:
+        parts.append("found " + ", ".join(_match_label(item) for item in recommendation["matches"]))
+    if recommendation["required_by"]:
+        parts.append("required by " + ", ".join(recommendation["required_by"]))
+    return "; ".join(parts)
+
+
+# --- Benchmark ---
+
+# IDs the synthetic machines are drawn from, most of them matching no rule
+COMMON_PCI_CLASSES = [0x060000, 0x060100, 0x060400, 0x0c0500, 0x0c8000, 0x050000, 0x088000, 0x118000,
+                      0x0c0330, 0x010802, 0x010601, 0x020000, 0x028000, 0x030000, 0x038000, 0x040300]
+COMMON_VENDORS = [0x8086, 0x8086, 0x1022, 0x1002, 0x10de, 0x10ec, 0x14e4, 0x1b21, 0x144d, 0x1969, 0x1b4b]
+COMMON_ACPI = ["PNP0A08", "PNP0C0C", "PNP0C0D", "PNP0C0E", "PNP0C14", "PNP0103", "PNP0B00", "PNP0C02",
+               "PNP0C09", "PNP0C0F", "PNP0100", "PNP0200", "PNP0800", "INT33A1", "INT3400", "ACPI0003",
+               "ACPI0007", "ACPI0010", "LNXPOWER", "LNXSYSTM", "LNXSYBUS", "PNP0303", "PNP0C0A", "PNP0C50",
+               "ACPI0008", "ACPI000E", "PNP0F13"]
+CPU_VENDORS = ["GenuineIntel", "GenuineIntel", "AuthenticAMD"]
+
+
+def _rule_ids(rules):
+    """Every (vendor, device) and USB (vendor, product) the rules name, so profiles hit them."""
+    pci, usb = [], []
+    for rule in rules:
+        for spec in rule.get("pci", ()):
+            pci.extend((spec["vendor"], device) for device in spec.get("devices", ()))
+        for spec in rule.get("usb", ()):
+            usb.extend((spec["vendor"], product) for product in spec.get("products", [0x0001]))
+    return pci, usb
+
+
+def synthetic_profiles(count, seed=0, rules=KEXT_RULES):
+    """`count` random inventories shaped like detect_hardware() results."""
+    rng = random.Random(seed)
+    rule_pci, rule_usb = _rule_ids(rules)
+    profiles = []
+    for _ in range(count):
+        pci = []
+        for slot in range(rng.randint(12, 48)):
+            if rng.random() < 0.15:
+                vendor_id, device_id = rng.choice(rule_pci)
+            else:
+                vendor_id, device_id = rng.choice(COMMON_VENDORS), rng.randrange(0x10000)
+            pci.append({"slot": f"0000:{slot // 8:02x}:{slot % 8:02x}.0", "vendor_id": vendor_id,
+                        "device_id": device_id, "class_id": rng.choice(COMMON_PCI_CLASSES)})
+        usb = []
+        for port in range(rng.randint(2, 14)):
+            if rng.random() < 0.2:
+                vendor_id, product_id = rng.choice(rule_usb)
+            else:
+                vendor_id, product_id = rng.randrange(0x10000), rng.randrange(0x10000)
+            usb.append({"port": f"1-{port}", "vendor_id": vendor_id, "product_id": product_id})
+        acpi = sorted(set(rng.sample(COMMON_ACPI, rng.randint(8, 20)))
+                      | {f"DEV{rng.randrange(0x10000):04X}" for _ in range(rng.randint(10, 60))})
+        profiles.append({"cpu": {"name": "Synthetic CPU", "vendor": rng.choice(CPU_VENDORS)},
+                         "pci": pci, "usb": usb, "acpi": acpi})
+    return profiles
+
+
+def benchmark(count=3000, seed=0, status_callback=None):
+    """Times the index against the linear scan over `count` synthetic profiles and checks they agree."""
+    def status(text):
+        if status_callback:
+            status_callback(text)
+
+    start = time.perf_counter()
+    profiles = synthetic_profiles(count, seed)
+    generated = time.perf_counter()
+    status(f"Generated {count} profiles in {(generated - start) * 1000:.0f} ms")
+
+    start = time.perf_counter()
+    index = RuleIndex()
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    indexed = [recommend(profile, index) for profile in profiles]
+    indexed_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    linear = [recommend_linear(profile) for profile in profiles]
+    linear_ms = (time.perf_counter() - start) * 1000
+
+    mismatches = sum(a != b for a, b in zip(indexed, linear))
+    devices = sum(len(profile["pci"]) + len(profile["usb"]) + len(profile["acpi"]) for profile in profiles)
+    result = {
+        "profiles": count, "rules": len(index.rules), "keys": len(index), "devices": devices,
+        "compile_ms": round(compile_ms, 3),
+        "indexed_ms": round(indexed_ms, 1), "linear_ms": round(linear_ms, 1),
+        "indexed_us_per_profile": round(indexed_ms * 1000 / count, 1),
+        "linear_us_per_profile": round(linear_ms * 1000 / count, 1),
+        "speedup": round(linear_ms / indexed_ms, 1) if indexed_ms else None,
+        "recommended_per_profile": round(sum(len(items) for items in indexed) / count, 1),
+        "mismatches": mismatches,
+    }
+    status(f"Index {result['indexed_us_per_profile']} us per profile, linear scan "
+           f"{result['linear_us_per_profile']} us ({result['speedup']}x), {mismatches} mismatches")
+    return result
+
+
+if __name__ == "__main__":
+    # python -m Logic.KextRecommender [PROFILES]
+    print(benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 3000, status_callback=print))
@@ -0,0 +1,170 @@
+# Logic/KextRules.py
+
+"""
+KextRules Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Which kexts, drivers and SSDTs a piece of hardware needs. Each rule names
+one item and lists what makes it needed. Any one match is enough:
+
+    always      True for items every build needs
+    cpu         CPU vendor strings ("GenuineIntel", "AuthenticAMD")
+    pci         {"vendor", "devices", "class", "prog_if", "exclude"} specs;
+                "class" is the 16-bit base class and subclass (0x0200 is
+                Ethernet), "devices" a list of device IDs of "vendor"
+    usb         {"vendor", "products"} specs
+    acpi        ACPI hardware IDs ("PNP0C0A" is a battery)
+    requires    items this one does not load without, added with it
+
+Rules are listed in load order; Lilu and VirtualSMC come before their
+plugins. Logic/KextRecommender.py compiles the table into its index.
+"""
+
+KEXT = "kext"
+DRIVER = "driver"       # UEFI driver in EFI/OC/Drivers
+SSDT = "ssdt"
+
+INTEL = 0x8086
+AMD_GPU = 0x1002
+AMD = 0x1022
+NVIDIA = 0x10de
+BROADCOM = 0x14e4
+REALTEK = 0x10ec
+ATHEROS = 0x1969
+ASMEDIA = 0x1b21
+MARVELL = 0x1b4b
+
+# PCI classes (base << 8 | subclass)
+ETHERNET = 0x0200
+WIRELESS = 0x0280
+VGA = 0x0300
+DISPLAY_3D = 0x0302
+DISPLAY_OTHER = 0x0380
+HD_AUDIO = 0x0403
+SATA = 0x0106
+NVME = 0x0108
+USB_CONTROLLER = 0x0c03
+XHCI = 0x30             # prog-if of USB_CONTROLLER
+
+KEXT_RULES = [
+    # --- Every build ---
+    {"name": "OpenRuntime", "kind": DRIVER, "always": True,
+     "reason": "OpenCore's runtime services, needed for booting"},
+    {"name": "HfsPlus", "kind": DRIVER, "always": True,
+     "reason": "Reads the HFS+ recovery and installer volumes"},
+    {"name": "Lilu", "kind": KEXT, "always": True,
+     "reason": "Patching framework the other kexts are plugins of"},
+    {"name": "VirtualSMC", "kind": KEXT, "always": True, "requires": ["Lilu"],
+     "reason": "Emulates the Apple SMC, macOS does not boot without one"},
+    {"name": "SSDT-EC-USBX", "kind": SSDT, "always": True,
+     "reason": "Fake embedded controller and USB power properties"},
+
+    # --- CPU ---
+    {"name": "SSDT-PLUG", "kind": SSDT, "cpu": ["GenuineIntel"],
+     "reason": "Intel CPU power management (XCPM)"},
+    {"name": "SMCProcessor", "kind": KEXT, "cpu": ["GenuineIntel"], "requires": ["VirtualSMC"],
+     "reason": "Intel CPU temperature sensors"},
+    {"name": "AMDRyzenCPUPowerManagement", "kind": KEXT, "cpu": ["AuthenticAMD"], "requires": ["Lilu"],
+     "reason": "AMD CPU power management and sensors"},
+    {"name": "SMCAMDProcessor", "kind": KEXT, "cpu": ["AuthenticAMD"],
+     "requires": ["VirtualSMC", "AMDRyzenCPUPowerManagement"],
+     "reason": "Exposes the AMD CPU sensors to VirtualSMC"},
+    {"name": "AppleMCEReporterDisabler", "kind": KEXT, "cpu": ["AuthenticAMD"],
+     "reason": "Stops AppleMCEReporter panicking on AMD CPUs"},
+
+    # --- Graphics ---
+    {"name": "WhateverGreen", "kind": KEXT, "requires": ["Lilu"],
+     "pci": [{"vendor": INTEL, "class": VGA}, {"vendor": INTEL, "class": DISPLAY_OTHER},
+             {"vendor": AMD_GPU, "class": VGA}, {"vendor": AMD_GPU, "class": DISPLAY_OTHER}],
+     "reason": "Graphics patches for Intel and AMD GPUs"},
+    {"name": "SSDT-GPU-DISABLE", "kind": SSDT,
+     "pci": [{"vendor": NVIDIA, "class": VGA}, {"vendor": NVIDIA, "class": DISPLAY_3D}],
+     "reason": "NVIDIA GPUs have no driver in current macOS, disable the card"},
+
+    # --- Audio ---
+    {"name": "AppleALC", "kind": KEXT, "requires": ["Lilu"],
+     "pci": [{"vendor": INTEL, "class": HD_AUDIO}, {"vendor": AMD, "class": HD_AUDIO}],
+     "reason": "Onboard HD audio codec"},
+
+    # --- Ethernet ---
+    {"name": "IntelMausi", "kind": KEXT,
+     "pci": [{"vendor": INTEL, "devices": [
+         0x10ef, 0x10f0, 0x1502, 0x1503, 0x153a, 0x153b, 0x155a, 0x1559, 0x15a0, 0x15a1, 0x15a2, 0x15a3,
+         0x156f, 0x1570, 0x15b7, 0x15b8, 0x15b9, 0x15bb, 0x15bc, 0x15bd, 0x15be, 0x15d6, 0x15d7, 0x15d8,
+         0x15e3, 0x0d4c, 0x0d4d, 0x0d4e, 0x0d4f, 0x0d53, 0x0d55, 0x15f9, 0x15fa, 0x15fb, 0x15fc,
+         0x1a1c, 0x1a1d, 0x1a1e, 0x1a1f]}],
+     "reason": "Intel 82578, 82579 and I217 to I219 Ethernet"},
+    {"name": "SmallTreeIntel82576", "kind": KEXT,
+     "pci": [{"vendor": INTEL, "devices": [0x10c9, 0x10e6, 0x10e7, 0x10e8, 0x1526, 0x150a, 0x1518, 0x1539]}],
+     "reason": "Intel 82576 and I211 Ethernet"},
+    {"name": "AppleIGC", "kind": KEXT,
+     "pci": [{"vendor": INTEL, "devices": [0x15f2, 0x15f3, 0x125b, 0x125c, 0x125d]}],
+     "reason": "Intel I225 and I226 2.5 GbE"},
+    {"name": "RealtekRTL8111", "kind": KEXT,
+     "pci": [{"vendor": REALTEK, "devices": [0x8111, 0x8168]}],
+     "reason": "Realtek RTL8111/8168 Gigabit Ethernet"},
+    {"name": "LucyRTL8125Ethernet", "kind": KEXT,
+     "pci": [{"vendor": REALTEK, "devices": [0x8125, 0x3000]}],
+     "reason": "Realtek RTL8125 2.5 GbE"},
+    {"name": "RealtekRTL8100", "kind": KEXT,
+     "pci": [{"vendor": REALTEK, "devices": [0x8136]}],
+     "reason": "Realtek RTL810x Fast Ethernet"},
+    {"name": "AtherosE2200Ethernet", "kind": KEXT,
+     "pci": [{"vendor": ATHEROS, "devices": [0x1091, 0x10a1, 0xe091, 0xe0a1, 0xe0b1]}],
+     "reason": "Qualcomm Atheros and Killer E2x00 Ethernet"},
+
+    # --- Wi-Fi and Bluetooth ---
+    {"name": "AirportItlwm", "kind": KEXT, "pci": [{"vendor": INTEL, "class": WIRELESS}],
+     "reason": "Intel Wi-Fi"},
+    {"name": "AirportBrcmFixup", "kind": KEXT, "requires": ["Lilu"],
+     "pci": [{"vendor": BROADCOM, "class": WIRELESS}],
+     "reason": "Broadcom Wi-Fi"},
+    {"name": "BlueToolFixup", "kind": KEXT, "requires": ["Lilu"],
+     "usb": [{"vendor": 0x8087, "products": [0x0025, 0x0026, 0x0029, 0x0032, 0x0033, 0x0a2a, 0x0a2b, 0x0aaa]},
+             {"vendor": 0x0a5c}, {"vendor": 0x0489, "products": [0xe07a, 0xe0a2]},
+             {"vendor": 0x13d3, "products": [0x3404]}],
+     "reason": "Bluetooth stack fixes for third-party controllers"},
+    {"name": "IntelBluetoothFirmware", "kind": KEXT, "requires": ["BlueToolFixup"],
+     "usb": [{"vendor": 0x8087, "products": [0x0025, 0x0026, 0x0029, 0x0032, 0x0033, 0x0a2a, 0x0a2b, 0x0aaa]}],
+     "reason": "Intel Bluetooth firmware upload"},
+    {"name": "BrcmFirmwareData", "kind": KEXT,
+     "usb": [{"vendor": 0x0a5c}, {"vendor": 0x0489, "products": [0xe07a, 0xe0a2]},
+             {"vendor": 0x13d3, "products": [0x3404]}],
+     "reason": "Broadcom Bluetooth firmware images"},
+    {"name": "BrcmPatchRAM3", "kind": KEXT, "requires": ["BrcmFirmwareData", "BlueToolFixup"],
+     "usb": [{"vendor": 0x0a5c}, {"vendor": 0x0489, "products": [0xe07a, 0xe0a2]},
+             {"vendor": 0x13d3, "products": [0x3404]}],
+     "reason": "Broadcom Bluetooth firmware upload"},
+
+    # --- Storage ---
+    {"name": "NVMeFix", "kind": KEXT, "requires": ["Lilu"], "pci": [{"class": NVME}],
+     "reason": "Power management for non-Apple NVMe drives"},
+    {"name": "CtlnaAHCIPort", "kind": KEXT,
+     "pci": [{"vendor": ASMEDIA, "class": SATA}, {"vendor": MARVELL, "class": SATA}],
+     "reason": "Third-party SATA controller"},
+
+    # --- USB ---
+    {"name": "USBToolBox", "kind": KEXT, "pci": [{"class": USB_CONTROLLER, "prog_if": XHCI}],
+     "reason": "USB port mapping, build UTBMap.kext with the USBToolBox tool"},
+    {"name": "XHCI-unsupported", "kind": KEXT,
+     "pci": [{"vendor": INTEL, "devices": [0xa2af, 0xa36d, 0x9ded, 0x02ed, 0x43ed, 0x7ae0]},
+             {"vendor": ASMEDIA, "class": USB_CONTROLLER, "prog_if": XHCI}],
+     "reason": "USB 3 controller macOS does not attach to by itself"},
+
+    # --- Laptops ---
+    {"name": "SMCBatteryManager", "kind": KEXT, "requires": ["VirtualSMC"], "acpi": ["PNP0C0A"],
+     "reason": "Battery status"},
+    {"name": "ECEnabler", "kind": KEXT, "requires": ["Lilu"], "acpi": ["PNP0C0A"],
+     "reason": "Reads battery fields wider than 8 bits from the EC"},
+    {"name": "SMCLightSensor", "kind": KEXT, "requires": ["VirtualSMC"], "acpi": ["ACPI0008"],
+     "reason": "Ambient light sensor"},
+    {"name": "VoodooPS2Controller", "kind": KEXT, "acpi": ["PNP0303", "PNP030B", "PNP0F13"],
+     "reason": "PS/2 keyboard and trackpad"},
+    {"name": "VoodooI2C", "kind": KEXT, "acpi": ["PNP0C50", "ACPI0C50"],
+     "reason": "I2C bus of the trackpad or touchscreen"},
+    {"name": "VoodooI2CHID", "kind": KEXT, "requires": ["VoodooI2C"], "acpi": ["PNP0C50", "ACPI0C50"],
+     "reason": "HID-over-I2C trackpad or touchscreen"},
+    {"name": "SSDT-AWAC", "kind": SSDT, "acpi": ["ACPI000E"],
+     "reason": "Re-enables the legacy RTC in place of the AWAC clock"},
+]
@@ -0,0 +1,251 @@
+# Logic/KextSearch.py
+
+"""
+KextSearch Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Search-as-you-type over the kext catalog (Logic/KextCatalog.py).
+
+SearchIndex is built once. It maps every trigram of an entry's name,
+bundle ID and description to the entries that contain it. The text is
+lower-cased, separators become spaces and CamelCase names are split, so
+"IntelMausi" is indexed as " intelmausi intel mausi ". Word starts are
+indexed as the bigram " x" as well, so one typed letter finds something.
+
+A query is turned into the trigrams of " " + query: the word-start gram
+" xy" and the query's own trigrams. An entry is a candidate when it holds
+at least MIN_SHARE of them, so a typo costs a few trigrams, not the
+match. A query of up to EXACT_GRAMS has no room for a typo and must
+contain all of its own trigrams. For those the word-start gram is
+optional, because chip numbers and the middle of a name do not start a
+word: "8125" finds RTL8125 and "tlwm" finds itlwm. One- and two-letter
+queries only match at word starts. Candidates are then ranked: exact
+name, name prefix, word prefix and substring hits before plain trigram
+overlap.
+
+IncrementalSearch keeps the per-entry counts of the query's own trigrams
+for every prefix of the last query. A typed character adds exactly one
+trigram, so the next counts are the previous ones plus one posting list.
+Backspace pops back to a count that is already known. Ranking only looks
+at the candidates, never the whole catalog.
+
+    python -m hackintoshify kexts --search-bench [SCALE]
+
+Usage:
+    search = IncrementalSearch(SearchIndex(get_catalog()))
+    rows = search.search("brcm")    # Catalog rows, best first; None for an empty query
+"""
+
+import re
+import time
+import math
+import statistics
+
+MIN_SHARE = 0.6         # Share of the query's trigrams a candidate must contain
+EXACT_GRAMS = 3         # Queries this short (in grams, with the word start) must contain all their own trigrams
+FIELDS = ("name", "bundle_id", "description")
+
+_CAMEL = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text):
+    """Lower case with every run of other characters as one space. Keeps a trailing space, the user typed it."""
+    return _SEPARATORS.sub(" ", text.lower()).lstrip()
+
+
+def index_text(text):
+    """The text an entry field is indexed as, with CamelCase words split out as well."""
+    plain = normalize(text).strip()
+    split = normalize(_CAMEL.sub(" ", text)).strip()
+    return f" {plain} {split} " if split != plain else f" {plain} "
+
+
+def query_grams(query):
+    """Trigrams of " " + query, or the word start bigram for a one-letter query."""
+    padded = " " + query
+    if len(padded) == 2:
+        return [padded]
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+class SearchIndex:
+    def __init__(self, entries):
+        self.entries = entries
+        self.names = []         # Lower-case name per row
+        self.words = []         # Name words per row, for word-prefix ranking
+        self.texts = []         # Normalized (bundle_id, description) per row
+        postings = {}
+        for row, entry in enumerate(entries):
+            grams = set()
+            for field in FIELDS:
+                text = index_text(entry.get(field) or "")
+                grams.update(text[i:i + 3] for i in range(len(text) - 2))
+                grams.update(text[i:i + 2] for i in range(len(text) - 1) if text[i] == " " and text[i + 1] != " ")
+            for gram in grams:
+                postings.setdefault(gram, []).append(row)
+            name_text = index_text(entry["name"])
+            self.names.append(normalize(entry["name"]).strip())
+            self.words.append(name_text.split())
+            self.texts.append((normalize(entry.get("bundle_id") or ""), normalize(entry.get("description") or "")))
+        self.postings = {gram: tuple(rows) for gram, rows in postings.items()}
+        self.word_starts = {}   # Word-start gram -> set of rows, built when a query first needs it
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add_postings(self, counts, gram):
+        """`counts` plus the entries holding `gram`, as a new dict."""
+        counts = dict(counts)
+        for row in self.postings.get(gram, ()):
+            counts[row] = counts.get(row, 0) + 1
+        return counts
+
+    def count(self, grams):
+        counts = {}
+        for gram in grams:
+            for row in self.postings.get(gram, ()):
+                counts[row] = counts.get(row, 0) + 1
+        return counts
+
+    def _word_start_rows(self, gram):
+        rows = self.word_starts.get(gram)
+        if rows is None:
+            rows = self.word_starts[gram] = frozenset(self.postings.get(gram, ()))
+        return rows
+
+    def rank(self, query, counts, gram_count):
+        """
+        Rows of the candidates in `counts`, best first. For a query of three
+        or more characters `counts` holds the hits of its `gram_count` own
+        trigrams; for a shorter one the hits of its word-start gram.
+        """
+        if len(query) < 3:
+            word_start, total = None, gram_count
+            needed = gram_count
+        else:
+            word_start, total = self._word_start_rows(query_grams(query)[0]), gram_count + 1
+            needed = gram_count if total <= EXACT_GRAMS else math.ceil(total * MIN_SHARE)
+        text = query.strip()
+        scored = []
+        for row, hits in counts.items():
+            if word_start is not None:
+                if total <= EXACT_GRAMS and hits < needed:
+                    continue
+                hits += row in word_start
+            if hits < needed:
+                continue
+            score = min(hits, total) / total
+            name = self.names[row]
+            if name == text:
+                score += 8
+            elif name.startswith(text):
+                score += 4
+            elif any(word.startswith(text) for word in self.words[row]):
+                score += 3
+            elif text in name:
+                score += 2
+            bundle_id, description = self.texts[row]
+            if text in bundle_id:
+                score += 1
+            if text in description:
+                score += 0.5
+            scored.append((-score, len(name), name, row))
+        scored.sort()
+        return [row for _, _, _, row in scored]
+
+    def search(self, query):
+        """Catalog rows matching `query`, best first, or None when the query is empty."""
+        query = normalize(query)
+        if not query.strip():
+            return None
+        grams = query_grams(query)
+        if len(query) >= 3:
+            grams = grams[1:]   # The word-start gram is looked up by rank()
+        return self.rank(query, self.count(grams), len(grams))
+
+
+class IncrementalSearch:
+    """SearchIndex.search() for a query that changes one keystroke at a time."""
+
+    def __init__(self, index):
+        self.index = index
+        self.stack = []         # (query, gram count, counts) for each prefix of the last query, see SearchIndex.rank
+
+    def search(self, query):
+        query = normalize(query)
+        if not query.strip():
+            self.stack = []
+            return None
+
+        # Back to the longest known prefix, then one trigram per new character
+        while self.stack and not query.startswith(self.stack[-1][0]):
+            self.stack.pop()
+        if self.stack:
+            known, gram_count, counts = self.stack[-1]
+        else:
+            known, gram_count, counts = "", 0, {}
+        for end in range(len(known) + 1, len(query) + 1):
+            prefix = query[:end]
+            if end <= 2:
+                # The one-letter bigram is not a prefix of the two-letter trigram, start over
+                grams = query_grams(prefix)
+                gram_count, counts = len(grams), self.index.count(grams)
+            elif end == 3:
+                # From here on the counts are of the query's own trigrams
+                gram_count, counts = 1, self.index.count([prefix])
+            else:
+                gram_count, counts = gram_count + 1, self.index.add_postings(counts, prefix[-3:])
+            self.stack.append((prefix, gram_count, counts))
+        return self.index.rank(query, counts, gram_count)
+
+
+# --- Benchmark ---
+
+BENCH_QUERIES = ["lilu", "intel", "brcm", "realtek 8125", "ssdt", "voodoo i2c", "usb map", "nvme",
+                 "whatevergreen", "as.vit9696", "bluetooth", "trakpad", "ethernet", "amd ryzen", "backlight"]
+
+
+def scaled_catalog(entries, scale):
+    """`entries` repeated `scale` times with distinct names, for timing a bigger catalog."""
+    if scale <= 1:
+        return list(entries)
+    return [dict(entry, name=f"{entry['name']}{copy}" if copy else entry["name"])
+            for copy in range(scale) for entry in entries]
+
+
+def _naive_filter(entries, query):
+    text = query.lower().strip()
+    return [row for row, entry in enumerate(entries)
+            if any(text in (entry.get(field) or "").lower() for field in FIELDS)]
+
+
+def benchmark(entries, queries=BENCH_QUERIES, status_callback=None):
+    """Types every query one character at a time and times each keystroke, index against substring scan."""
+    start = time.perf_counter()
+    index = SearchIndex(entries)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    indexed, naive = [], []
+    for query in queries:
+        search = IncrementalSearch(index)
+        for end in range(1, len(query) + 1):
+            start = time.perf_counter()
+            search.search(query[:end])
+            indexed.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            _naive_filter(entries, query[:end])
+            naive.append((time.perf_counter() - start) * 1000)
+
+    def summary(times):
+        times = sorted(times)
+        return {"median_ms": round(statistics.median(times), 3),
+                "p95_ms": round(times[int(len(times) * 0.95) - 1], 3), "max_ms": round(times[-1], 3)}
+
+    result = {"entries": len(entries), "trigrams": len(index.postings), "build_ms": round(build_ms, 1),
+              "keystrokes": len(indexed), "indexed": summary(indexed), "substring_scan": summary(naive)}
+    if status_callback:
+        status_callback(f"{len(entries)} entries: {result['indexed']['median_ms']} ms median, "
+                        f"{result['indexed']['max_ms']} ms worst keystroke")
+    return result
@@ -0,0 +1,291 @@
+# Logic/Settings.py
+
+"""
+Settings Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+One place for config.ini and setup_details.json. Both files are read once
+and served from memory; get() converts values to the type of the fallback
+it is given (bool, int, float or str).
+
+Edits made outside the app are picked up by comparing the files' mtime and
+size, at most once per CHECK_INTERVAL on reads (the GUI also watches the
+folder, see GUI_Screens/Functionality/SettingsSignals.py). Writes go
+through a .tmp file and os.replace, and inside `with settings.batch():`
+all changes are written once at the end.
+
+Listeners registered with subscribe() get the list of (section, key) pairs
+that changed, whether the change came from this process or from disk.
+setup_details.json keys use the section name SETUP.
+
+Usage:
+    settings = get_settings()
+    theme = settings.get("Settings", "theme", "Dark")
+    with settings.batch():
+        settings.set("Settings", "theme", "Light")
+        settings.set_setup("setup_complete", True)
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+import configparser
+from contextlib import contextmanager
+
+CONFIG_FILE = "config.ini"
+SETUP_FILE = "setup_details.json"
+SETUP = "setup"             # Section name used for setup_details.json keys
+CHECK_INTERVAL = 1.0        # Seconds between mtime checks
+
+DEFAULTS = {
+    "Settings": {"theme": "Dark", "verbose_logging": "False", "low_overhead_rendering": "False"},
+    # KB/s, 0 = unlimited. schedule e.g. "08:00-18:00=2048, 18:00-22:00=8192"
+    "Bandwidth": {"limit": "0", "per_download_limit": "0", "schedule": ""},
+}
+
+
+def get_config_dir():
+    """Platform-specific folder of config.ini and setup_details.json."""
+    if sys.platform == "win32":
+        return os.path.join(os.getenv("ProgramData"), "Hackintoshify")
+    elif sys.platform == "darwin":
+        return "/Library/Application Support/Hackintoshify"
+    else:  # Linux
+        return os.path.join(os.path.expanduser("~"), ".config", "hackintoshify")
+
+
+def _file_state(path):
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+
+def _convert(value, fallback):
+    if isinstance(fallback, bool):
+        state = configparser.ConfigParser.BOOLEAN_STATES.get(str(value).lower())
+        return fallback if state is None else state
+    if isinstance(fallback, int):
+        try:
+            return int(value)
+        except ValueError:
+            return fallback
+    if isinstance(fallback, float):
+        try:
+            return float(value)
+        except ValueError:
+            return fallback
+    return value
+
+
+class SettingsStore:
+    def __init__(self, config_dir=None):
+        self.config_dir = config_dir or get_config_dir()
+        self.config_path = os.path.join(self.config_dir, CONFIG_FILE)
+        self.setup_path = os.path.join(self.config_dir, SETUP_FILE)
+        self.lock = threading.RLock()
+        self.listeners = []
+        self.config = {}            # section -> {key: str}
+        self.setup = {}
+        self.states = {}            # path -> (mtime_ns, size) when last read or written
+        self.next_check = 0.0
+        self.batch_depth = 0
+        self.dirty = set()          # Files waiting to be written
+        self.pending = []           # (section, key) changes waiting to be announced
+        self.dir_ready = False
+        self._load(self.config_path)
+        self._load(self.setup_path)
+
+    # --- Files ---
+
+    def _load(self, path):
+        self.states[path] = _file_state(path)
+        if path == self.config_path:
+            parser = configparser.ConfigParser()
+            try:
+                parser.read(path)
+            except configparser.Error:
+                return
+            self.config = {section: dict(parser[section]) for section in parser.sections()}
+        else:
+            try:
+                with open(path, "r") as f:
+                    data = json.load(f)
+                self.setup = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self.setup = {}
+
+    def _ensure_dir(self):
+        if not self.dir_ready:
+            os.makedirs(self.config_dir, exist_ok=True)
+            self.dir_ready = True
+
+    def _write(self, path):
+        self._ensure_dir()
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            if path == self.config_path:
+                parser = configparser.ConfigParser()
+                parser.read_dict(self.config)
+                parser.write(f)
+            else:
+                json.dump(self.setup, f, indent=4)
+        os.replace(tmp, path)
+        self.states[path] = _file_state(path)
+
+    def ensure_files(self):
+        """Creates both files with defaults if they do not exist yet."""
+        with self.lock:
+            if not os.path.exists(self.config_path):
+                for section, values in DEFAULTS.items():
+                    self.config.setdefault(section, dict(values))
+                self._write(self.config_path)
+            if not os.path.exists(self.setup_path):
+                self._write(self.setup_path)
+
+    def reload(self, force=False):
+        """Re-reads files that changed on disk and announces the keys that differ."""
+        with self.lock:
+            changes = []
+            for path in (self.config_path, self.setup_path):
+                if not force and _file_state(path) == self.states.get(path):
+                    continue
+                before = self._flatten(path)
+                self._load(path)
+                after = self._flatten(path)
+                changes += [key for key in before.keys() | after.keys() if before.get(key) != after.get(key)]
+            self.next_check = time.monotonic() + CHECK_INTERVAL
+        if changes:
+            self._notify(changes)
+        return changes
+
+    def _flatten(self, path):
+        if path == self.config_path:
+            return {(section, key): value for section, values in self.config.items() for key, value in values.items()}
+        return {(SETUP, key): json.dumps(value, sort_keys=True) for key, value in self.setup.items()}
+
+    def _check(self):
+        if time.monotonic() >= self.next_check:
+            self.reload()
+
+    # --- Reading ---
+
+    @property
+    def paths(self):
+        return {"config": self.config_path, "setup_details": self.setup_path}
+
+    def get(self, section, key, fallback=None):
+        """config.ini value, converted to the type of `fallback`."""
+        self._check()
+        with self.lock:
+            value = self.config.get(section, {}).get(key.lower())
+        if value is None:
+            return fallback
+        return _convert(value, fallback) if fallback is not None else value
+
+    def section(self, section):
+        self._check()
+        with self.lock:
+            return dict(self.config.get(section, {}))
+
+    def get_setup(self, key=None, fallback=None):
+        """One setup_details.json value, or a copy of all of them."""
+        self._check()
+        with self.lock:
+            if key is None:
+                return dict(self.setup)
+            return self.setup.get(key, fallback)
+
+    # --- Writing ---
+
+    def set(self, section, key, value):
+        if isinstance(value, bool):
+            value = str(value)
+        with self.lock:
+            values = self.config.setdefault(section, {})
+            if values.get(key.lower()) == str(value):
+                return
+            values[key.lower()] = str(value)
+            self._changed(self.config_path, (section, key.lower()))
+        self._notify_pending()
+
+    def set_setup(self, key, value):
+        with self.lock:
+            if key in self.setup and self.setup[key] == value:
+                return
+            self.setup[key] = value
+            self._changed(self.setup_path, (SETUP, key))
+        self._notify_pending()
+
+    def update_setup(self, values):
+        with self.batch():
+            for key, value in values.items():
+                self.set_setup(key, value)
+
+    @contextmanager
+    def batch(self):
+        """Collects every change made inside and writes each file once at the end."""
+        with self.lock:
+            self.batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self.batch_depth -= 1
+                if self.batch_depth == 0:
+                    self._flush()
+            self._notify_pending()
+
+    def _changed(self, path, change):
+        self.dirty.add(path)
+        self.pending.append(change)
+        if self.batch_depth == 0:
+            self._flush()
+
+    def _flush(self):
+        dirty, self.dirty = self.dirty, set()
+        for path in dirty:
+            self._write(path)
+
+    # --- Change listeners ---
+
+    def subscribe(self, callback):
+        """`callback(changes)` with a list of (section, key); returns `callback` for unsubscribe()."""
+        with self.lock:
+            self.listeners.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        with self.lock:
+            if callback in self.listeners:
+                self.listeners.remove(callback)
+
+    def _notify_pending(self):
+        with self.lock:
+            if self.batch_depth or not self.pending:
+                return
+            changes, self.pending = self.pending, []
+        self._notify(changes)
+
+    def _notify(self, changes):
+        with self.lock:
+            listeners = list(self.listeners)
+        for callback in listeners:
+            callback(changes)
+
+
+_settings = None
+_settings_lock = threading.Lock()
+
+
+def get_settings():
+    """Process wide settings store."""
+    global _settings
+    with _settings_lock:
+        if _settings is None:
+            _settings = SettingsStore()
+        return _settings
@@ -0,0 +1,111 @@
+# Service/Client.py
+
+"""
+Client Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Talks to the provisioning service (Service/Daemon.py) over TCP or its Unix
+socket. Only the standard library is used, so the GUI, the CLI and
+scripts can all be clients without pulling in the engines.
+
+Every request sends the service's token, which is in <state dir>/token
+on the service's machine (Daemon.load_token).
+
+Usage:
+    client = ServiceClient(token=load_token())    # http://127.0.0.1:8742
+    job = client.submit({"params": {"product": "052-78401", "targets": ["/dev/sdb"]}})
+    for update in client.watch(job["id"]):
+        print(update["status"], update["stage"], update["progress"])
+"""
+
+import json
+import socket
+import http.client
+
+from .JobQueue import FINISHED_STATES
+
+DEFAULT_URL = "http://127.0.0.1:8742"
+TIMEOUT = 60
+TOKEN_HEADER = "X-Hackintoshify-Token"
+
+
+class ServiceError(Exception):
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status    # HTTP status of the reply
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path, timeout=TIMEOUT):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class ServiceClient:
+    def __init__(self, url=DEFAULT_URL, socket_path=None, timeout=TIMEOUT, token=None):
+        self.url = url
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.token = token
+
+    def _connection(self):
+        if self.socket_path:
+            return UnixHTTPConnection(self.socket_path, self.timeout)
+        host = self.url.split("://", 1)[-1].rstrip("/")
+        return http.client.HTTPConnection(host, timeout=self.timeout)
+
+    def request(self, method, path, payload=None):
+        conn = self._connection()
+        try:
+            body = json.dumps(payload).encode() if payload is not None else None
+            headers = {TOKEN_HEADER: self.token or ""}
+            if method == "POST":
+                headers["Content-Type"] = "application/json"
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = json.loads(response.read() or b"null")
+        finally:
+            conn.close()
+        if response.status >= 400:
+            raise ServiceError(data.get("error") if isinstance(data, dict) else f"HTTP {response.status}",
+                               response.status)
+        return data
+
+    def submit(self, spec):
+        return self.request("POST", "/jobs", spec)
+
+    def jobs(self, status=None):
+        return self.request("GET", f"/jobs?status={status}" if status else "/jobs")
+
+    def job(self, job_id):
+        return self.request("GET", f"/jobs/{job_id}")
+
+    def cancel(self, job_id):
+        return self.request("POST", f"/jobs/{job_id}/cancel")
+
+    def status(self):
+        return self.request("GET", "/status")
+
+    def inventory(self):
+        return self.request("GET", "/inventory")
+
+    def add_station(self, url, token=None):
+        """Coordinator only: start placing jobs on the station at `url`, which has API token `token`."""
+        return self.request("POST", "/stations", {"url": url, "token": token})
+
+    def watch(self, job_id):
+        """Yields the job every time it changes, until it is finished."""
+        version = 0
+        while True:
+            job = self.request("GET", f"/jobs/{job_id}/watch?since={version}")
+            if job["version"] > version:
+                version = job["version"]
+                yield job
+            if job["status"] in FINISHED_STATES:
+                return
@@ -0,0 +1,330 @@
+# Service/Coordinator.py
+
+"""
+Coordinator Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Spreads provisioning jobs over several build stations. Every station runs
+the normal provisioning service (Service/Daemon.py); the coordinator has
+its own persistent queue and serves the same job API, so clients do not
+care whether they talk to one station or to the coordinator.
+
+Placement prefers stations that already hold what a job needs. A station
+that has the job's image in its store (or is already fetching it for
+another job) saves a multi-GB download, one with the named EFI folder
+saves the copy. That affinity is weighed against load: an artifact is
+worth AFFINITY_WEIGHT jobs of queue, so a hot station still hands work to
+an idle one once it is far enough behind.
+
+Every station is polled once per POLL_INTERVAL for its inventory and its
+jobs, which is also how job state is mirrored back here. After DEAD_AFTER
+failed polls in a row the station is marked down and its unfinished jobs
+go back to the queue to be placed elsewhere. When it comes back, the
+copies it still has of those jobs are cancelled.
+
+Jobs that write or verify sticks are the exception. Their targets are
+devices of one machine, so they must name it in spec["station"], and
+when that station is lost they fail instead of being moved.
+
+Stations are called with one fleet token (--station-token, by default
+this install's own token), so every station must be started with it.
+The coordinator's own API takes the token in its state dir like a station.
+
+Local test setup, three processes on one machine:
+
+    python -m hackintoshify serve --port 8751 --state-dir /tmp/st1 --token fleet-secret
+    python -m hackintoshify serve --port 8752 --state-dir /tmp/st2 --token fleet-secret
+    python -m hackintoshify coordinate --port 8742 --station-token fleet-secret \
+        --station http://127.0.0.1:8751 --station http://127.0.0.1:8752
+"""
+
+import os
+import time
+import threading
+
+from .JobQueue import JobQueue, QUEUED, RUNNING, FAILED, CANCELLED, FINISHED_STATES
+from .Client import ServiceClient, ServiceError
+from .Daemon import STAGES, DEFAULT_STAGES, DEFAULT_PORT, get_state_dir, image_key, load_token, make_server
+
+POLL_INTERVAL = 1.0     # Seconds between polls of one station
+POLL_TIMEOUT = 5        # Socket timeout of a poll
+DEAD_AFTER = 3          # Failed polls in a row before a station's jobs are moved
+AFFINITY_WEIGHT = 4     # Queued jobs one held artifact is worth
+DEVICE_STAGES = ("write_usb", "verify_usb")   # Stages that touch the station's own disks
+MIRRORED_FIELDS = ("stage", "stage_index", "progress", "artifacts", "results", "error", "log")
+
+
+class Station:
+    def __init__(self, url, token=None):
+        self.url = url.rstrip("/")
+        self.client = ServiceClient(self.url, timeout=POLL_TIMEOUT, token=token)
+        self.alive = False
+        self.failures = 0
+        self.last_seen = None
+        self.images = set()
+        self.efi = set()
+        self.pending_images = set()     # Images of jobs sent here, on disk soon
+        self.load = 0                   # Active and queued jobs on the station
+        self.capacity = 0
+        self.orphans = []               # Remote ids of jobs moved away while the station was down
+
+    def affinity(self, image, efi):
+        score = 0
+        if image and (image in self.images or image in self.pending_images):
+            score += 1
+        if efi and efi in self.efi:
+            score += 1
+        return score
+
+    def describe(self):
+        return {
+            "url": self.url,
+            "alive": self.alive,
+            "last_seen": self.last_seen,
+            "load": self.load,
+            "capacity": self.capacity,
+            "images": sorted(self.images),
+            "efi": sorted(self.efi),
+        }
+
+
+class Coordinator:
+    """
+    Usage:
+        coordinator = Coordinator(stations=["http://10.0.0.11:8742", "http://10.0.0.12:8742"])
+        server = make_server(coordinator, port=DEFAULT_PORT)
+        coordinator.start()
+        server.serve_forever()
+    """
+
+    def __init__(self, state_dir=None, stations=(), station_token=None, status_callback=None):
+        self.state_dir = state_dir or os.path.join(get_state_dir(), "coordinator")
+        self.station_token = station_token or load_token(create=False)
+        os.makedirs(self.state_dir, exist_ok=True)
+        self.queue = JobQueue(os.path.join(self.state_dir, "jobs.json"))
+        self.status_callback = status_callback
+        self.lock = threading.Lock()
+        self.stations = {}
+        self.running = False
+
+        # Jobs that were placed before a restart are still running on their station
+        for job in self.queue.list(QUEUED):
+            if job.get("remote_id"):
+                self.queue.update(job["id"], status=RUNNING)
+        for url in stations:
+            self.add_station(url)
+
+    def _status(self, text):
+        if self.status_callback:
+            self.status_callback(text)
+
+    def add_station(self, url, token=None):
+        if not url:
+            raise ValueError("A station needs a url")
+        with self.lock:
+            station = self.stations.get(url.rstrip("/"))
+            if station is None:
+                station = Station(url, token or self.station_token)
+                self.stations[station.url] = station
+                if self.running:
+                    self._start_poller(station)
+        return station.describe()
+
+    def start(self):
+        self.running = True
+        with self.lock:
+            for station in self.stations.values():
+                self._start_poller(station)
+        threading.Thread(target=self._dispatch, name="CoordinatorDispatch", daemon=True).start()
+
+    def stop(self):
+        self.running = False
+        self.queue.notify()
+
+    def _start_poller(self, station):
+        threading.Thread(target=self._poll_loop, args=(station,), name=f"Poll-{station.url}", daemon=True).start()
+
+    # --- Job API, same as ProvisionService ---
+
+    def submit(self, spec):
+        stages = spec.get("stages") or DEFAULT_STAGES
+        unknown = [stage for stage in stages if stage not in STAGES]
+        if unknown:
+            raise ValueError(f"Unknown stages: {', '.join(unknown)}")
+        if any(stage in DEVICE_STAGES for stage in stages) and not spec.get("station"):
+            raise ValueError("A job that writes USB sticks must name the station they are plugged into")
+        if spec.get("station"):
+            with self.lock:
+                known = spec["station"].rstrip("/") in self.stations
+            if not known:
+                # choose_station() would skip every station and the job would wait forever
+                raise ValueError(f"{spec['station']} is not a station of this coordinator")
+        spec = dict(spec, stages=list(stages), params=spec.get("params", {}))
+        return self.queue.submit(spec)
+
+    def cancel(self, job_id):
+        job = self.queue.get(job_id)
+        if job is None:
+            return None
+        if job["status"] == QUEUED:
+            self.queue.update(job_id, status=CANCELLED, log="Cancelled")
+        elif job.get("remote_id"):
+            station = self.stations.get(job["station"])
+            if station is None:
+                self.queue.update(job_id, status=CANCELLED, log=f"Cancelled, {job['station']} is no longer a station")
+                return self.queue.get(job_id)
+            try:
+                station.client.cancel(job["remote_id"])
+            except (OSError, ServiceError) as e:
+                self.queue.update(job_id, log=f"Cancel on {job['station']} failed: {e}")
+        return self.queue.get(job_id)
+
+    def status(self):
+        with self.lock:
+            stations = [station.describe() for station in self.stations.values()]
+        return {"stations": stations, "queued": len(self.queue.list(QUEUED))}
+
+    def inventory(self):
+        with self.lock:
+            return {url: station.describe() for url, station in self.stations.items()}
+
+    # --- Placement ---
+
+    def choose_station(self, job):
+        """Best live station with room for `job`, or None."""
+        params = job["spec"]["params"]
+        image, efi = image_key(params), params.get("efi")
+        pinned = job["spec"].get("station")
+        if not pinned and any(stage in DEVICE_STAGES for stage in job["spec"]["stages"]):
+            return None     # Queued before submit() refused these, never guess the machine
+        best, best_score = None, None
+        with self.lock:
+            for station in self.stations.values():
+                if not station.alive or station.load >= station.capacity:
+                    continue
+                if pinned and station.url != pinned.rstrip("/"):
+                    continue
+                score = station.affinity(image, efi) * AFFINITY_WEIGHT - station.load
+                if best is None or score > best_score:
+                    best, best_score = station, score
+        return best
+
+    def _dispatch(self):
+        while self.running:
+            placed = False
+            for job in self.queue.list(QUEUED):
+                station = self.choose_station(job)
+                if station is None:
+                    continue
+                try:
+                    remote = station.client.submit(job["spec"])
+                except (OSError, ServiceError) as e:
+                    if getattr(e, "status", None) == 400:
+                        # The station refused the spec (e.g. a target that is not its stick), it will not change its mind
+                        self.queue.update(job["id"], status=FAILED, error=str(e), log=f"{station.url} refused the job: {e}")
+                    else:
+                        self._status(f"Could not place {job['id']} on {station.url}: {e}")
+                    continue
+                with self.lock:
+                    station.load += 1
+                    image = image_key(job["spec"]["params"])
+                    if image:
+                        station.pending_images.add(image)
+                self.queue.update(job["id"], status=RUNNING, station=station.url, remote_id=remote["id"],
+                                  remote_version=0, placed=time.time(), log=f"Placed on {station.url}")
+                placed = True
+            if not placed:
+                self.queue.wait_for_work(POLL_INTERVAL)
+
+    # --- Station polling ---
+
+    def _poll_loop(self, station):
+        while self.running:
+            start = time.time()
+            try:
+                inventory = station.client.inventory()
+                remote_jobs = {job["id"]: job for job in station.client.jobs()}
+            except (OSError, ServiceError, ValueError) as e:
+                self._poll_failed(station, e)
+            else:
+                self._poll_ok(station, inventory, remote_jobs, start)
+            time.sleep(max(0.0, POLL_INTERVAL - (time.time() - start)))
+
+    def _poll_ok(self, station, inventory, remote_jobs, polled):
+        with self.lock:
+            was_alive = station.alive
+            station.alive = True
+            station.failures = 0
+            station.last_seen = time.time()
+            station.images = set(inventory["images"])
+            station.efi = set(inventory["efi"])
+            station.pending_images -= station.images
+            station.load = inventory["active"] + inventory["queued"]
+            station.capacity = inventory["capacity"]
+            orphans, station.orphans = station.orphans, []
+        if not was_alive:
+            self._status(f"Station {station.url} is up")
+            self.queue.notify()
+        for remote_id in orphans:
+            try:
+                station.client.cancel(remote_id)
+            except (OSError, ServiceError):
+                pass
+
+        for job in self.queue.list(RUNNING):
+            if job.get("station") != station.url:
+                continue
+            remote = remote_jobs.get(job["remote_id"])
+            if remote is None:
+                # Placed after the job list was fetched, or the station lost it (state wiped)
+                if job.get("placed", 0) < polled:
+                    self._requeue(job, f"{station.url} no longer knows the job")
+            elif remote["version"] > job.get("remote_version", 0):
+                fields = {key: remote[key] for key in MIRRORED_FIELDS}
+                # Queued on the station is still placed here: only a finished status comes back,
+                # a QUEUED job with a remote id would be dispatched a second time
+                finished = remote["status"] in FINISHED_STATES
+                self.queue.update(job["id"], persist=finished or remote["stage"] != job["stage"],
+                                  remote_version=remote["version"], status=remote["status"] if finished else RUNNING,
+                                  **fields)
+
+    def _poll_failed(self, station, error):
+        with self.lock:
+            station.failures += 1
+            dropped = station.alive and station.failures >= DEAD_AFTER
+            if dropped:
+                station.alive = False
+                station.pending_images.clear()
+        if not dropped:
+            return
+        self._status(f"Station {station.url} is down ({error}), moving its jobs")
+        for job in self.queue.list(RUNNING):
+            if job.get("station") == station.url:
+                with self.lock:
+                    station.orphans.append(job["remote_id"])
+                self._requeue(job, f"{station.url} went down")
+
+    def _requeue(self, job, reason):
+        if any(stage in DEVICE_STAGES for stage in job["spec"]["stages"]):
+            # Its sticks are on that station, another one would write to whatever it has at those paths
+            self.queue.update(job["id"], status=FAILED, error=reason, progress=None, log=f"{reason}, failed")
+            return
+        self.queue.update(job["id"], status=QUEUED, station=None, remote_id=None, remote_version=0,
+                          stage=None, stage_index=0, progress=None, log=f"{reason}, requeued")
+
+
+def serve(state_dir=None, host="127.0.0.1", port=DEFAULT_PORT, stations=(), station_token=None, token=None,
+          status_callback=None):
+    """Runs the coordinator until interrupted."""
+    coordinator = Coordinator(state_dir, stations, station_token, status_callback=status_callback)
+    # Clients find the token where they find a station's: in the state dir it was started with
+    server = make_server(coordinator, host, port, token=token or load_token(state_dir))
+    coordinator.start()
+    if status_callback:
+        status_callback(f"Coordinator on http://{host}:{server.server_address[1]} for {len(coordinator.stations)} stations")
+    try:
+        server.serve_forever()
+    finally:
+        coordinator.stop()
+        server.server_close()
@@ -0,0 +1,577 @@
+# Service/Daemon.py
+
+"""
+Daemon Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Long running provisioning service. It owns the download engine and the USB
+builder and runs jobs through the production line:
+
+    catalog -> download -> verify -> build_efi -> write_usb -> verify_usb
+
+Each stage has its own concurrency limit (STAGE_LIMITS), so e.g. two
+downloads and four USB writes can be in flight while a fifth stick waits
+for a slot. All jobs share one HTTP session, the bandwidth limiter, the
+recovery catalog and the image store; two jobs that need the same image
+download it once.
+
+Jobs are submitted and watched over a small JSON API, on localhost TCP or
+a Unix socket. Every request carries the install's token (created in
+<state dir>/token on first start) in the X-Hackintoshify-Token header, and
+POST bodies must be sent as application/json. That keeps web pages in the
+user's browser out: they can neither read the token nor send JSON to
+another origin without a CORS preflight, which this server never answers.
+
+    GET  /jobs                     all jobs
+    POST /jobs                     submit a job spec, returns the job
+    GET  /jobs/<id>                one job
+    GET  /jobs/<id>/watch?since=N  long-poll until the job changes past version N
+    POST /jobs/<id>/cancel         cancel a job
+    GET  /status                   stage slots in use
+    GET  /inventory                images and EFI folders this station holds, and its load
+
+A job spec:
+
+    {"stages": ["catalog", "download", "verify", "build_efi", "write_usb"],
+     "params": {"product": "052-78401", "targets": ["/dev/sdb"], "efi_dir": "/srv/EFI",
+                "efi": "z690-aorus",    # instead of efi_dir: a folder in <state dir>/efi
+                "config_overrides": {"Misc/Boot/Timeout": 5},
+                "platform_info": {"serial": "...", "mlb": "..."}}}
+
+Targets must be removable disks of this machine (PrepUSB.removable_devices),
+"dest" a file in the image store and "efi_dir" a folder in <state dir>/efi.
+
+Run it with `python -m hackintoshify serve`.
+"""
+
+import os
+import hmac
+import json
+import time
+import hashlib
+import secrets
+import shutil
+import socket
+import threading
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from Logic.Settings import get_config_dir
+from .JobQueue import JobQueue, QUEUED, DONE, FAILED, CANCELLED
+from .Client import TOKEN_HEADER
+
+STAGES = ("catalog", "download", "verify", "build_efi", "write_usb", "verify_usb")
+DEFAULT_STAGES = ["catalog", "download", "verify", "build_efi", "write_usb"]
+STAGE_LIMITS = {
+    "catalog": 1,
+    "download": 2,
+    "verify": 2,
+    "build_efi": 4,
+    "write_usb": 4,
+    "verify_usb": 4,
+}
+MAX_ACTIVE_JOBS = 16
+DEFAULT_PORT = 8742
+WATCH_TIMEOUT = 30
+CONFIG_PATH = "EFI/OC/config.plist"
+IMAGE_SUFFIX = "_BaseSystem.dmg"
+TOKEN_FILE = "token"
+
+
+def get_state_dir():
+    return os.path.join(get_config_dir(), "service")
+
+
+def load_token(state_dir=None, create=True):
+    """The install's API token from <state dir>/token, created (readable by the owner only) on first use."""
+    path = os.path.join(state_dir or get_state_dir(), TOKEN_FILE)
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        if not create:
+            return None
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    token = secrets.token_urlsafe(32)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(token)
+    return token
+
+
+def _inside(path, folder):
+    path, folder = os.path.realpath(path), os.path.realpath(folder)
+    return os.path.commonpath([path, folder]) == folder and path != folder
+
+
+def image_key(params):
+    """Name of the image a job needs, used for the store file name and for station affinity."""
+    if params.get("product"):
+        return params["product"]
+    if params.get("url"):
+        return "url-" + hashlib.sha1(params["url"].encode()).hexdigest()[:12]
+    return None
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class ProvisionService:
+    """
+    Usage:
+        service = ProvisionService(status_callback=print)
+        server = make_server(service, port=DEFAULT_PORT)
+        service.start()
+        server.serve_forever()
+    """
+
+    def __init__(self, state_dir=None, store_dir=None, limits=None, max_active=MAX_ACTIVE_JOBS,
+                 status_callback=None):
+        self.state_dir = state_dir or get_state_dir()
+        self.store_dir = store_dir or os.path.join(self.state_dir, "images")
+        self.jobs_dir = os.path.join(self.state_dir, "jobs")
+        self.efi_cache_dir = os.path.join(self.state_dir, "efi")
+        os.makedirs(self.store_dir, exist_ok=True)
+        os.makedirs(self.efi_cache_dir, exist_ok=True)
+        os.makedirs(self.jobs_dir, exist_ok=True)
+
+        self.queue = JobQueue(os.path.join(self.state_dir, "jobs.json"))
+        self.limits = dict(STAGE_LIMITS, **(limits or {}))
+        self.slots = {stage: threading.BoundedSemaphore(n) for stage, n in self.limits.items()}
+        self.in_use = {stage: 0 for stage in STAGES}
+        self.max_active = max_active
+        self.status_callback = status_callback
+
+        self.lock = threading.Lock()
+        self.active = {}            # job id -> cancel Event
+        self.user_cancelled = set() # Ids of active jobs whose cancel Event a client set
+        self.artifact_locks = {}    # path -> Lock, so shared artifacts are produced once
+        self.running = False
+        self.shutting_down = False  # Set by stop(): interrupted jobs stay running and resume on the next start
+        self._session = None
+        self._recovery_images = None
+        self.catalog_lock = threading.Lock()    # Only for the recovery catalog, its fetch takes seconds
+
+    def _status(self, text):
+        if self.status_callback:
+            self.status_callback(text)
+
+    # --- Shared resources ---
+
+    @property
+    def session(self):
+        # One connection pool for every job
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+
+    def artifact_lock(self, path):
+        with self.lock:
+            return self.artifact_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+    def recovery_images(self, refresh=False):
+        # Not self.lock: scheduling, cancels and /status must not wait on the network
+        with self.catalog_lock:
+            if self._recovery_images is None or refresh:
+                from GUI_Screens.Functionality.FetchAppleImages import FetchAppleImages
+                self._recovery_images = FetchAppleImages(status_callback=self._status).apple_images
+            return self._recovery_images
+
+    # --- Scheduling ---
+
+    def start(self):
+        self.running = True
+        threading.Thread(target=self._dispatch, name="ProvisionDispatch", daemon=True).start()
+
+    def stop(self):
+        self.running = False
+        self.shutting_down = True
+        with self.lock:
+            for cancel in self.active.values():
+                cancel.set()
+        self.queue.notify()
+
+    def submit(self, spec):
+        stages = spec.get("stages") or DEFAULT_STAGES
+        unknown = [stage for stage in stages if stage not in STAGES]
+        if unknown:
+            raise ValueError(f"Unknown stages: {', '.join(unknown)}")
+        spec = dict(spec, stages=list(stages), params=spec.get("params", {}))
+        self.check_params(spec["params"], stages)
+        return self.queue.submit(spec)
+
+    def check_params(self, params, stages):
+        """Refuses paths a job may not touch. Raises ValueError."""
+        if not isinstance(params, dict):
+            raise ValueError("params must be an object")
+        if "write_usb" in stages or "verify_usb" in stages:
+            from USB_Builder.PrepUSB import removable_devices
+            targets = params.get("targets")
+            if not isinstance(targets, list) or not targets:
+                raise ValueError("No USB targets in the job")
+            removable = {device.lower() for device in removable_devices()}
+            refused = [target for target in targets if not isinstance(target, str) or target.lower() not in removable]
+            if refused:
+                raise ValueError(f"Not a removable disk of this station: {', '.join(map(str, refused))}")
+        if params.get("dest") and not _inside(params["dest"], self.store_dir):
+            raise ValueError(f"dest must be in {self.store_dir}")
+        if params.get("efi_dir") and not _inside(params["efi_dir"], self.efi_cache_dir):
+            raise ValueError(f"efi_dir must be in {self.efi_cache_dir}")
+        if params.get("efi") and not _inside(os.path.join(self.efi_cache_dir, params["efi"]), self.efi_cache_dir):
+            raise ValueError(f"efi must name a folder in {self.efi_cache_dir}")
+
+    def cancel(self, job_id):
+        job = self.queue.get(job_id)
+        if job is None:
+            return None
+        with self.lock:
+            cancel = self.active.get(job_id)
+            if cancel is not None:
+                self.user_cancelled.add(job_id)
+        if cancel is not None:
+            cancel.set()
+        elif job["status"] == QUEUED:
+            self.queue.update(job_id, status=CANCELLED, log="Cancelled")
+        return self.queue.get(job_id)
+
+    def stage_status(self):
+        with self.lock:
+            return {stage: {"in_use": self.in_use[stage], "limit": self.limits[stage]} for stage in STAGES}
+
+    def status(self):
+        return {"stages": self.stage_status(), "active": len(self.active)}
+
+    def inventory(self):
+        """What a coordinator needs to place jobs here: artifacts on disk and current load."""
+        images = sorted(name[:-len(IMAGE_SUFFIX)] for name in os.listdir(self.store_dir) if name.endswith(IMAGE_SUFFIX))
+        efi = sorted(name for name in os.listdir(self.efi_cache_dir)
+                     if os.path.isdir(os.path.join(self.efi_cache_dir, name)))
+        return {
+            "images": images,
+            "efi": efi,
+            "active": len(self.active),
+            "queued": len(self.queue.list(QUEUED)),
+            "capacity": self.max_active,
+        }
+
+    def _dispatch(self):
+        while self.running:
+            with self.lock:
+                has_room = len(self.active) < self.max_active
+            job = self.queue.claim_next(skip=set(self.active)) if has_room else None
+            if job is None:
+                self.queue.wait_for_work(1.0)
+                continue
+            cancel = threading.Event()
+            with self.lock:
+                self.active[job["id"]] = cancel
+            threading.Thread(target=self._run_job, args=(job, cancel), name=f"Job-{job['id']}", daemon=True).start()
+
+    def _run_job(self, job, cancel):
+        job_id = job["id"]
+        artifacts = job["artifacts"]
+        results = job["results"]
+        try:
+            stages = job["spec"]["stages"]
+            for index in range(job["stage_index"], len(stages)):
+                stage = stages[index]
+                self.queue.update(job_id, stage=stage, log=f"Waiting for a {stage} slot")
+                with self.slots[stage]:
+                    if cancel.is_set():
+                        raise JobCancelled()
+                    with self.lock:
+                        self.in_use[stage] += 1
+                    try:
+                        self.queue.update(job_id, log=f"{stage} started")
+                        start = time.time()
+                        result = getattr(self, f"stage_{stage}")(job_id, job["spec"]["params"], artifacts, cancel)
+                    finally:
+                        with self.lock:
+                            self.in_use[stage] -= 1
+                results[stage] = dict(result or {}, elapsed=time.time() - start)
+                self.queue.update(job_id, stage_index=index + 1, artifacts=artifacts, results=results,
+                                  progress=None, log=f"{stage} done in {time.time() - start:.1f}s")
+            self.queue.update(job_id, status=DONE, stage=None, log="Finished")
+        except Exception as e:
+            if cancel.is_set() and self.shutting_down and job_id not in self.user_cancelled:
+                # Not the user's cancel: JobQueue.load() requeues it at this stage
+                self.queue.update(job_id, progress=None, log="Interrupted by service shutdown")
+            elif isinstance(e, JobCancelled) or cancel.is_set():
+                self.queue.update(job_id, status=CANCELLED, log="Cancelled")
+            else:
+                self.queue.update(job_id, status=FAILED, error=str(e), log=f"Error: {e}")
+        finally:
+            with self.lock:
+                self.active.pop(job_id, None)
+                self.user_cancelled.discard(job_id)
+            self.queue.notify()
+
+    def _progress(self, job_id, stage):
+        last = [0.0]
+
+        def report(done, total, *rest):
+            now = time.time()
+            if now - last[0] >= 0.5 or done == total:
+                last[0] = now
+                self.queue.update(job_id, persist=False, progress={"stage": stage, "done": done, "total": total})
+        return report
+
+    def _log(self, job_id):
+        return lambda *parts: self.queue.update(job_id, persist=False, log=" ".join(str(p) for p in parts if p))
+
+    # --- Stages ---
+    # Each takes (job id, params, artifacts, cancel event), fills in artifacts
+    # for the next stages and returns a small result dict.
+
+    def stage_catalog(self, job_id, params, artifacts, cancel):
+        if params.get("url"):
+            artifacts.update(url=params["url"], chunklist_url=params.get("chunklist_url"), product=image_key(params))
+            return {"source": "params"}
+        product = params.get("product")
+        if not product:
+            raise ValueError("A job needs either a product id or a url")
+        image = next((img for img in self.recovery_images() if img["id"] == product), None)
+        if image is None:
+            image = next((img for img in self.recovery_images(refresh=True) if img["id"] == product), None)
+        if image is None:
+            raise ValueError(f"Product {product} is not in the recovery catalog")
+        artifacts.update(url=image["url"], chunklist_url=image.get("chunklist"), product=product)
+        return {"name": image.get("name")}
+
+    def stage_download(self, job_id, params, artifacts, cancel):
+        from Downloader.DownloadImage import ImageDownloader, DownloadCancelled, fetch_bytes
+        from Downloader.DeltaDownload import DeltaDownloader
+        from Downloader.Chunklist import find_images
+
+        product = artifacts.get("product") or image_key(params)
+        dest = params.get("dest") or os.path.join(self.store_dir, product + IMAGE_SUFFIX)
+        chunklist_path = os.path.splitext(dest)[0] + ".chunklist"
+        artifacts.update(image=dest, chunklist=chunklist_path if artifacts.get("chunklist_url") else None)
+
+        with self.artifact_lock(dest):
+            if os.path.exists(dest) and (not artifacts["chunklist"] or os.path.exists(chunklist_path)):
+                return {"cached": True}
+            try:
+                if artifacts.get("chunklist_url") and find_images(self.store_dir):
+                    report = DeltaDownloader(artifacts["url"], artifacts["chunklist_url"], dest, self.store_dir,
+                                             session=self.session, cancel_event=cancel,
+                                             status_callback=self._log(job_id),
+                                             progress_callback=self._progress(job_id, "download")).run()
+                    return {"cached": False, "delta": report}
+                ImageDownloader(artifacts["url"], dest, session=self.session, cancel_event=cancel,
+                                status_callback=self._log(job_id),
+                                progress_callback=self._progress(job_id, "download")).run()
+            except DownloadCancelled:
+                raise JobCancelled()
+            if artifacts["chunklist"]:
+                chunklist = fetch_bytes(artifacts["chunklist_url"])
+                with open(chunklist_path, "wb") as f:
+                    f.write(chunklist)
+        return {"cached": False}
+
+    def stage_verify(self, job_id, params, artifacts, cancel):
+        from Downloader.Chunklist import verify
+        if not artifacts.get("chunklist"):
+            return {"skipped": "no chunklist"}
+        result = verify(artifacts["image"], artifacts["chunklist"])
+        if not result["ok"]:
+            # A bad cached image must not poison later jobs
+            os.remove(artifacts["image"])
+            raise IOError(f"{artifacts['image']} failed chunklist verification ({len(result['bad_chunks'])} bad chunks)")
+        return {"throughput": result["throughput"]}
+
+    def stage_build_efi(self, job_id, params, artifacts, cancel):
+        efi_dir = params.get("efi_dir")
+        if params.get("efi"):
+            efi_dir = os.path.join(self.efi_cache_dir, params["efi"])
+            if not os.path.isdir(efi_dir):
+                raise ValueError(f"EFI {params['efi']} is not in {self.efi_cache_dir}")
+        if not efi_dir:
+            artifacts["efi_dir"] = None
+            return {"skipped": "no efi_dir"}
+        overrides = params.get("config_overrides")
+        platform_info = params.get("platform_info")
+        if not overrides and not platform_info:
+            artifacts["efi_dir"] = efi_dir
+            return {"copied": False}
+
+        from Building.BuildConfiguration import apply_overrides, set_platform_info
+        job_efi = os.path.join(self.jobs_dir, job_id, "EFI")
+        if os.path.exists(job_efi):
+            shutil.rmtree(job_efi)
+        shutil.copytree(efi_dir, job_efi)
+        config_path = os.path.join(os.path.dirname(job_efi), CONFIG_PATH)
+        with open(config_path, "rb") as f:
+            config = f.read()
+        if overrides:
+            config = apply_overrides(config, overrides)
+        if platform_info:
+            config = set_platform_info(config, **platform_info)
+        with open(config_path, "wb") as f:
+            f.write(config)
+        artifacts["efi_dir"] = job_efi
+        return {"copied": True}
+
+    def stage_write_usb(self, job_id, params, artifacts, cancel):
+        from USB_Builder.BuildUSB import BuildUSB
+        targets = params.get("targets")
+        if not targets:
+            raise ValueError("No USB targets in the job")
+        progress = self._progress(job_id, "write_usb")
+        builder = BuildUSB(targets, label=params.get("label", "OPENCORE"), partition=params.get("partition", True),
+                           verify=params.get("verify", True), disk_size=params.get("disk_size"),
+                           status_callback=self._log(job_id),
+                           progress_callback=lambda target, done, total: progress(done, total))
+        builder.add_installer(artifacts.get("efi_dir"), artifacts["image"], artifacts.get("chunklist"))
+        results = builder.run()
+
+        regions_path = os.path.join(self.jobs_dir, job_id, "regions.json")
+        os.makedirs(os.path.dirname(regions_path), exist_ok=True)
+        with open(regions_path, "w") as f:
+            json.dump(builder.regions, f)
+        artifacts["regions"] = regions_path
+
+        failed = [r for r in results if not r["ok"]]
+        if failed:
+            raise IOError("; ".join(f"{r['target']}: {r['error'] or 'verification failed'}" for r in failed))
+        return {"targets": [{"target": r["target"], "written": r["written"]} for r in results]}
+
+    def stage_verify_usb(self, job_id, params, artifacts, cancel):
+        from USB_Builder.VerifyUSB import verify_regions
+        if not artifacts.get("regions"):
+            raise ValueError("verify_usb needs a write_usb stage before it")
+        with open(artifacts["regions"], "r") as f:
+            regions = [tuple(region) for region in json.load(f)]
+        results = {}
+        for target in params["targets"]:
+            result = verify_regions(target, regions, status_callback=self._log(job_id))
+            results[target] = result["ok"]
+            if not result["ok"]:
+                raise IOError(f"{target}: {len(result['mismatches'])} regions do not match")
+        return {"targets": results}
+
+
+def _make_handler(service, token):
+    expected = token.encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def address_string(self):
+            return str(self.client_address[0]) if self.client_address else "unix"
+
+        def _send(self, code, payload):
+            body = json.dumps(payload, default=str).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _body(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                raise ValueError("The body is not valid JSON")
+            if not isinstance(body, dict):
+                raise ValueError("The body must be a JSON object")
+            return body
+
+        def _authorized(self):
+            if hmac.compare_digest(self.headers.get(TOKEN_HEADER, "").encode(), expected):
+                return True
+            self.close_connection = True
+            self._send(401, {"error": f"missing or wrong {TOKEN_HEADER}"})
+            return False
+
+        def do_GET(self):
+            if not self._authorized():
+                return
+            url = urlparse(self.path)
+            parts = [p for p in url.path.split("/") if p]
+            query = parse_qs(url.query)
+            if parts == ["jobs"]:
+                return self._send(200, service.queue.list(query.get("status", [None])[0]))
+            if parts == ["status"]:
+                return self._send(200, service.status())
+            if parts == ["inventory"]:
+                return self._send(200, service.inventory())
+            if len(parts) == 2 and parts[0] == "jobs":
+                job = service.queue.get(parts[1])
+                return self._send(200, job) if job else self._send(404, {"error": "no such job"})
+            if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "watch":
+                try:
+                    since = int(query.get("since", ["0"])[0])
+                    timeout = min(float(query.get("timeout", [WATCH_TIMEOUT])[0]), WATCH_TIMEOUT)
+                except ValueError:
+                    return self._send(400, {"error": "since must be an integer and timeout a number"})
+                job = service.queue.wait_change(parts[1], since, timeout)
+                return self._send(200, job) if job else self._send(404, {"error": "no such job"})
+            self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            if not self._authorized():
+                return
+            # Anything else is a "simple" request a browser sends cross-origin without asking
+            content_type = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+            if content_type != "application/json":
+                self.close_connection = True
+                return self._send(415, {"error": "POST bodies must be application/json"})
+            parts = [p for p in urlparse(self.path).path.split("/") if p]
+            try:
+                if parts == ["jobs"]:
+                    return self._send(201, service.submit(self._body()))
+                if parts == ["stations"] and hasattr(service, "add_station"):
+                    body = self._body()
+                    return self._send(201, service.add_station(body.get("url", ""), body.get("token")))
+                if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "cancel":
+                    job = service.cancel(parts[1])
+                    return self._send(200, job) if job else self._send(404, {"error": "no such job"})
+            except ValueError as e:
+                return self._send(400, {"error": str(e)})
+            self._send(404, {"error": "not found"})
+
+    return Handler
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(service, host="127.0.0.1", port=DEFAULT_PORT, socket_path=None, token=None):
+    """HTTP server for the API, on TCP or (when `socket_path` is set) a Unix socket."""
+    handler = _make_handler(service, token or load_token(service.state_dir))
+    if socket_path:
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("Unix sockets are not available on this platform")
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, handler)
+        os.chmod(socket_path, 0o600)
+        return server
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def serve(state_dir=None, host="127.0.0.1", port=DEFAULT_PORT, socket_path=None, limits=None, token=None,
+          status_callback=None):
+    """Runs the service until interrupted."""
+    service = ProvisionService(state_dir, limits=limits, status_callback=status_callback)
+    server = make_server(service, host, port, socket_path, token)
+    service.start()
+    if status_callback:
+        status_callback(f"Provisioning service on {socket_path or f'http://{host}:{server.server_address[1]}'}")
+    try:
+        server.serve_forever()
+    finally:
+        service.stop()
+        server.server_close()
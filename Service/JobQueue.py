@@ -0,0 +1,145 @@
+# Service/JobQueue.py
+
+"""
+JobQueue Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Persistent job list for the provisioning service. Jobs live in memory and
+are written to a JSON file (atomically, through a .tmp file) whenever
+their state changes; progress updates stay in memory only. Every change
+bumps the job's "version", which is what API clients long-poll on.
+
+A job that was running when the service stopped goes back to "queued" on
+the next start and continues at the stage it was in.
+"""
+
+import os
+import json
+import time
+import uuid
+import threading
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+LOG_LINES = 50      # Status lines kept per job
+
+
+class JobQueue:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.RLock()
+        self.changed = threading.Condition(self.lock)
+        self.jobs = {}
+        self.order = []     # Job ids in submission order
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                jobs = json.load(f)
+        except (OSError, ValueError):
+            return
+        for job in jobs:
+            if job["status"] == RUNNING:
+                job["status"] = QUEUED
+                job["log"].append("Service restarted, resuming")
+            self.jobs[job["id"]] = job
+            self.order.append(job["id"])
+
+    def _save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump([self.jobs[job_id] for job_id in self.order], f, indent=2, default=str)
+        os.replace(tmp, self.path)
+
+    def submit(self, spec):
+        now = time.time()
+        job = {
+            "id": uuid.uuid4().hex[:12],
+            "spec": spec,
+            "status": QUEUED,
+            "stage": None,
+            "stage_index": 0,
+            "progress": None,
+            "artifacts": {},
+            "results": {},
+            "error": None,
+            "log": [],
+            "created": now,
+            "updated": now,
+            "version": 1,
+        }
+        with self.lock:
+            self.jobs[job["id"]] = job
+            self.order.append(job["id"])
+            self._save()
+            self.changed.notify_all()
+        return dict(job)
+
+    def get(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return json.loads(json.dumps(job, default=str)) if job else None
+
+    def list(self, status=None):
+        with self.lock:
+            return [self.get(job_id) for job_id in self.order
+                    if status is None or self.jobs[job_id]["status"] == status]
+
+    def update(self, job_id, persist=True, log=None, **fields):
+        """
+        Changes fields of a job. `log` is a line to append, or a list that
+        replaces the log. `persist=False` is for progress, which is not worth
+        a disk write.
+        """
+        with self.lock:
+            job = self.jobs[job_id]
+            job.update(fields)
+            if isinstance(log, list):
+                job["log"] = log[-LOG_LINES:]
+            elif log:
+                job["log"] = (job["log"] + [log])[-LOG_LINES:]
+            job["updated"] = time.time()
+            job["version"] += 1
+            if persist:
+                self._save()
+            self.changed.notify_all()
+
+    def claim_next(self, skip=()):
+        """Oldest queued job not in `skip`, marked running. None when there is none."""
+        with self.lock:
+            for job_id in self.order:
+                job = self.jobs[job_id]
+                if job["status"] == QUEUED and job_id not in skip:
+                    self.update(job_id, status=RUNNING)
+                    return self.get(job_id)
+            return None
+
+    def wait_change(self, job_id, since, timeout):
+        """Blocks until the job's version is past `since` (or timeout). Returns the job."""
+        deadline = time.time() + timeout
+        with self.lock:
+            while True:
+                job = self.jobs.get(job_id)
+                if job is None or job["version"] > since:
+                    return self.get(job_id)
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return self.get(job_id)
+                self.changed.wait(remaining)
+
+    def wait_for_work(self, timeout):
+        with self.lock:
+            self.changed.wait(timeout)
+
+    def notify(self):
+        with self.lock:
+            self.changed.notify_all()
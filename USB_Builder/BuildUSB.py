@@ -0,0 +1,327 @@
+# USB_Builder/BuildUSB.py
+
+"""
+BuildUSB Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Writes one installer to one or many sticks at once. The source (a FAT32
+volume laid out by FormatUSB, or a raw image file) is produced exactly
+once into a bounded ring of buffers. Every target has its own writer
+thread reading from the ring, so a slow stick only holds the others back
+once it falls a full ring behind. Each target gets its own progress,
+result and read-back verification.
+"""
+
+import os
+import time
+import threading
+
+from .FormatUSB import Fat32Image, SequentialWriter, open_target, write_at, RECOVERY_DIR, SECTOR_SIZE
+from .PrepUSB import prepare_usb, esp_bounds
+from .VerifyUSB import RegionHasher, verify_regions
+
+RING_DEPTH = 16                 # Buffers in flight between the source and the slowest target
+RING_BLOCK = 8 * 1024 * 1024    # Size of each buffer
+
+
+class AllTargetsFailed(Exception):
+    pass
+
+
+class BufferRing:
+    """
+    Single producer, many consumers. A slot is only reused once every
+    attached consumer has released it, which bounds memory to
+    depth * block size no matter how far apart the targets drift.
+    """
+
+    def __init__(self, consumers, depth=RING_DEPTH):
+        self.depth = depth
+        self.slots = [None] * depth
+        self.head = 0                                   # Sequence number of the next put
+        self.tails = {consumer: 0 for consumer in consumers}  # Next sequence each consumer reads
+        self.closed = False
+        self.error = None                               # Why the producer gave up, set by abort()
+        self.cond = threading.Condition()
+
+    def put(self, item):
+        with self.cond:
+            while self.tails and self.head - min(self.tails.values()) >= self.depth:
+                self.cond.wait()
+            if not self.tails:
+                return False  # Every consumer failed, no point producing more
+            self.slots[self.head % self.depth] = item
+            self.head += 1
+            self.cond.notify_all()
+            return True
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+    def abort(self, error):
+        """Ends the stream as a failure: every get() raises instead of reporting a clean end."""
+        with self.cond:
+            self.error = error
+            self.closed = True
+            self.cond.notify_all()
+
+    def get(self, consumer):
+        """Next item for `consumer`, or None once the producer closed the ring. Raises IOError once it aborted."""
+        with self.cond:
+            while self.tails[consumer] == self.head and not self.closed:
+                self.cond.wait()
+            if self.error is not None:
+                raise IOError(f"Aborted, {self.error}")
+            if self.tails[consumer] == self.head:
+                return None
+            return self.slots[self.tails[consumer] % self.depth]
+
+    def release(self, consumer):
+        with self.cond:
+            self.tails[consumer] += 1
+            self.cond.notify_all()
+
+    def detach(self, consumer):
+        """Drops a failed consumer so it no longer holds slots."""
+        with self.cond:
+            self.tails.pop(consumer, None)
+            self.cond.notify_all()
+
+
+class TargetWriter(threading.Thread):
+    """Writes the ring's blocks to one target, then optionally verifies it."""
+
+    def __init__(self, index, target, ring, builder):
+        super().__init__(name=f"BuildUSB-{index}", daemon=True)
+        self.index = index
+        self.target = target
+        self.ring = ring
+        self.builder = builder
+        self.result = {
+            "target": target,
+            "ok": False,
+            "error": None,
+            "written": 0,
+            "elapsed": 0.0,
+            "prepare": None,
+            "verify": None,
+        }
+
+    def run(self):
+        start = time.time()
+        fd = None
+        try:
+            if self.builder.partition:
+                self.result["prepare"] = prepare_usb(
+                    self.target, size=self.builder.disk_size, esp_size=self.builder.esp_size,
+                    status_callback=lambda text: self.builder._status(self.target, text),
+                )
+            fd, _ = open_target(self.target, self.builder.disk_size)
+            while True:
+                item = self.ring.get(self.index)
+                if item is None:
+                    break
+                offset, data = item
+                write_at(fd, offset, data)
+                self.ring.release(self.index)
+                self.result["written"] += len(data)
+                self.builder._progress(self.target, self.result["written"])
+            for offset, data in self.builder.overlays.get(self.target, ()):
+                write_at(fd, offset, data)
+            os.fsync(fd)
+            os.close(fd)
+            fd = None
+            self.result["ok"] = True
+        except Exception as e:
+            self.ring.detach(self.index)
+            self.result["error"] = str(e)
+            self.builder._status(self.target, f"Error: {e}")
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+        if self.result["ok"] and self.builder.verify:
+            regions = self.builder.target_regions.get(self.target, self.builder.regions)
+            verify = verify_regions(self.target, regions,
+                                    status_callback=lambda text: self.builder._status(self.target, text))
+            self.result["verify"] = verify
+            self.result["ok"] = verify["ok"]
+
+        self.result["elapsed"] = time.time() - start
+
+
+class BuildUSB:
+    """
+    Builds identical installer sticks on every target.
+
+    Usage:
+        builder = BuildUSB(["/dev/sdb", "/dev/sdc"], status_callback=print)
+        builder.add_installer(efi_dir, "BaseSystem.dmg", "BaseSystem.chunklist")
+        results = builder.run()
+
+    Or, to clone a raw image instead of building a volume:
+        results = BuildUSB(targets).run_image("disk.img")
+
+    Or, for a batch where only config.plist differs per stick:
+        results = BuildUSB(targets).run_golden(golden, {target: config_bytes, ...})
+
+    `status_callback(target, text)` and `progress_callback(target, written, total)`
+    are called from the writer threads, so GUI code should forward them through signals.
+    """
+
+    def __init__(self, targets, label="OPENCORE", partition=True, verify=True, disk_size=None,
+                 depth=RING_DEPTH, status_callback=None, progress_callback=None):
+        if not targets:
+            raise ValueError("No targets given")
+        self.targets = list(targets)
+        self.label = label
+        self.partition = partition
+        self.verify = verify
+        self.disk_size = disk_size  # Size for image-file targets that do not exist yet
+        self.depth = depth
+        self.status_callback = status_callback
+        self.progress_callback = progress_callback
+
+        self.image = None
+        self.esp_offset = 0
+        self.esp_size = None
+        self.total = 0
+        self.regions = []
+        self.overlays = {}        # target -> [(offset, bytes)] applied after the shared stream
+        self.target_regions = {}  # target -> regions to verify, when they differ from self.regions
+
+    def _status(self, target, text):
+        if self.status_callback:
+            self.status_callback(target, text)
+
+    def _progress(self, target, written):
+        if self.progress_callback:
+            self.progress_callback(target, written, self.total)
+
+    def add_installer(self, efi_dir, base_system, chunklist=None):
+        """Lays out EFI/ and com.apple.recovery.boot/ like FormatUSB.build_installer_volume."""
+        self.image = Fat32Image(None, label=self.label)
+        if efi_dir:
+            self.image.add_tree(efi_dir, "EFI")
+        self.image.add_file(f"{RECOVERY_DIR}/BaseSystem.dmg", base_system)
+        if chunklist:
+            self.image.add_file(f"{RECOVERY_DIR}/BaseSystem.chunklist", chunklist)
+        return self.image
+
+    def _smallest_target(self):
+        sizes = []
+        for target in self.targets:
+            fd, size = open_target(target, self.disk_size)
+            os.close(fd)
+            sizes.append(size)
+        return min(sizes)
+
+    def _plan_volume(self):
+        """Every target gets the same ESP, sized for the smallest stick."""
+        disk = self._smallest_target()
+        if self.partition:
+            first, last = esp_bounds(disk // SECTOR_SIZE)
+            self.esp_offset = first * SECTOR_SIZE
+            self.esp_size = (last - first + 1) * SECTOR_SIZE
+        else:
+            self.esp_offset, self.esp_size = 0, disk
+        self.image.offset = self.esp_offset
+        self.image.plan(self.esp_size)
+        self.total = self.image.stream_size
+
+    def _run(self, produce):
+        start = time.time()
+        ring = BufferRing(range(len(self.targets)), self.depth)
+        writers = [TargetWriter(i, target, ring, self) for i, target in enumerate(self.targets)]
+        hasher = RegionHasher() if self.verify else None
+        for writer in writers:
+            writer.start()
+
+        try:
+            produce(ring, hasher)
+        except AllTargetsFailed:
+            pass
+        except BaseException as e:
+            # A cut-off stream must not look finished, or the writers would report a half stick as OK
+            ring.abort(f"the source failed: {e}")
+            for writer in writers:
+                writer.join()
+            raise
+        # Regions must be in place before the writers see the end of the stream
+        if hasher:
+            self.regions = hasher.finish()
+        ring.close()
+
+        for writer in writers:
+            writer.join()
+
+        results = [writer.result for writer in writers]
+        ok = sum(1 for r in results if r["ok"])
+        self._status(None, f"{ok}/{len(results)} targets OK in {time.time() - start:.2f}s")
+        return results
+
+    def run(self):
+        """Builds the FAT32 installer volume once and streams it to every target."""
+        if self.image is None:
+            raise ValueError("Nothing to write, call add_installer() first")
+        self._plan_volume()
+
+        def produce(ring, hasher):
+            def sink(offset, data):
+                if not ring.put((offset, data)):
+                    raise AllTargetsFailed()
+            writer = SequentialWriter(None, self.esp_offset, block_size=RING_BLOCK, hasher=hasher, sink=sink)
+            self.image.write_to(writer)
+
+        return self._run(produce)
+
+    def run_image(self, source, offset=0):
+        """Copies a raw image file to every target, reading it only once."""
+        self.partition = False
+        return self._run_file(source, offset, os.path.getsize(source))
+
+    def run_golden(self, golden, unit_configs):
+        """
+        Writes a GoldenImage to every target, then each target's own overlay.
+        `unit_configs` maps target -> config.plist bytes for that unit
+        (see Building.BuildConfiguration); targets without one get the golden config.
+        """
+        golden.ensure()
+        self.partition = True
+        self.esp_offset = esp_bounds(self._smallest_target() // SECTOR_SIZE, golden.volume_size)[0] * SECTOR_SIZE
+        self.esp_size = golden.volume_size
+
+        for target in self.targets:
+            config = unit_configs.get(target)
+            if config is None:
+                continue
+            overlay = golden.overlay(config)
+            self.overlays[target] = [(offset + self.esp_offset, data) for offset, data in overlay]
+            if self.verify:
+                self.target_regions[target] = golden.unit_regions(overlay, base=self.esp_offset)
+
+        return self._run_file(golden.image_path, self.esp_offset, golden.stream_size)
+
+    def _run_file(self, source, offset, length):
+        """Streams the first `length` bytes of `source` to `offset` on every target."""
+        self.total = length
+
+        def produce(ring, hasher):
+            position = offset
+            remaining = length
+            with open(source, "rb", buffering=0) as src:
+                while remaining > 0:
+                    data = src.read(min(RING_BLOCK, remaining))
+                    if not data:
+                        raise IOError(f"{source} ended {remaining} bytes short of {length}")
+                    remaining -= len(data)
+                    if hasher:
+                        hasher.update(position, data)
+                    if not ring.put((position, data)):
+                        raise AllTargetsFailed()
+                    position += len(data)
+
+        return self._run(produce)
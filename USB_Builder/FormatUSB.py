@@ -0,0 +1,772 @@
+# USB_Builder/FormatUSB.py
+
+"""
+FormatUSB Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Builds a FAT32 volume in-process instead of mounting the stick and copying
+through the OS. The boot sector, FSInfo, both FATs and every directory are
+laid out here, and every file gets one contiguous cluster run so the whole
+data region is written front-to-back in large sequential writes.
+
+The target can be a block device (/dev/sdX, \\\\.\\PhysicalDriveN) or a plain
+image file, so it works without root and can be checked on Linux.
+"""
+
+import os
+import stat
+import time
+import struct
+from array import array
+
+# Geometry
+SECTOR_SIZE = 512
+RESERVED_SECTORS = 32
+NUM_FATS = 2
+ROOT_CLUSTER = 2
+FSINFO_SECTOR = 1
+BACKUP_BOOT_SECTOR = 6
+DATA_ALIGNMENT = 1024 * 1024  # Flash erase blocks are happiest with 1 MiB alignment
+MIN_CLUSTERS = 65525  # Anything below this is FAT16 by definition
+MAX_CLUSTERS = 0x0FFFFFF5
+
+# FAT entries
+FAT_MEDIA = 0x0FFFFFF8
+FAT_EOC = 0x0FFFFFFF
+
+# Directory entry attributes
+ATTR_READ_ONLY = 0x01
+ATTR_HIDDEN = 0x02
+ATTR_SYSTEM = 0x04
+ATTR_VOLUME_ID = 0x08
+ATTR_DIRECTORY = 0x10
+ATTR_ARCHIVE = 0x20
+ATTR_LFN = 0x0F
+
+DIR_ENTRY_SIZE = 32
+LFN_CHARS_PER_ENTRY = 13
+
+WRITE_BLOCK = 8 * 1024 * 1024  # Size of each sequential write
+READ_BLOCK = 8 * 1024 * 1024
+
+# Characters allowed in a short (8.3) name besides A-Z and 0-9
+SHORT_NAME_EXTRA = set("$%'-_@~`!(){}^#&")
+
+# Usual OpenCore installer layout
+RECOVERY_DIR = "com.apple.recovery.boot"
+
+
+def default_cluster_size(volume_bytes):
+    """Cluster size Microsoft's formatter picks for a FAT32 volume of this size."""
+    gib = 1024 ** 3
+    if volume_bytes <= 8 * gib:
+        size = 4096
+    elif volume_bytes <= 16 * gib:
+        size = 8192
+    elif volume_bytes <= 32 * gib:
+        size = 16384
+    else:
+        size = 32768
+    # Small volumes (test images, tiny sticks) need smaller clusters to stay FAT32.
+    # The margin covers the space taken by the reserved area and the FATs.
+    while size > SECTOR_SIZE and volume_bytes // size < MIN_CLUSTERS * 9 // 8:
+        size //= 2
+    return size
+
+
+def fat_timestamp(epoch):
+    """Returns (date, time) words in FAT format for a unix timestamp."""
+    t = time.localtime(epoch)
+    year = min(max(t.tm_year, 1980), 2107)
+    fat_date = ((year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    fat_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    return fat_date, fat_time
+
+
+def lfn_checksum(short_name):
+    """Checksum of the 11 byte short name, stored in every LFN entry."""
+    total = 0
+    for byte in short_name:
+        total = (((total & 1) << 7) + (total >> 1) + byte) & 0xFF
+    return total
+
+
+def get_target_size(fd):
+    """Size in bytes of an open device or image file."""
+    st = os.fstat(fd)
+    if stat.S_ISREG(st.st_mode):
+        return st.st_size
+    # Block devices report 0 in st_size, seeking to the end works everywhere
+    size = os.lseek(fd, 0, os.SEEK_END)
+    os.lseek(fd, 0, os.SEEK_SET)
+    return size
+
+
+def open_target(target, size=None):
+    """
+    Opens a device or image file for writing and returns (fd, size).
+    Image files are created (sparse) when they do not exist yet.
+    """
+    flags = os.O_RDWR | getattr(os, "O_BINARY", 0)
+    exists = os.path.exists(target)
+    if not exists:
+        if size is None:
+            raise ValueError(f"{target} does not exist and no image size was given")
+        flags |= os.O_CREAT
+
+    fd = os.open(target, flags, 0o644)
+    try:
+        current = get_target_size(fd)
+        if stat.S_ISREG(os.fstat(fd).st_mode) and size is not None and current < size:
+            os.ftruncate(fd, size)
+            current = size
+    except Exception:
+        os.close(fd)
+        raise
+    return fd, current
+
+
+def write_at(fd, offset, data):
+    """Writes all of `data` at `offset`. lseek + write since Windows has no pwrite."""
+    os.lseek(fd, offset, os.SEEK_SET)
+    view = memoryview(data)
+    while len(view):
+        view = view[os.write(fd, view):]
+
+
+class SequentialWriter:
+    """
+    Collects writes to ascending offsets and flushes them as large blocks.
+    Gaps between writes are filled with zeros so the stream stays sequential.
+    Blocks go to `fd`, or to `sink(offset, data)` when one is given.
+    """
+
+    def __init__(self, fd, start_offset, block_size=WRITE_BLOCK, progress_callback=None, total=0,
+                 hasher=None, sink=None):
+        self.fd = fd
+        self.sink = sink
+        self.offset = start_offset  # Offset of the first byte in self.buffer
+        self.block_size = block_size
+        self.buffer = bytearray()
+        self.progress_callback = progress_callback
+        self.total = total
+        self.hasher = hasher  # VerifyUSB.RegionHasher, sees every byte as it goes out
+        self.written = 0
+
+    @property
+    def position(self):
+        return self.offset + len(self.buffer)
+
+    def seek_forward(self, offset):
+        if offset < self.position:
+            raise ValueError("SequentialWriter can only move forward")
+        self.write(bytes(offset - self.position))
+
+    def write(self, data):
+        view = memoryview(data)
+        while len(view):
+            room = self.block_size - len(self.buffer)
+            self.buffer += view[:room]
+            view = view[room:]
+            if len(self.buffer) >= self.block_size:
+                self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        if self.hasher:
+            self.hasher.update(self.offset, self.buffer)
+        if self.sink:
+            self.sink(self.offset, bytes(self.buffer))
+        else:
+            write_at(self.fd, self.offset, self.buffer)
+        self.written += len(self.buffer)
+        self.offset += len(self.buffer)
+        self.buffer = bytearray()
+        if self.progress_callback:
+            self.progress_callback(self.written, self.total)
+
+
+class FatNode:
+    """A file or directory inside the volume being built."""
+
+    def __init__(self, name, is_dir, parent=None, source=None, data=None, mtime=None, reserve=0,
+                 stream=None, size=0):
+        self.name = name
+        self.is_dir = is_dir
+        self.parent = parent
+        self.source = source  # Path of the file on disk to copy from
+        self.data = data      # Or raw bytes
+        self.stream = stream  # Or an object whose read(n) blocks until data is available
+        self.reserve = reserve  # Extra bytes allocated so the file can grow in place (see patch_file)
+        self.mtime = mtime if mtime is not None else time.time()
+        self.children = []
+        self.short_name = None
+        self.needs_lfn = False
+        self.first_cluster = 0
+        self.cluster_count = 0  # Clusters allocated, including the reserve
+        self.used_clusters = 0  # Clusters in the FAT chain
+        self.size = size
+
+    def child(self, name):
+        lowered = name.lower()
+        for node in self.children:
+            if node.name.lower() == lowered:
+                return node
+        return None
+
+    def path(self):
+        parts = []
+        node = self
+        while node.parent is not None:
+            parts.append(node.name)
+            node = node.parent
+        return "/".join(reversed(parts))
+
+
+class Fat32Image:
+    """
+    Lays out a FAT32 volume on a device or image file.
+
+    Usage:
+        image = Fat32Image("usb.img", size=2 * 1024**3, label="OPENCORE")
+        image.add_tree("/path/to/EFI", "EFI")
+        image.add_file("com.apple.recovery.boot/BaseSystem.dmg", "BaseSystem.dmg")
+        image.build()
+
+    `offset` is where the volume starts on the target (the ESP start when the
+    target is partitioned), `size` is the volume size in bytes. Pass a
+    VerifyUSB.RegionHasher as `hasher` to get region hashes of everything
+    written, for read-back verification. Fixing `volume_id` and `timestamp`
+    makes the output byte-for-byte reproducible.
+    """
+
+    def __init__(self, target, size=None, offset=0, label="HACKINTOSH", cluster_size=None,
+                 volume_id=None, status_callback=None, progress_callback=None, hasher=None,
+                 timestamp=None):
+        self.target = target
+        self.size = size
+        self.offset = offset
+        self.label = label
+        self.cluster_size = cluster_size
+        self.timestamp = timestamp if timestamp is not None else time.time()  # Used for directories
+        self.volume_id = volume_id if volume_id is not None else int(self.timestamp) & 0xFFFFFFFF
+        self.status_callback = status_callback
+        self.progress_callback = progress_callback
+        self.hasher = hasher
+
+        self.root = FatNode("", True, mtime=self.timestamp)
+        self.layout = None
+
+    # --- Building the tree ---
+
+    def _status(self, text):
+        if self.status_callback:
+            self.status_callback(text)
+
+    def _split(self, path):
+        parts = [p for p in path.replace("\\", "/").split("/") if p]
+        if not parts:
+            raise ValueError("Empty path")
+        for part in parts:
+            if part in (".", "..") or any(c in part for c in '"*:<>?|') or len(part) > 255:
+                raise ValueError(f"Invalid FAT name: {part!r}")
+        return parts
+
+    def add_directory(self, path):
+        node = self.root
+        for part in self._split(path):
+            existing = node.child(part)
+            if existing is None:
+                existing = FatNode(part, True, parent=node, mtime=self.timestamp)
+                node.children.append(existing)
+            elif not existing.is_dir:
+                raise ValueError(f"{existing.path()} is a file")
+            node = existing
+        return node
+
+    def _add_leaf(self, path, **kwargs):
+        parts = self._split(path)
+        parent = self.add_directory("/".join(parts[:-1])) if len(parts) > 1 else self.root
+        if parent.child(parts[-1]) is not None:
+            raise ValueError(f"{path} already exists in the image")
+        node = FatNode(parts[-1], False, parent=parent, **kwargs)
+        parent.children.append(node)
+        return node
+
+    def add_file(self, path, source, reserve=0):
+        """Copies `source` from disk into the image at `path`."""
+        return self._add_leaf(path, source=source, mtime=os.path.getmtime(source), reserve=reserve)
+
+    def add_bytes(self, path, data, mtime=None, reserve=0):
+        """Stores `data` in the image at `path`."""
+        return self._add_leaf(path, data=bytes(data), mtime=mtime if mtime is not None else self.timestamp,
+                              reserve=reserve)
+
+    def add_stream(self, path, size, stream, mtime=None):
+        """
+        Reserves `size` bytes at `path` whose contents are pulled from
+        `stream.read(n)` while the volume is written. Used to write a file
+        that is still downloading.
+        """
+        return self._add_leaf(path, stream=stream, size=size,
+                              mtime=mtime if mtime is not None else self.timestamp)
+
+    def find(self, path):
+        """Node at `path`, or None."""
+        node = self.root
+        for part in self._split(path):
+            node = node.child(part)
+            if node is None:
+                return None
+        return node
+
+    def add_tree(self, source_dir, dest_dir):
+        """Adds a directory from disk recursively, e.g. an OpenCore EFI folder."""
+        self.add_directory(dest_dir)
+        for dirpath, dirnames, filenames in os.walk(source_dir):
+            dirnames.sort()
+            rel = os.path.relpath(dirpath, source_dir)
+            base = dest_dir if rel == "." else f"{dest_dir}/{rel}"
+            for dirname in dirnames:
+                self.add_directory(f"{base}/{dirname}")
+            for filename in sorted(filenames):
+                self.add_file(f"{base}/{filename}", os.path.join(dirpath, filename))
+
+    # --- Geometry ---
+
+    def _compute_geometry(self, volume_bytes):
+        cluster_size = self.cluster_size or default_cluster_size(volume_bytes)
+        if cluster_size % SECTOR_SIZE or cluster_size > 65536 or cluster_size & (cluster_size - 1):
+            raise ValueError(f"Invalid cluster size: {cluster_size}")
+        sectors_per_cluster = cluster_size // SECTOR_SIZE
+        total_sectors = volume_bytes // SECTOR_SIZE
+        if total_sectors > 0xFFFFFFFF:
+            raise ValueError("Volume too large for FAT32")
+
+        # FAT size formula from the Microsoft FAT specification
+        tmp1 = total_sectors - RESERVED_SECTORS
+        tmp2 = (256 * sectors_per_cluster + NUM_FATS) // 2
+        fat_sectors = (tmp1 + tmp2 - 1) // tmp2
+
+        # Grow the reserved area so the data region starts on an aligned boundary
+        align = max(DATA_ALIGNMENT, cluster_size) // SECTOR_SIZE
+        data_start = RESERVED_SECTORS + NUM_FATS * fat_sectors
+        reserved = RESERVED_SECTORS + (-data_start % align)
+        data_start = reserved + NUM_FATS * fat_sectors
+
+        cluster_count = (total_sectors - data_start) // sectors_per_cluster
+        if cluster_count < MIN_CLUSTERS:
+            raise ValueError(
+                f"Volume of {volume_bytes} bytes only holds {cluster_count} clusters of "
+                f"{cluster_size} bytes; FAT32 needs at least {MIN_CLUSTERS}"
+            )
+        cluster_count = min(cluster_count, MAX_CLUSTERS - 2, fat_sectors * SECTOR_SIZE // 4 - 2)
+
+        return {
+            "cluster_size": cluster_size,
+            "sectors_per_cluster": sectors_per_cluster,
+            "total_sectors": total_sectors,
+            "reserved_sectors": reserved,
+            "fat_sectors": fat_sectors,
+            "data_start": data_start * SECTOR_SIZE,
+            "cluster_count": cluster_count,
+        }
+
+    def cluster_offset(self, cluster):
+        """Absolute offset on the target of a data cluster."""
+        g = self.layout
+        return self.offset + g["data_start"] + (cluster - 2) * g["cluster_size"]
+
+    # --- Short names ---
+
+    @staticmethod
+    def _is_short_name(name):
+        if name.upper() != name or name.count(".") > 1 or name.startswith("."):
+            return False
+        base, _, ext = name.partition(".")
+        if not 1 <= len(base) <= 8 or len(ext) > 3:
+            return False
+        return all(c.isalnum() and c.isascii() or c in SHORT_NAME_EXTRA for c in base + ext)
+
+    @staticmethod
+    def _short_component(text, length):
+        out = []
+        for c in text.upper():
+            if c == " " or c == ".":
+                continue
+            if c.isascii() and (c.isalnum() or c in SHORT_NAME_EXTRA):
+                out.append(c)
+            else:
+                out.append("_")
+        return "".join(out)[:length]
+
+    def _assign_short_names(self, directory):
+        taken = set()
+        pending = []
+        for node in directory.children:
+            if self._is_short_name(node.name):
+                base, _, ext = node.name.partition(".")
+                node.short_name = base.ljust(8).encode("ascii") + ext.ljust(3).encode("ascii")
+                node.needs_lfn = False
+                taken.add(node.short_name)
+            else:
+                pending.append(node)
+
+        for node in pending:
+            stem, dot, ext = node.name.rpartition(".")
+            if not dot or not stem:
+                stem, ext = node.name, ""
+            base = self._short_component(stem, 8) or "_"
+            ext = self._short_component(ext, 3)
+            for n in range(1, 1000000):
+                tail = f"~{n}"
+                candidate = (base[:8 - len(tail)] + tail).ljust(8) + ext.ljust(3)
+                candidate = candidate.encode("ascii")
+                if candidate not in taken:
+                    break
+            else:
+                raise ValueError(f"Too many similar names in {directory.path() or '/'}")
+            node.short_name = candidate
+            node.needs_lfn = True
+            taken.add(candidate)
+
+    # --- Directory entries ---
+
+    @staticmethod
+    def _short_entry(name11, attr, cluster, size, mtime):
+        fat_date, fat_time = fat_timestamp(mtime)
+        return struct.pack(
+            "<11sBBBHHHHHHHI",
+            name11, attr, 0, 0,
+            fat_time, fat_date, fat_date,
+            (cluster >> 16) & 0xFFFF,
+            fat_time, fat_date,
+            cluster & 0xFFFF,
+            size,
+        )
+
+    @staticmethod
+    def _lfn_entries(name, checksum):
+        units = list(struct.unpack(f"<{len(name.encode('utf-16-le')) // 2}H", name.encode("utf-16-le")))
+        count = (len(units) + LFN_CHARS_PER_ENTRY - 1) // LFN_CHARS_PER_ENTRY
+        if len(units) % LFN_CHARS_PER_ENTRY:
+            units.append(0x0000)
+        units += [0xFFFF] * (count * LFN_CHARS_PER_ENTRY - len(units))
+
+        entries = []
+        for seq in range(count, 0, -1):
+            chunk = units[(seq - 1) * LFN_CHARS_PER_ENTRY:seq * LFN_CHARS_PER_ENTRY]
+            order = seq | (0x40 if seq == count else 0)
+            entries.append(struct.pack(
+                "<B5HBBB6HH2H",
+                order, *chunk[0:5], ATTR_LFN, 0, checksum, *chunk[5:11], 0, *chunk[11:13],
+            ))
+        return b"".join(entries)
+
+    def _directory_bytes(self, directory):
+        out = bytearray()
+        if directory is self.root:
+            label = self._short_component(self.label, 11).ljust(11).encode("ascii")
+            out += self._short_entry(label, ATTR_VOLUME_ID, 0, 0, self.timestamp)
+        else:
+            parent_cluster = directory.parent.first_cluster if directory.parent is not self.root else 0
+            out += self._short_entry(b".          ", ATTR_DIRECTORY, directory.first_cluster, 0, directory.mtime)
+            out += self._short_entry(b"..         ", ATTR_DIRECTORY, parent_cluster, 0, directory.mtime)
+
+        for node in directory.children:
+            if node.needs_lfn:
+                out += self._lfn_entries(node.name, lfn_checksum(node.short_name))
+            attr = ATTR_DIRECTORY if node.is_dir else ATTR_ARCHIVE
+            cluster = node.first_cluster if node.used_clusters else 0
+            out += self._short_entry(node.short_name, attr, cluster,
+                                     0 if node.is_dir else node.size, node.mtime)
+        return out
+
+    def _directory_entry_count(self, directory):
+        count = 1 if directory is self.root else 2
+        for node in directory.children:
+            count += 1
+            if node.needs_lfn:
+                count += (len(node.name.encode("utf-16-le")) // 2 + LFN_CHARS_PER_ENTRY - 1) // LFN_CHARS_PER_ENTRY
+        return count
+
+    # --- Allocation ---
+
+    def _walk(self, directory):
+        """Directories breadth-first, so they all sit at the front of the data region."""
+        queue = [directory]
+        while queue:
+            node = queue.pop(0)
+            yield node
+            queue.extend(child for child in node.children if child.is_dir)
+
+    def _files(self):
+        for directory in self._walk(self.root):
+            for node in directory.children:
+                if not node.is_dir:
+                    yield node
+
+    def _allocate(self):
+        cluster_size = self.layout["cluster_size"]
+        next_cluster = ROOT_CLUSTER
+        directories = list(self._walk(self.root))
+
+        for directory in directories:
+            self._assign_short_names(directory)
+        for directory in directories:
+            size = self._directory_entry_count(directory) * DIR_ENTRY_SIZE
+            directory.cluster_count = max(1, -(-size // cluster_size))
+            directory.used_clusters = directory.cluster_count
+            directory.first_cluster = next_cluster
+            next_cluster += directory.cluster_count
+
+        for node in self._files():
+            if node.data is not None:
+                node.size = len(node.data)
+            elif node.source is not None:
+                node.size = os.path.getsize(node.source)
+            if node.size > 0xFFFFFFFF:
+                raise ValueError(f"{node.path()} is larger than 4 GiB, which FAT32 cannot store")
+            node.cluster_count = -(-(node.size + node.reserve) // cluster_size)
+            node.used_clusters = -(-node.size // cluster_size)
+            node.first_cluster = next_cluster if node.cluster_count else 0
+            next_cluster += node.cluster_count
+
+        used = next_cluster - ROOT_CLUSTER
+        if used > self.layout["cluster_count"]:
+            needed = used * cluster_size
+            raise ValueError(f"Not enough space: need {needed} bytes of clusters, "
+                             f"volume holds {self.layout['cluster_count'] * cluster_size}")
+        return directories, used
+
+    def _nodes(self):
+        return list(self._walk(self.root)) + list(self._files())
+
+    def _chained_clusters(self):
+        return sum(node.used_clusters for node in self._nodes())
+
+    def _build_fat(self):
+        # Every allocation is a single contiguous run, so each chain is just n -> n+1.
+        # Reserved clusters past the end of a chain stay free.
+        total_entries = self.layout["cluster_count"] + 2
+        fat = array("I", bytes(4 * total_entries))
+        fat[0] = FAT_MEDIA
+        fat[1] = FAT_EOC
+        for node in self._nodes():
+            if not node.used_clusters:
+                continue
+            start = node.first_cluster
+            end = start + node.used_clusters - 1
+            fat[start:end] = array("I", range(start + 1, end + 1))
+            fat[end] = FAT_EOC
+        if struct.pack("=I", 1) != struct.pack("<I", 1):
+            fat.byteswap()
+        return fat
+
+    # --- Reserved region ---
+
+    def _boot_sector(self):
+        g = self.layout
+        sector = bytearray(SECTOR_SIZE)
+        label = self._short_component(self.label, 11).ljust(11).encode("ascii")
+        struct.pack_into(
+            "<3s8sHBHBHHBHHHIIIHHIHH12sBBBI11s8s", sector, 0,
+            b"\xEB\x58\x90", b"MSWIN4.1",
+            SECTOR_SIZE, g["sectors_per_cluster"], g["reserved_sectors"], NUM_FATS,
+            0, 0, 0xF8, 0, 63, 255,
+            self.offset // SECTOR_SIZE, g["total_sectors"],
+            g["fat_sectors"], 0, 0, ROOT_CLUSTER, FSINFO_SECTOR, BACKUP_BOOT_SECTOR,
+            bytes(12), 0x80, 0, 0x29, self.volume_id, label, b"FAT32   ",
+        )
+        sector[510:512] = b"\x55\xAA"
+        return sector
+
+    def _fsinfo_sector(self, used):
+        g = self.layout
+        sector = bytearray(SECTOR_SIZE)
+        struct.pack_into("<I", sector, 0, 0x41615252)
+        struct.pack_into("<IIII", sector, 484, 0x61417272,
+                         g["cluster_count"] - self._chained_clusters(), ROOT_CLUSTER + used, 0)
+        struct.pack_into("<I", sector, 508, 0xAA550000)
+        return sector
+
+    def _reserved_region(self, used):
+        g = self.layout
+        region = bytearray(g["reserved_sectors"] * SECTOR_SIZE)
+        boot = self._boot_sector()
+        fsinfo = self._fsinfo_sector(used)
+        for base in (0, BACKUP_BOOT_SECTOR * SECTOR_SIZE):
+            region[base:base + SECTOR_SIZE] = boot
+            region[base + SECTOR_SIZE:base + 2 * SECTOR_SIZE] = fsinfo
+            # Third boot sector only carries the signature
+            region[base + 2 * SECTOR_SIZE + 510:base + 3 * SECTOR_SIZE] = b"\x55\xAA"
+        return region
+
+    # --- Writing ---
+
+    def _copy_file(self, writer, node):
+        if node.data is not None:
+            writer.write(node.data)
+            return
+        if node.stream is not None:
+            remaining = node.size
+            while remaining > 0:
+                data = node.stream.read(min(READ_BLOCK, remaining))
+                if not data:
+                    raise IOError(f"Stream for {node.path()} ended {remaining} bytes early")
+                writer.write(data)
+                remaining -= len(data)
+            return
+        remaining = node.size
+        buf = bytearray(READ_BLOCK)
+        view = memoryview(buf)
+        with open(node.source, "rb", buffering=0) as src:
+            while remaining > 0:
+                n = src.readinto(view[:min(READ_BLOCK, remaining)])
+                if not n:
+                    raise IOError(f"{node.source} shrank while it was being copied")
+                writer.write(view[:n])
+                remaining -= n
+
+    def plan(self, volume_bytes=None):
+        """Computes geometry and cluster allocation without touching the target."""
+        if volume_bytes is None:
+            volume_bytes = self.size
+        self.layout = self._compute_geometry(volume_bytes)
+        directories, used = self._allocate()
+        self.layout["used_clusters"] = used
+        return self.layout
+
+    def patch_file(self, path, data):
+        """
+        Replaces the contents of a file in an already planned (and written)
+        volume. Returns the block-level overlay as a list of (offset, bytes):
+        the file's clusters, its parent directory, the touched FAT sectors of
+        both FATs and the FSInfo sectors. The new data must fit in the
+        clusters the file was given, so add it with a `reserve`.
+        """
+        node = self.find(path)
+        if node is None or node.is_dir:
+            raise ValueError(f"{path} is not a file in this image")
+        g = self.layout
+        cluster_size = g["cluster_size"]
+        data = bytes(data)
+        if len(data) > node.cluster_count * cluster_size:
+            raise ValueError(f"{len(data)} bytes do not fit the {node.cluster_count * cluster_size} "
+                             f"bytes allocated to {path}")
+
+        old_first = node.first_cluster
+        node.data, node.source = data, None
+        node.size = len(data)
+        node.used_clusters = -(-node.size // cluster_size)
+
+        overlay = []
+        if node.cluster_count:
+            padded = data + bytes(node.cluster_count * cluster_size - len(data))
+            overlay.append((self.cluster_offset(old_first), padded))
+
+        parent = node.parent
+        entries = self._directory_bytes(parent)
+        overlay.append((self.cluster_offset(parent.first_cluster),
+                        entries + bytes(parent.cluster_count * cluster_size - len(entries))))
+
+        if node.cluster_count:
+            fat = self._build_fat().tobytes()
+            first_sector = old_first * 4 // SECTOR_SIZE
+            last_sector = ((old_first + node.cluster_count) * 4 - 1) // SECTOR_SIZE
+            chunk = fat[first_sector * SECTOR_SIZE:(last_sector + 1) * SECTOR_SIZE]
+            chunk += bytes((last_sector - first_sector + 1) * SECTOR_SIZE - len(chunk))
+            for copy in range(NUM_FATS):
+                fat_start = self.offset + (g["reserved_sectors"] + copy * g["fat_sectors"]) * SECTOR_SIZE
+                overlay.append((fat_start + first_sector * SECTOR_SIZE, chunk))
+
+        fsinfo = bytes(self._fsinfo_sector(g["used_clusters"]))
+        for base in (0, BACKUP_BOOT_SECTOR):
+            overlay.append((self.offset + (base + FSINFO_SECTOR) * SECTOR_SIZE, fsinfo))
+
+        return sorted(overlay)
+
+    def write_to(self, writer):
+        """
+        Streams the planned volume into `writer` (a SequentialWriter or anything
+        with the same write/seek_forward/flush methods). plan() must run first.
+        """
+        g = self.layout
+        used = g["used_clusters"]
+        fat_bytes = g["fat_sectors"] * SECTOR_SIZE
+
+        self._status("Writing boot sectors and FATs...")
+        writer.write(self._reserved_region(used))
+        fat = self._build_fat().tobytes()
+        for _ in range(NUM_FATS):
+            writer.write(fat)
+            writer.write(bytes(fat_bytes - len(fat)))
+
+        self._status("Writing directories...")
+        for directory in self._walk(self.root):
+            writer.seek_forward(self.cluster_offset(directory.first_cluster))
+            entries = self._directory_bytes(directory)
+            writer.write(entries)
+            writer.write(bytes(directory.cluster_count * g["cluster_size"] - len(entries)))
+
+        for node in self._files():
+            if not node.cluster_count:
+                continue
+            self._status(f"Writing {node.path()}...")
+            writer.seek_forward(self.cluster_offset(node.first_cluster))
+            self._copy_file(writer, node)
+            writer.write(bytes(node.cluster_count * g["cluster_size"] - node.size))
+
+        writer.flush()
+
+    @property
+    def stream_size(self):
+        """Bytes write_to() produces, counted from the start of the volume."""
+        g = self.layout
+        return g["data_start"] + g["used_clusters"] * g["cluster_size"]
+
+    def build(self):
+        """Writes the complete volume. Returns the layout that was used."""
+        start = time.time()
+        fd, target_size = open_target(self.target, None if self.size is None else self.offset + self.size)
+        try:
+            volume_bytes = self.size if self.size is not None else target_size - self.offset
+            if volume_bytes <= 0 or self.offset + volume_bytes > target_size:
+                raise ValueError(f"Volume does not fit on {self.target}")
+
+            self._status("Planning FAT32 layout...")
+            self.plan(volume_bytes)
+            writer = SequentialWriter(fd, self.offset, progress_callback=self.progress_callback,
+                                      total=self.stream_size, hasher=self.hasher)
+            self.write_to(writer)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        if self.hasher:
+            self.layout["regions"] = self.hasher.finish()
+
+        self.layout["elapsed"] = time.time() - start
+        self._status(f"FAT32 volume written in {self.layout['elapsed']:.2f}s")
+        return self.layout
+
+
+def build_installer_volume(target, efi_dir, base_system, chunklist, size=None, offset=0,
+                           label="OPENCORE", status_callback=None, progress_callback=None, hasher=None):
+    """
+    Builds the usual OpenCore installer volume:
+        EFI/...
+        com.apple.recovery.boot/BaseSystem.dmg
+        com.apple.recovery.boot/BaseSystem.chunklist
+    """
+    image = Fat32Image(target, size=size, offset=offset, label=label,
+                       status_callback=status_callback, progress_callback=progress_callback,
+                       hasher=hasher)
+    if efi_dir:
+        image.add_tree(efi_dir, "EFI")
+    image.add_file(f"{RECOVERY_DIR}/BaseSystem.dmg", base_system)
+    if chunklist:
+        image.add_file(f"{RECOVERY_DIR}/BaseSystem.chunklist", chunklist)
+    return image.build()
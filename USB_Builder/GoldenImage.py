@@ -0,0 +1,168 @@
+# USB_Builder/GoldenImage.py
+
+"""
+GoldenImage Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Batch builds where only config.plist differs between sticks. The FAT32
+volume is built once into a cached "golden" image, with room reserved
+after config.plist. Each unit is then the golden image plus a tiny
+block-level overlay (the config.plist clusters, its directory cluster and
+the FAT/FSInfo sectors that changed), so stick N+1 costs a raw copy and a
+few KB of extra writes.
+
+The cache is keyed on the inputs, so a new EFI or BaseSystem.dmg builds
+a new golden image and an unchanged one is reused across runs.
+"""
+
+import os
+import json
+import time
+import hashlib
+
+from .FormatUSB import Fat32Image, RECOVERY_DIR
+from .VerifyUSB import RegionHasher, patch_regions
+
+CONFIG_PATH = "EFI/OC/config.plist"
+CONFIG_RESERVE = 64 * 1024   # Room for per-unit config.plist growth
+CACHE_VERSION = 1
+
+
+class GoldenImage:
+    """
+    Usage:
+        golden = GoldenImage(cache_dir, efi_dir, "BaseSystem.dmg", "BaseSystem.chunklist",
+                             volume_size=4 * 1024**3)
+        golden.ensure()
+        overlay = golden.overlay(unit_config_bytes)
+
+    BuildUSB.run_golden() does the writing for a whole batch.
+    """
+
+    def __init__(self, cache_dir, efi_dir, base_system, chunklist=None, volume_size=None,
+                 label="OPENCORE", config_path=CONFIG_PATH, reserve=CONFIG_RESERVE,
+                 status_callback=None):
+        if not volume_size:
+            raise ValueError("A golden image needs a fixed volume size")
+        self.cache_dir = cache_dir
+        self.efi_dir = efi_dir
+        self.base_system = base_system
+        self.chunklist = chunklist
+        self.volume_size = volume_size
+        self.label = label
+        self.config_path = config_path
+        self.reserve = reserve
+        self.status_callback = status_callback
+
+        self.image = None
+        self.meta = None
+
+    def _status(self, text):
+        if self.status_callback:
+            self.status_callback(text)
+
+    def _inputs(self):
+        files = []
+        if self.efi_dir:
+            for dirpath, _, filenames in os.walk(self.efi_dir):
+                for filename in filenames:
+                    files.append(os.path.join(dirpath, filename))
+        files.append(self.base_system)
+        if self.chunklist:
+            files.append(self.chunklist)
+        return sorted(files)
+
+    def key(self):
+        """Cache key over everything that ends up in the image."""
+        digest = hashlib.sha256()
+        header = [CACHE_VERSION, self.volume_size, self.label, self.config_path, self.reserve]
+        digest.update(json.dumps(header).encode())
+        for path in self._inputs():
+            st = os.stat(path)
+            rel = os.path.relpath(path, self.efi_dir) if self.efi_dir and path.startswith(self.efi_dir) else path
+            digest.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\0".encode())
+        return digest.hexdigest()[:32]
+
+    @property
+    def image_path(self):
+        return os.path.join(self.cache_dir, f"golden-{self.key()}.img")
+
+    @property
+    def meta_path(self):
+        return os.path.join(self.cache_dir, f"golden-{self.key()}.json")
+
+    def _make_image(self, target, timestamp, volume_id, hasher=None):
+        image = Fat32Image(target, size=self.volume_size, label=self.label, volume_id=volume_id,
+                           timestamp=timestamp, hasher=hasher, status_callback=self.status_callback)
+        if self.efi_dir:
+            image.add_tree(self.efi_dir, "EFI")
+            config = image.find(self.config_path)
+            if config is None:
+                raise ValueError(f"{self.config_path} is missing from {self.efi_dir}")
+            config.reserve = self.reserve
+        image.add_file(f"{RECOVERY_DIR}/BaseSystem.dmg", self.base_system)
+        if self.chunklist:
+            image.add_file(f"{RECOVERY_DIR}/BaseSystem.chunklist", self.chunklist)
+        return image
+
+    def ensure(self):
+        """Builds the golden image unless a matching one is cached. Returns its metadata."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if os.path.exists(self.meta_path) and os.path.exists(self.image_path):
+            with open(self.meta_path, "r") as f:
+                self.meta = json.load(f)
+            # Re-planning is cheap (stat calls only) and gives back the exact same layout
+            self.image = self._make_image(None, self.meta["timestamp"], self.meta["volume_id"])
+            self.image.plan(self.volume_size)
+            self._status("Using cached golden image")
+            return self.meta
+
+        self._status("Building golden image...")
+        start = time.time()
+        timestamp = time.time()
+        volume_id = int(timestamp) & 0xFFFFFFFF
+        hasher = RegionHasher()
+        tmp_path = self.image_path + ".part"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        self.image = self._make_image(tmp_path, timestamp, volume_id, hasher=hasher)
+        layout = self.image.build()
+        os.replace(tmp_path, self.image_path)
+
+        self.meta = {
+            "timestamp": timestamp,
+            "volume_id": volume_id,
+            "volume_size": self.volume_size,
+            "stream_size": self.image.stream_size,
+            "regions": layout["regions"],
+        }
+        with open(self.meta_path, "w") as f:
+            json.dump(self.meta, f)
+        self._status(f"Golden image built in {time.time() - start:.2f}s")
+        return self.meta
+
+    @property
+    def stream_size(self):
+        """Bytes at the start of the golden image that have to be copied."""
+        return self.meta["stream_size"]
+
+    def overlay(self, config_bytes):
+        """Block-level overlay (volume relative) that turns the golden image into one unit."""
+        if self.image is None:
+            self.ensure()
+        return self.image.patch_file(self.config_path, config_bytes)
+
+    def unit_regions(self, overlay, base=0):
+        """
+        Region hashes of a unit, for read-back verification. Only regions the
+        overlay touches are re-hashed. `base` is where the volume starts on the target.
+        """
+        regions = [(offset + base, length, digest) for offset, length, digest in self.meta["regions"]]
+        shifted = [(offset + base, data) for offset, data in overlay]
+
+        with open(self.image_path, "rb") as f:
+            def read(offset, length):
+                f.seek(offset - base)
+                return f.read(length)
+            return patch_regions(regions, shifted, read)
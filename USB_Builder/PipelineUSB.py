@@ -0,0 +1,222 @@
+# USB_Builder/PipelineUSB.py
+
+"""
+PipelineUSB Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Downloads BaseSystem.dmg and writes the stick at the same time. The
+chunklist is fetched first; it gives the image size, so the FAT32 layout
+can be planned before a single byte of the image arrives. FormatUSB then
+writes com.apple.recovery.boot/BaseSystem.dmg straight out of the .part
+file, but never past the last chunk whose SHA-256 matched the chunklist.
+End-to-end time is close to max(download, write) instead of their sum.
+"""
+
+import os
+import time
+import threading
+
+from Downloader.Chunklist import parse_chunklist, image_size, ChunkVerifier, ChunklistError
+from Downloader.DownloadImage import ImageDownloader, fetch_bytes
+
+from .FormatUSB import Fat32Image, RECOVERY_DIR
+from .PrepUSB import prepare_usb
+from .VerifyUSB import RegionHasher, verify_regions
+
+READ_BLOCK = 8 * 1024 * 1024
+
+
+class VerifiedPartReader:
+    """
+    Reads a .part file that is still being downloaded, but only up to the
+    verified offset. read() blocks until more data is verified, and raises
+    once the download failed.
+    """
+
+    def __init__(self, part_path):
+        self.part_path = part_path
+        self.position = 0
+        self.verified = 0
+        self.error = None
+        self.finished = False
+        self.cond = threading.Condition()
+        self._file = None
+
+    def advance(self, verified):
+        with self.cond:
+            self.verified = max(self.verified, verified)
+            self.cond.notify_all()
+
+    def fail(self, error):
+        with self.cond:
+            self.error = error
+            self.cond.notify_all()
+
+    def finish(self):
+        with self.cond:
+            self.finished = True
+            self.cond.notify_all()
+
+    def read(self, n):
+        with self.cond:
+            while self.verified <= self.position and self.error is None and not self.finished:
+                self.cond.wait()
+            if self.error is not None:
+                raise IOError(f"Download failed: {self.error}")
+            available = min(n, self.verified - self.position)
+        if available <= 0:
+            return b""
+        if self._file is None:
+            self._file = open(self.part_path, "rb", buffering=0)
+        self._file.seek(self.position)
+        data = self._file.read(available)
+        self.position += len(data)
+        return data
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class PipelineJob:
+    """
+    Download + write in one pass.
+
+    Usage:
+        job = PipelineJob(image["url"], image["chunklist"], "~/Downloads/BaseSystem.dmg",
+                          "/dev/sdb", efi_dir="EFI", status_callback=print)
+        result = job.run()
+
+    `target` may be an image file, in which case `disk_size` gives its size.
+    """
+
+    def __init__(self, url, chunklist_url, dest_path, target, efi_dir=None, disk_size=None,
+                 partition=True, verify=True, label="OPENCORE",
+                 status_callback=None, progress_callback=None):
+        self.url = url
+        self.chunklist_url = chunklist_url
+        self.dest_path = dest_path
+        self.part_path = dest_path + ".part"
+        self.target = target
+        self.efi_dir = efi_dir
+        self.disk_size = disk_size
+        self.partition = partition
+        self.verify = verify
+        self.label = label
+        self.status_callback = status_callback
+        self.progress_callback = progress_callback  # (stage, done, total)
+
+        self.cancel_event = threading.Event()
+
+    def _status(self, text):
+        if self.status_callback:
+            self.status_callback(text)
+
+    def _progress(self, stage, done, total):
+        if self.progress_callback:
+            self.progress_callback(stage, done, total)
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def _resume_offset(self, chunks):
+        """
+        Checks an existing .part file against the chunklist and returns how much
+        of it is good. Anything after the last good chunk is dropped and downloaded again.
+        """
+        if not os.path.exists(self.part_path):
+            return 0
+        verifier = ChunkVerifier(chunks)
+        with open(self.part_path, "rb") as f:
+            try:
+                while True:
+                    data = f.read(READ_BLOCK)
+                    if not data:
+                        break
+                    verifier.feed(data)
+            except ChunklistError:
+                pass
+        with open(self.part_path, "r+b") as f:
+            f.truncate(verifier.verified)
+        return verifier.verified
+
+    def run(self):
+        timings = {}
+        start = time.time()
+
+        self._status("Fetching chunklist...")
+        chunklist = fetch_bytes(self.chunklist_url)
+        chunks = parse_chunklist(chunklist)
+        size = image_size(chunks)
+
+        layout = None
+        offset, volume_size = 0, self.disk_size
+        if self.partition:
+            layout = prepare_usb(self.target, size=self.disk_size, status_callback=self.status_callback)
+            offset, volume_size = layout["esp_offset"], layout["esp_size"]
+
+        verifier = ChunkVerifier(chunks, start=self._resume_offset(chunks))
+        reader = VerifiedPartReader(self.part_path)
+        reader.advance(verifier.verified)
+
+        hasher = RegionHasher() if self.verify else None
+        image = Fat32Image(self.target, size=volume_size, offset=offset, label=self.label, hasher=hasher,
+                           status_callback=self.status_callback,
+                           progress_callback=lambda done, total: self._progress("write", done, total))
+        if self.efi_dir:
+            image.add_tree(self.efi_dir, "EFI")
+        image.add_stream(f"{RECOVERY_DIR}/BaseSystem.dmg", size, reader)
+        image.add_bytes(f"{RECOVERY_DIR}/BaseSystem.chunklist", chunklist)
+
+        expected_offset = [verifier.verified]
+
+        def on_data(data_offset, data):
+            if data_offset != expected_offset[0]:
+                raise IOError("Server ignored the resume request, cannot pipeline this download")
+            expected_offset[0] += len(data)
+            reader.advance(verifier.feed(data))
+
+        downloader = ImageDownloader(
+            self.url, self.dest_path, data_callback=on_data, cancel_event=self.cancel_event, finalize=False,
+            progress_callback=lambda done, total, speed: self._progress("download", done, total),
+        )
+
+        def download():
+            download_start = time.time()
+            try:
+                if not verifier.done:
+                    downloader.run()
+                if not verifier.done:
+                    raise ChunklistError("Download ended before the last chunk")
+                reader.finish()
+            except Exception as e:
+                reader.fail(e)
+            timings["download"] = time.time() - download_start
+
+        thread = threading.Thread(target=download, name="PipelineDownload", daemon=True)
+        thread.start()
+        write_start = time.time()
+        try:
+            layout_fat = image.build()
+        except Exception:
+            self.cancel()
+            raise
+        finally:
+            reader.close()
+            thread.join()
+        timings["write"] = time.time() - write_start
+
+        os.replace(self.part_path, self.dest_path)
+
+        result = {"ok": True, "layout": layout_fat, "partition": layout, "verify": None}
+        if self.verify:
+            result["verify"] = verify_regions(self.target, layout_fat["regions"], status_callback=self.status_callback)
+            result["ok"] = result["verify"]["ok"]
+
+        timings["total"] = time.time() - start
+        result["timings"] = timings
+        self._status(f"Pipeline finished in {timings['total']:.2f}s "
+                     f"(download {timings.get('download', 0):.2f}s, write {timings['write']:.2f}s)")
+        return result
@@ -1 +1,267 @@
-# USB_Builder/PrepUSB.py
\ No newline at end of file
+# USB_Builder/PrepUSB.py
+
+"""
+PrepUSB Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Prepares a stick (or image file) for FormatUSB: wipes it and writes a
+protective MBR plus primary and backup GPT with a single, 1 MiB aligned
+EFI System Partition.
+
+Zeroing the whole stick is never done. Devices are discarded with
+BLKDISCARD, image files get their blocks released by hole punching, and
+only the regions that carry metadata (partition tables, old filesystem
+signatures) are actually zeroed.
+"""
+
+import os
+import sys
+import stat
+import time
+import uuid
+import zlib
+import struct
+
+from .FormatUSB import open_target, write_at, SECTOR_SIZE
+
+# GPT layout
+GPT_ENTRY_COUNT = 128
+GPT_ENTRY_SIZE = 128
+GPT_ENTRIES_SECTORS = GPT_ENTRY_COUNT * GPT_ENTRY_SIZE // SECTOR_SIZE  # 32
+GPT_HEADER_SIZE = 92
+GPT_REVISION = 0x00010000
+PARTITION_ALIGNMENT = 1024 * 1024
+
+ESP_TYPE_GUID = uuid.UUID("C12A7328-F81F-11D2-BA4B-00A0C93EC93B")
+ESP_NAME = "EFI System Partition"
+
+# Regions zeroed at both ends of the disk and at the start of the ESP.
+# Covers the partition tables plus the superblocks of anything that was
+# on the stick before (FAT, HFS+, APFS, ISO9660 live images, ...).
+METADATA_ZERO_BYTES = 1024 * 1024
+
+# Linux ioctls (linux/fs.h)
+BLKDISCARD = 0x1277
+BLKZEROOUT = 0x127F
+
+# fallocate(2) flags
+FALLOC_FL_KEEP_SIZE = 0x01
+FALLOC_FL_PUNCH_HOLE = 0x02
+
+ZERO_BLOCK = 4 * 1024 * 1024
+
+
+def _is_block_device(fd):
+    return stat.S_ISBLK(os.fstat(fd).st_mode)
+
+
+def _punch_hole(fd, offset, length):
+    """Releases the blocks of a range in a regular file. Returns False when unsupported."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        libc.fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong]
+        result = libc.fallocate(fd, FALLOC_FL_PUNCH_HOLE | FALLOC_FL_KEEP_SIZE, offset, length)
+        return result == 0
+    except (OSError, AttributeError):
+        return False
+
+
+def discard_range(fd, offset, length):
+    """
+    Tells the device (or filesystem) that a range no longer holds data.
+    Returns True when the range was discarded, False when the target
+    does not support it. Discarded ranges are not guaranteed to read back
+    as zeros on devices, so callers still zero the regions that matter.
+    """
+    if length <= 0:
+        return True
+    if _is_block_device(fd):
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            import fcntl
+            fcntl.ioctl(fd, BLKDISCARD, struct.pack("QQ", offset, length))
+            return True
+        except OSError:
+            return False
+
+    if _punch_hole(fd, offset, length):
+        return True
+    # Hole punching is not available; shrinking and re-growing a file
+    # releases its blocks too, but only works for a range that runs to the end
+    if offset + length >= os.fstat(fd).st_size:
+        size = os.fstat(fd).st_size
+        os.ftruncate(fd, offset)
+        os.ftruncate(fd, size)
+        return True
+    return False
+
+
+def zero_range(fd, offset, length):
+    """Writes zeros over a range, using BLKZEROOUT when the device offers it."""
+    if length <= 0:
+        return
+    if _is_block_device(fd) and sys.platform.startswith("linux"):
+        try:
+            import fcntl
+            fcntl.ioctl(fd, BLKZEROOUT, struct.pack("QQ", offset, length))
+            return
+        except OSError:
+            pass
+
+    block = bytes(min(ZERO_BLOCK, length))
+    os.lseek(fd, offset, os.SEEK_SET)
+    remaining = length
+    while remaining > 0:
+        remaining -= os.write(fd, block[:min(len(block), remaining)])
+
+
+def removable_devices():
+    """Paths of the removable whole disks on this machine, the only devices a remote job may write."""
+    if sys.platform.startswith("linux"):
+        devices = []
+        for name in sorted(os.listdir("/sys/block")) if os.path.isdir("/sys/block") else ():
+            path = os.path.join("/sys/block", name)
+            try:
+                with open(os.path.join(path, "removable")) as f:
+                    removable = f.read().strip() == "1"
+                with open(os.path.join(path, "size")) as f:
+                    empty = int(f.read().strip() or 0) == 0
+            except (OSError, ValueError):
+                continue
+            # USB card readers and some sticks report removable=0, their sysfs path still runs through the USB bus
+            if not empty and (removable or "/usb" in os.path.realpath(path)) and not name.startswith("sr"):
+                devices.append("/dev/" + name)
+        return devices
+    if sys.platform == "win32":
+        import wmi
+        return [disk.DeviceID for disk in wmi.WMI().Win32_DiskDrive()
+                if disk.InterfaceType == "USB" or "removable" in (disk.MediaType or "").lower()]
+    if sys.platform == "darwin":
+        import plistlib
+        import subprocess
+        output = subprocess.run(["diskutil", "list", "-plist", "external", "physical"],
+                                capture_output=True, check=True).stdout
+        disks = plistlib.loads(output).get("WholeDisks", [])
+        return [f"/dev/{disk}" for disk in disks] + [f"/dev/r{disk}" for disk in disks]
+    return []
+
+
+def protective_mbr(total_sectors):
+    """MBR with a single 0xEE partition covering the disk, as UEFI requires."""
+    mbr = bytearray(SECTOR_SIZE)
+    size = min(total_sectors - 1, 0xFFFFFFFF)
+    struct.pack_into("<B3sB3sII", mbr, 446,
+                     0x00, b"\x00\x02\x00", 0xEE, b"\xFF\xFF\xFF", 1, size)
+    mbr[510:512] = b"\x55\xAA"
+    return mbr
+
+
+def esp_bounds(total_sectors, esp_size=None):
+    """First and last LBA (inclusive) of an aligned ESP."""
+    align = PARTITION_ALIGNMENT // SECTOR_SIZE
+    last_usable = total_sectors - 2 - GPT_ENTRIES_SECTORS
+    first = align
+    if esp_size:
+        last = first + esp_size // SECTOR_SIZE - 1
+        if last > last_usable:
+            raise ValueError(f"ESP of {esp_size} bytes does not fit on a {total_sectors * SECTOR_SIZE} byte disk")
+    else:
+        # Fill the disk, but end on an alignment boundary as well
+        last = (last_usable + 1) // align * align - 1
+    if last <= first:
+        raise ValueError("Disk is too small for a GPT with an aligned ESP")
+    return first, last
+
+
+def gpt_structures(total_sectors, first_lba, last_lba, disk_guid=None, part_guid=None, name=ESP_NAME):
+    """Builds (primary header, backup header, entry array) for a one-partition GPT."""
+    disk_guid = disk_guid or uuid.uuid4()
+    part_guid = part_guid or uuid.uuid4()
+    last_sector = total_sectors - 1
+
+    entries = bytearray(GPT_ENTRY_COUNT * GPT_ENTRY_SIZE)
+    struct.pack_into("<16s16sQQQ72s", entries, 0,
+                     ESP_TYPE_GUID.bytes_le, part_guid.bytes_le,
+                     first_lba, last_lba, 0,
+                     name.encode("utf-16-le")[:72])
+    entries_crc = zlib.crc32(entries) & 0xFFFFFFFF
+
+    def header(my_lba, alternate_lba, entries_lba):
+        data = bytearray(struct.pack(
+            "<8sIIIIQQQQ16sQIII",
+            b"EFI PART", GPT_REVISION, GPT_HEADER_SIZE, 0, 0,
+            my_lba, alternate_lba,
+            2 + GPT_ENTRIES_SECTORS, last_sector - 1 - GPT_ENTRIES_SECTORS,
+            disk_guid.bytes_le, entries_lba,
+            GPT_ENTRY_COUNT, GPT_ENTRY_SIZE, entries_crc,
+        ))
+        struct.pack_into("<I", data, 16, zlib.crc32(data) & 0xFFFFFFFF)
+        return bytes(data) + bytes(SECTOR_SIZE - GPT_HEADER_SIZE)
+
+    primary = header(1, last_sector, 2)
+    backup = header(last_sector, 1, last_sector - GPT_ENTRIES_SECTORS)
+    return primary, backup, bytes(entries)
+
+
+def prepare_usb(target, size=None, esp_size=None, discard=True, status_callback=None):
+    """
+    Wipes the target and writes the partition table.
+
+    Returns a dict with the ESP location ("esp_offset", "esp_size"), which is
+    what FormatUSB.Fat32Image takes as offset/size, and "timings" with the
+    seconds spent in each step.
+    """
+    def status(text):
+        if status_callback:
+            status_callback(text)
+
+    timings = {}
+    fd, disk_size = open_target(target, size)
+    try:
+        total_sectors = disk_size // SECTOR_SIZE
+        first_lba, last_lba = esp_bounds(total_sectors, esp_size)
+        esp_offset = first_lba * SECTOR_SIZE
+        esp_bytes = (last_lba - first_lba + 1) * SECTOR_SIZE
+
+        discarded = False
+        if discard:
+            status("Discarding old contents...")
+            start = time.perf_counter()
+            discarded = discard_range(fd, 0, total_sectors * SECTOR_SIZE)
+            timings["discard"] = time.perf_counter() - start
+            status(f"Discard {'done' if discarded else 'not supported'} in {timings['discard']:.3f}s")
+
+        status("Zeroing metadata regions...")
+        start = time.perf_counter()
+        tail = min(METADATA_ZERO_BYTES, disk_size)
+        zero_range(fd, 0, METADATA_ZERO_BYTES)
+        zero_range(fd, esp_offset, min(METADATA_ZERO_BYTES, esp_bytes))
+        zero_range(fd, total_sectors * SECTOR_SIZE - tail, tail)
+        timings["zero_metadata"] = time.perf_counter() - start
+
+        status("Writing partition table...")
+        start = time.perf_counter()
+        primary, backup, entries = gpt_structures(total_sectors, first_lba, last_lba)
+        last_sector = total_sectors - 1
+        write_at(fd, 0, protective_mbr(total_sectors) + primary + entries)
+        write_at(fd, (last_sector - GPT_ENTRIES_SECTORS) * SECTOR_SIZE, entries + backup)
+        os.fsync(fd)
+        timings["partition_table"] = time.perf_counter() - start
+    finally:
+        os.close(fd)
+
+    timings["total"] = sum(timings.values())
+    status(f"Prepared {target} in {timings['total']:.3f}s")
+    return {
+        "disk_size": disk_size,
+        "esp_offset": esp_offset,
+        "esp_size": esp_bytes,
+        "discarded": discarded,
+        "timings": timings,
+    }
@@ -0,0 +1,218 @@
+# USB_Builder/VerifyUSB.py
+
+"""
+VerifyUSB Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Proves a stick holds what was written to it. While FormatUSB writes, a
+RegionHasher hashes the outgoing stream in fixed size regions. Afterwards
+verify_regions() drops the written range from the page cache, reads the
+target back in large blocks and hashes all regions in parallel (hashlib
+releases the GIL, so threads scale across cores). Regions that do not
+match are reported by offset.
+"""
+
+import os
+import json
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+HASH_ALGORITHM = "sha256"
+REGION_SIZE = 8 * 1024 * 1024
+READ_BLOCK = 4 * 1024 * 1024
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _fadvise(fd, offset, length, advice_name):
+    """posix_fadvise where the platform has it (not Windows/macOS), no-op otherwise."""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, offset, length, advice)
+    except OSError:
+        pass
+
+
+class RegionHasher:
+    """
+    Hashes a sequential write stream in REGION_SIZE pieces.
+    `regions` is a list of (offset, length, hexdigest) in absolute target offsets.
+    """
+
+    def __init__(self, region_size=REGION_SIZE, algorithm=HASH_ALGORITHM):
+        self.region_size = region_size
+        self.algorithm = algorithm
+        self.regions = []
+        self._offset = None   # Start of the region currently being hashed
+        self._length = 0
+        self._hash = None
+
+    def update(self, offset, data):
+        view = memoryview(data)
+        if self._offset is None:
+            self._offset = offset
+            self._hash = hashlib.new(self.algorithm)
+        elif offset != self._offset + self._length:
+            # A jump in the stream closes the current region
+            self._close()
+            self._offset = offset
+            self._hash = hashlib.new(self.algorithm)
+
+        while len(view):
+            take = min(self.region_size - self._length, len(view))
+            self._hash.update(view[:take])
+            self._length += take
+            view = view[take:]
+            if self._length == self.region_size:
+                next_offset = self._offset + self._length
+                self._close()
+                self._offset = next_offset
+                self._hash = hashlib.new(self.algorithm)
+
+    def _close(self):
+        if self._length:
+            self.regions.append((self._offset, self._length, self._hash.hexdigest()))
+        self._offset = None
+        self._length = 0
+        self._hash = None
+
+    def finish(self):
+        """Closes the last, possibly short, region and returns all regions."""
+        self._close()
+        return self.regions
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump({"algorithm": self.algorithm, "regions": self.regions}, f)
+
+    @staticmethod
+    def load(path):
+        with open(path, "r") as f:
+            data = json.load(f)
+        return data["algorithm"], [tuple(region) for region in data["regions"]]
+
+
+def patch_regions(regions, overlay, read, algorithm=HASH_ALGORITHM):
+    """
+    Region hashes after `overlay` ((offset, bytes) writes) is applied on top of
+    the content the regions were taken from. `read(offset, length)` returns the
+    original bytes. Regions the overlay does not touch keep their hash.
+    """
+    patched = []
+    for offset, length, digest in regions:
+        end = offset + length
+        touching = [(o, d) for o, d in overlay if o < end and o + len(d) > offset]
+        if not touching:
+            patched.append((offset, length, digest))
+            continue
+        data = bytearray(read(offset, length).ljust(length, b"\0"))
+        for o, d in touching:
+            lo = max(o, offset)
+            hi = min(o + len(d), end)
+            data[lo - offset:hi - offset] = d[lo - o:hi - o]
+        patched.append((offset, length, hashlib.new(algorithm, data).hexdigest()))
+    return patched
+
+
+def _hash_region(target, offset, length, algorithm, block_size):
+    digest = hashlib.new(algorithm)
+    buf = bytearray(min(block_size, length))
+    view = memoryview(buf)
+    with open(target, "rb", buffering=0) as f:
+        fd = f.fileno()
+        _fadvise(fd, offset, length, "POSIX_FADV_SEQUENTIAL")
+        _fadvise(fd, offset, length, "POSIX_FADV_WILLNEED")
+        f.seek(offset)
+        remaining = length
+        while remaining > 0:
+            n = f.readinto(view[:min(len(buf), remaining)])
+            if not n:
+                break  # Short device, the digest will not match
+            digest.update(view[:n])
+            remaining -= n
+        # Nothing will read this range again soon
+        _fadvise(fd, offset, length, "POSIX_FADV_DONTNEED")
+    return digest.hexdigest()
+
+
+def drop_cache(target, regions):
+    """
+    Evicts the written ranges from the page cache so the read-back really
+    comes from the stick and not from memory.
+    """
+    if not regions:
+        return
+    start = min(offset for offset, _, _ in regions)
+    end = max(offset + length for offset, length, _ in regions)
+    fd = os.open(target, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if hasattr(os, "fdatasync"):
+            os.fdatasync(fd)
+        _fadvise(fd, start, end - start, "POSIX_FADV_DONTNEED")
+    finally:
+        os.close(fd)
+
+
+def verify_regions(target, regions, algorithm=HASH_ALGORITHM, workers=None, fail_fast=False,
+                   block_size=READ_BLOCK, status_callback=None, progress_callback=None):
+    """
+    Reads every region back from `target` and compares it to the hash taken at write time.
+
+    Returns a dict:
+        ok          True when every region matched
+        mismatches  list of (offset, length) that did not match, sorted by offset
+        checked     number of regions checked (less than all with fail_fast)
+        bytes       bytes read back
+        elapsed     seconds
+    """
+    start = time.time()
+    workers = workers or MAX_WORKERS
+    drop_cache(target, regions)
+
+    if status_callback:
+        status_callback(f"Verifying {len(regions)} regions with {workers} threads...")
+
+    mismatches = []
+    checked = 0
+    bytes_read = 0
+    total = sum(length for _, length, _ in regions)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        future_to_region = {
+            executor.submit(_hash_region, target, offset, length, algorithm, block_size): (offset, length, expected)
+            for offset, length, expected in regions
+        }
+        for future in as_completed(future_to_region):
+            offset, length, expected = future_to_region[future]
+            try:
+                matched = future.result() == expected
+            except OSError:
+                matched = False
+            checked += 1
+            bytes_read += length
+            if not matched:
+                mismatches.append((offset, length))
+                if status_callback:
+                    status_callback(f"Mismatch at offset {offset:#x} ({length} bytes)")
+                if fail_fast:
+                    for pending in future_to_region:
+                        pending.cancel()
+                    break
+            if progress_callback:
+                progress_callback(bytes_read, total)
+
+    mismatches.sort()
+    elapsed = time.time() - start
+    if status_callback:
+        verdict = "OK" if not mismatches else f"{len(mismatches)} bad regions"
+        status_callback(f"Verification {verdict} ({bytes_read / (1024 * 1024):.0f} MB in {elapsed:.2f}s)")
+    return {
+        "ok": not mismatches,
+        "mismatches": mismatches,
+        "checked": checked,
+        "bytes": bytes_read,
+        "elapsed": elapsed,
+    }
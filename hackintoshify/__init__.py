@@ -0,0 +1,6 @@
+# hackintoshify/__init__.py
+
+"""
+Headless entry point for Hackintoshify, see hackintoshify/cli.py.
+Nothing is imported here so `python -m hackintoshify` stays fast.
+"""
@@ -0,0 +1,446 @@
+# hackintoshify/cli.py
+
+"""
+CLI Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Headless front end for build servers and scripts:
+
+    python -m hackintoshify catalog [--installers] [--no-cache] [--file CATALOG]
+    python -m hackintoshify download URL DEST [--chunklist-url URL] [--store DIR]
+                                    [--extract MEMBER --to PATH] [--limit KB/s]
+    python -m hackintoshify verify IMAGE [--chunklist FILE] | --store DIR
+    python -m hackintoshify write-usb TARGET [TARGET ...] [--efi DIR]
+                                    (--base-system DMG [--chunklist FILE] | --url URL --chunklist-url URL
+                                     --dest DMG | --image IMG) [--size BYTES] [--no-partition] [--no-verify]
+    python -m hackintoshify serve [--port N | --socket PATH] [--state-dir DIR] [--token TOKEN]
+    python -m hackintoshify coordinate --station URL [--station URL ...] [--station-token TOKEN]
+                                      [--port N] [--state-dir DIR]
+    python -m hackintoshify submit SPEC.json [--watch] [--token TOKEN | --state-dir DIR]
+    python -m hackintoshify jobs [ID] [--watch] [--cancel] [--token TOKEN | --state-dir DIR]
+    python -m hackintoshify startup [--budget MS] [--runs N] [--imports-only]
+    python -m hackintoshify detect [--no-cache]
+    python -m hackintoshify pci-ids [VENDOR[:DEVICE] ...] [--build [SOURCE]] [--output FILE]
+    python -m hackintoshify kexts [--no-cache] | --bench [PROFILES] [--seed N] | --search QUERY
+                                 | --search-bench [SCALE]
+
+The result is printed to stdout as JSON, status and progress go to
+stderr. PySide6 is never imported and every subcommand imports only the
+engines it uses, inside its handler, so startup costs argparse and json.
+Exit code 0 means success, 1 a failed job, 2 bad arguments.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+
+class Reporter:
+    """Status and progress on stderr. Progress is printed at most every PROGRESS_INTERVAL seconds."""
+
+    PROGRESS_INTERVAL = 1.0
+
+    def __init__(self, quiet=False):
+        self.quiet = quiet
+        self.last = {}
+
+    def status(self, text, *rest):
+        # BuildUSB passes (target, text)
+        if rest:
+            text = f"{text}: {rest[0]}" if text else rest[0]
+        if not self.quiet:
+            print(text, file=sys.stderr, flush=True)
+
+    def progress(self, stage, done, total):
+        if self.quiet:
+            return
+        now = time.time()
+        if done != total and now - self.last.get(stage, 0) < self.PROGRESS_INTERVAL:
+            return
+        self.last[stage] = now
+        pct = f"{100 * done / total:.0f}%" if total else f"{done} bytes"
+        print(f"[{stage}] {pct} ({done / (1024 * 1024):.0f} MB)", file=sys.stderr, flush=True)
+
+
+def emit(result):
+    json.dump(result, sys.stdout, indent=2, default=str)
+    sys.stdout.write("\n")
+
+
+# --- catalog ---
+
+def cmd_catalog(args, reporter):
+    if args.installers or args.file:
+        from Downloader.Catalog import InstallerCatalog, parse_catalog
+        if args.file:
+            with open(args.file, "rb") as f:
+                return parse_catalog(f), True
+        catalog = InstallerCatalog(status_callback=reporter.status)
+        return catalog.refresh(), True
+
+    from GUI_Screens.Functionality.FetchAppleImages import FetchAppleImages
+    fetcher = FetchAppleImages(use_cache=not args.no_cache, status_callback=reporter.status)
+    return fetcher.apple_images, True
+
+
+# --- download ---
+
+def cmd_download(args, reporter):
+    limiter = None
+    if args.limit is not None:
+        from Downloader.Throttle import BandwidthLimiter
+        limiter = BandwidthLimiter(limit=args.limit * 1024)
+    start = time.time()
+
+    if args.extract:
+        from Downloader.Xar import PkgExtractor
+        dest = args.to or os.path.join(os.path.dirname(os.path.abspath(args.dest)), args.extract)
+        job = PkgExtractor(args.url, args.dest, dest, member=args.extract,
+                           status_callback=reporter.status, progress_callback=reporter.progress)
+        if limiter is not None:
+            job.downloader.throttle = limiter.stream()
+        job.run()
+        return {"ok": True, "package": args.dest, "extracted": dest, "elapsed": time.time() - start}, True
+
+    if args.store:
+        if not args.chunklist_url:
+            raise SystemExit("--store needs --chunklist-url")
+        from Downloader.DeltaDownload import DeltaDownloader
+        report = DeltaDownloader(args.url, args.chunklist_url, args.dest, args.store, limiter=limiter,
+                                 status_callback=reporter.status,
+                                 progress_callback=lambda done, total: reporter.progress("download", done, total)).run()
+        report.update({"ok": True, "path": args.dest})
+        return report, True
+
+    from Downloader.DownloadImage import ImageDownloader, fetch_bytes
+    path = ImageDownloader(args.url, args.dest, limiter=limiter, status_callback=reporter.status,
+                           progress_callback=lambda done, total, speed: reporter.progress("download", done, total)).run()
+    result = {"ok": True, "path": path, "size": os.path.getsize(path), "elapsed": time.time() - start}
+
+    if args.chunklist_url:
+        from Downloader.Chunklist import verify
+        chunklist = fetch_bytes(args.chunklist_url)
+        with open(os.path.splitext(path)[0] + ".chunklist", "wb") as f:
+            f.write(chunklist)
+        check = verify(path, chunklist)
+        result["verify"] = check
+        result["ok"] = check["ok"]
+    return result, result["ok"]
+
+
+# --- verify ---
+
+def cmd_verify(args, reporter):
+    from Downloader.Chunklist import verify, verify_directory
+    if args.store:
+        report = verify_directory(args.store, workers=args.workers, status_callback=reporter.status)
+        return report, report["ok"]
+    if not args.image:
+        raise SystemExit("verify needs an IMAGE or --store DIR")
+    chunklist = args.chunklist or os.path.splitext(args.image)[0] + ".chunklist"
+    result = verify(args.image, chunklist, workers=args.workers)
+    result["image"] = args.image
+    return result, result["ok"]
+
+
+# --- write-usb ---
+
+def cmd_write_usb(args, reporter):
+    if args.url:
+        if len(args.targets) != 1 or not args.chunklist_url or not args.dest:
+            raise SystemExit("--url writes one target and needs --chunklist-url and --dest")
+        from USB_Builder.PipelineUSB import PipelineJob
+        result = PipelineJob(args.url, args.chunklist_url, args.dest, args.targets[0], efi_dir=args.efi,
+                             disk_size=args.size, partition=not args.no_partition, verify=not args.no_verify,
+                             label=args.label, status_callback=reporter.status,
+                             progress_callback=reporter.progress).run()
+        return result, result["ok"]
+
+    from USB_Builder.BuildUSB import BuildUSB
+    builder = BuildUSB(args.targets, label=args.label, partition=not args.no_partition, verify=not args.no_verify,
+                       disk_size=args.size, status_callback=reporter.status,
+                       progress_callback=lambda target, done, total: reporter.progress(target, done, total))
+    if args.image:
+        results = builder.run_image(args.image)
+    else:
+        if not args.base_system:
+            raise SystemExit("write-usb needs --base-system, --url or --image")
+        builder.add_installer(args.efi, args.base_system, args.chunklist)
+        results = builder.run()
+    ok = all(r["ok"] for r in results)
+    return {"ok": ok, "targets": results}, ok
+
+
+# --- provisioning service ---
+
+def _client(args):
+    from Service.Client import ServiceClient
+    token = args.token
+    if not token:
+        from Service.Daemon import load_token
+        token = load_token(args.state_dir, create=False)
+    return ServiceClient(args.url, socket_path=args.socket, token=token)
+
+
+def _watch(client, job_id, reporter):
+    job = None
+    for job in client.watch(job_id):
+        progress = job.get("progress")
+        if progress:
+            reporter.progress(progress["stage"], progress["done"], progress["total"])
+        elif job["log"]:
+            reporter.status(job["log"][-1])
+    return job
+
+
+def cmd_serve(args, reporter):
+    from Service.Daemon import serve
+    limits = dict(item.split("=", 1) for item in args.limit)
+    serve(args.state_dir, port=args.port, socket_path=args.socket,
+          limits={stage: int(n) for stage, n in limits.items()}, token=args.token, status_callback=reporter.status)
+    return {"ok": True}, True
+
+
+def cmd_coordinate(args, reporter):
+    from Service.Coordinator import serve
+    serve(args.state_dir, port=args.port, stations=args.station, station_token=args.station_token,
+          status_callback=reporter.status)
+    return {"ok": True}, True
+
+
+def cmd_submit(args, reporter):
+    with open(args.spec, "r") as f:
+        spec = json.load(f)
+    client = _client(args)
+    job = client.submit(spec)
+    if args.watch:
+        job = _watch(client, job["id"], reporter)
+        return job, job["status"] == "done"
+    return job, True
+
+
+def cmd_jobs(args, reporter):
+    client = _client(args)
+    if not args.id:
+        return client.jobs(args.status), True
+    if args.cancel:
+        return client.cancel(args.id), True
+    if args.watch:
+        job = _watch(client, args.id, reporter)
+        return job, job["status"] == "done"
+    return client.job(args.id), True
+
+
+# --- startup ---
+
+def cmd_startup(args, reporter):
+    from .startup import import_report, measure_startup
+    report = import_report()
+    for item in report["modules"][:5]:
+        reporter.status(f"{item['self_ms']:8.1f} ms  {item['module']}")
+    for name in report["deferred_loaded"]:
+        reporter.status(f"Loaded at startup but should be deferred: {name}")
+    result = {"imports": report, "ok": not report["deferred_loaded"]}
+    if not args.imports_only:
+        timing = measure_startup(args.runs, args.budget, status_callback=reporter.status)
+        reporter.status(f"Median cold start {timing['median_ms']:.0f} ms, budget {timing['budget_ms']} ms")
+        result.update(startup=timing, ok=result["ok"] and timing["ok"])
+    return result, result["ok"]
+
+
+# --- detect ---
+
+def cmd_detect(args, reporter):
+    from Detection.DetectOS import detect_hardware, summary
+    info = detect_hardware(status_callback=reporter.status, use_cache=not args.no_cache)
+    return {"summary": summary(info), "hardware": info}, True
+
+
+# --- pci-ids ---
+
+def _parse_pci_id(text):
+    vendor, _, device = text.lower().replace("0x", "").partition(":")
+    return int(vendor, 16), int(device, 16) if device else None
+
+
+def cmd_pci_ids(args, reporter):
+    from Detection.PciIds import PciIdIndex, compile_pci_ids, find_pci_ids, download_pci_ids, get_index_path
+    output = args.output or get_index_path()
+    result = {"index": output}
+    if args.build is not None:
+        source = args.build or find_pci_ids()
+        if not source:
+            import tempfile
+            source = download_pci_ids(os.path.join(tempfile.gettempdir(), "pci.ids"), status_callback=reporter.status)
+        result["build"] = compile_pci_ids(source, output, status_callback=reporter.status)
+
+    if args.ids:
+        index = PciIdIndex(output)
+        result["version"] = index.version
+        lookups = []
+        for text in args.ids:
+            try:
+                vendor, device = _parse_pci_id(text)
+            except ValueError:
+                raise SystemExit(f"not a PCI ID: {text}")
+            entry = {"id": text, "vendor": index.vendor(vendor)}
+            if device is not None:
+                entry["device"] = index.device(vendor, device)
+            lookups.append(entry)
+        result["lookups"] = lookups
+    return result, True
+
+
+# --- kexts ---
+
+def cmd_kexts(args, reporter):
+    if args.search is not None or args.search_bench is not None:
+        return _kext_search(args, reporter)
+    from Logic.KextRecommender import recommend, explain, benchmark
+    if args.bench is not None:
+        result = benchmark(args.bench, args.seed, status_callback=reporter.status)
+        return result, result["mismatches"] == 0
+    from Detection.DetectOS import detect_hardware
+    info = detect_hardware(status_callback=reporter.status, use_cache=not args.no_cache)
+    return {"kexts": [{"name": item["name"], "kind": item["kind"], "why": explain(item)}
+                      for item in recommend(info)]}, True
+
+
+def _kext_search(args, reporter):
+    from Logic.KextCatalog import get_catalog
+    from Logic.KextSearch import SearchIndex, benchmark, scaled_catalog
+    catalog = get_catalog()
+    if args.search_bench is not None:
+        result = benchmark(scaled_catalog(catalog, args.search_bench), status_callback=reporter.status)
+        return result, True
+    rows = SearchIndex(catalog).search(args.search) or range(len(catalog))
+    return {"query": args.search, "results": [catalog[row] for row in rows]}, True
+
+
+def build_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-q", "--quiet", action="store_true", help="no status output on stderr")
+
+    parser = argparse.ArgumentParser(prog="hackintoshify", description="Hackintoshify headless tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("catalog", parents=[common], help="list recovery images or full installers")
+    p.add_argument("--installers", action="store_true", help="full InstallAssistant installers instead of recovery images")
+    p.add_argument("--no-cache", action="store_true", help="ignore the recovery image cache")
+    p.add_argument("--file", help="parse a local sucatalog file instead of fetching it")
+    p.set_defaults(handler=cmd_catalog)
+
+    p = sub.add_parser("download", parents=[common], help="download an image or installer")
+    p.add_argument("url")
+    p.add_argument("dest")
+    p.add_argument("--chunklist-url", help="verify against (or delta download with) this chunklist")
+    p.add_argument("--store", help="image store to reuse chunks from (delta download)")
+    p.add_argument("--extract", metavar="MEMBER", help="extract MEMBER from the .pkg while downloading")
+    p.add_argument("--to", help="where the extracted member goes")
+    p.add_argument("--limit", type=int, metavar="KB/s", help="bandwidth cap for this run")
+    p.set_defaults(handler=cmd_download)
+
+    p = sub.add_parser("verify", parents=[common], help="check images against their chunklists")
+    p.add_argument("image", nargs="?")
+    p.add_argument("--chunklist", help="defaults to IMAGE with a .chunklist extension")
+    p.add_argument("--store", help="verify every image in this directory")
+    p.add_argument("--workers", type=int)
+    p.set_defaults(handler=cmd_verify)
+
+    p = sub.add_parser("write-usb", parents=[common], help="write an installer to one or more sticks or image files")
+    p.add_argument("targets", nargs="+", metavar="TARGET")
+    p.add_argument("--efi", help="EFI folder to copy")
+    p.add_argument("--base-system", help="BaseSystem.dmg on disk")
+    p.add_argument("--chunklist", help="BaseSystem.chunklist on disk")
+    p.add_argument("--url", help="download BaseSystem.dmg while writing")
+    p.add_argument("--chunklist-url")
+    p.add_argument("--dest", help="where the downloaded BaseSystem.dmg is kept")
+    p.add_argument("--image", help="clone a raw image instead of building a volume")
+    p.add_argument("--size", type=int, help="size in bytes for image-file targets")
+    p.add_argument("--label", default="OPENCORE")
+    p.add_argument("--no-partition", action="store_true", help="write a bare FAT32 volume, no GPT")
+    p.add_argument("--no-verify", action="store_true", help="skip the read-back check")
+    p.set_defaults(handler=cmd_write_usb)
+
+    p = sub.add_parser("serve", parents=[common], help="run the provisioning service")
+    p.add_argument("--port", type=int, default=8742)
+    p.add_argument("--socket", help="listen on this Unix socket instead of TCP")
+    p.add_argument("--state-dir", help="job queue, image store and job files")
+    p.add_argument("--limit", action="append", default=[], metavar="STAGE=N", help="concurrency of one stage")
+    p.add_argument("--token", help="API token to require instead of the one in the state dir")
+    p.set_defaults(handler=cmd_serve)
+
+    p = sub.add_parser("coordinate", parents=[common], help="spread jobs over several provisioning services")
+    p.add_argument("--station", action="append", default=[], metavar="URL", help="a station's service address")
+    p.add_argument("--station-token", help="API token of the stations (default: this install's)")
+    p.add_argument("--port", type=int, default=8742)
+    p.add_argument("--state-dir", help="the coordinator's job queue")
+    p.set_defaults(handler=cmd_coordinate)
+
+    service = argparse.ArgumentParser(add_help=False, parents=[common])
+    service.add_argument("--url", default="http://127.0.0.1:8742", help="service address")
+    service.add_argument("--socket", help="service Unix socket")
+    service.add_argument("--token", help="the service's API token")
+    service.add_argument("--state-dir", help="read the token from this service state dir")
+
+    p = sub.add_parser("submit", parents=[service], help="submit a job spec (JSON file) to the service")
+    p.add_argument("spec")
+    p.add_argument("--watch", action="store_true", help="follow the job until it finishes")
+    p.set_defaults(handler=cmd_submit)
+
+    p = sub.add_parser("jobs", parents=[service], help="list, show, watch or cancel service jobs")
+    p.add_argument("id", nargs="?")
+    p.add_argument("--status", help="only jobs in this state")
+    p.add_argument("--watch", action="store_true")
+    p.add_argument("--cancel", action="store_true")
+    p.set_defaults(handler=cmd_jobs)
+
+    p = sub.add_parser("startup", parents=[common], help="GUI import-time report and cold start benchmark")
+    p.add_argument("--budget", type=int, default=1500, metavar="MS", help="fail when the median cold start is slower")
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--imports-only", action="store_true", help="only the import-time report")
+    p.set_defaults(handler=cmd_startup)
+
+    p = sub.add_parser("detect", parents=[common], help="hardware inventory of this machine")
+    p.add_argument("--no-cache", action="store_true", help="probe again even if the hardware cache matches")
+    p.set_defaults(handler=cmd_detect)
+
+    p = sub.add_parser("pci-ids", parents=[common], help="build the PCI ID index or look up IDs in it")
+    p.add_argument("ids", nargs="*", metavar="VENDOR[:DEVICE]", help="hex IDs, e.g. 8086:3e92")
+    p.add_argument("--build", nargs="?", const="", metavar="SOURCE",
+                   help="compile pci.ids into the index (the system copy, or a download, without SOURCE)")
+    p.add_argument("--output", help="index file, default pci_ids.bin in the config folder")
+    p.set_defaults(handler=cmd_pci_ids)
+
+    p = sub.add_parser("kexts", parents=[common], help="kexts, drivers and SSDTs this machine needs")
+    p.add_argument("--no-cache", action="store_true", help="probe the hardware again")
+    p.add_argument("--bench", nargs="?", type=int, const=3000, metavar="PROFILES",
+                   help="time the rule index against a linear scan over synthetic machines")
+    p.add_argument("--seed", type=int, default=0, help="seed for the synthetic machines")
+    p.add_argument("--search", metavar="QUERY", help="search the kext catalog")
+    p.add_argument("--search-bench", nargs="?", type=int, const=1, metavar="SCALE",
+                   help="time search-as-you-type over the catalog, or over SCALE copies of it")
+    p.set_defaults(handler=cmd_kexts)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    reporter = Reporter(args.quiet)
+    try:
+        result, ok = args.handler(args, reporter)
+    except KeyboardInterrupt:
+        return 130
+    except SystemExit as e:
+        if isinstance(e.code, str):
+            print(f"error: {e.code}", file=sys.stderr)
+            return 2
+        raise
+    except Exception as e:
+        emit({"ok": False, "error": str(e), "type": e.__class__.__name__})
+        return 1
+    emit(result)
+    return 0 if ok else 1
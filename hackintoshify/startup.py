@@ -0,0 +1,114 @@
+# hackintoshify/startup.py
+
+"""
+Startup Functionality for Hackintoshify
+Author: PanCakeeYT (Abdelrahman)
+Date: October 2026
+
+Keeps an eye on how long the GUI takes to come up.
+
+import_report() runs the startup import path under `python -X importtime`
+and lists the most expensive modules. It also lists any module from
+DEFERRED_MODULES that slipped back into that path, i.e. something that is
+supposed to load lazily being imported at startup again.
+
+measure_startup() launches main.py a few times with
+HACKINTOSHIFY_STARTUP_BENCH=1. In that mode main.py prints the time to the
+first painted window and quits. The check fails when the median cold start
+(process spawn to first paint) is over the budget.
+
+    python -m hackintoshify startup [--budget MS] [--runs N]
+"""
+
+import os
+import sys
+import time
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP_BUDGET_MS = 1500
+RUNS = 5
+RUN_TIMEOUT = 60
+STARTUP_IMPORTS = "import main, GUI_Screens.MainScreen, GUI_Screens.Setup"
+READY_MARKER = "STARTUP_READY"
+
+# Must not be imported before the first window is up
+DEFERRED_MODULES = (
+    "requests",
+    "Downloader",
+    "GUI_Screens.DownloadImage",
+    "GUI_Screens.SettingsScreen",
+    "GUI_Screens.Functionality.DownloadManager",
+    "GUI_Screens.Functionality.FetchAppleImages",
+)
+
+
+def _env():
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    # Headless machines (CI) render offscreen
+    if sys.platform.startswith("linux") and not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+
+def import_report(statement=STARTUP_IMPORTS, top=15):
+    """Import times of `statement`, heaviest first, and any deferred modules it loads."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=ROOT, env=_env(),
+                            capture_output=True, text=True, timeout=RUN_TIMEOUT)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+
+    modules = []
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append({"module": name.strip(), "self_ms": int(self_us) / 1000,
+                        "cumulative_ms": int(cumulative_us) / 1000, "top_level": not name.startswith("  ")})
+
+    loaded = {item["module"] for item in modules}
+    deferred = [mod for mod in DEFERRED_MODULES
+                if any(name == mod or name.startswith(mod + ".") for name in loaded)]
+    return {
+        "total_ms": sum(item["cumulative_ms"] for item in modules if item["top_level"]),
+        "modules": sorted(modules, key=lambda item: item["self_ms"], reverse=True)[:top],
+        "deferred_loaded": deferred,
+    }
+
+
+def _run_once():
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, os.path.join(ROOT, "main.py")], cwd=ROOT, env=dict(
+        _env(), HACKINTOSHIFY_STARTUP_BENCH="1"), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        for line in process.stdout:
+            if line.startswith(READY_MARKER):
+                total = (time.perf_counter() - start) * 1000
+                return {"total_ms": total, "in_app_ms": float(line.split()[1])}
+        raise RuntimeError(f"main.py exited with {process.wait()} before painting a window")
+    finally:
+        try:
+            process.wait(timeout=RUN_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def measure_startup(runs=RUNS, budget_ms=STARTUP_BUDGET_MS, status_callback=None):
+    """Median spawn-to-first-paint time of `runs` launches against `budget_ms`."""
+    samples = []
+    for index in range(runs):
+        sample = _run_once()
+        samples.append(sample)
+        if status_callback:
+            status_callback(f"Run {index + 1}/{runs}: {sample['total_ms']:.0f} ms "
+                            f"({sample['in_app_ms']:.0f} ms after interpreter start)")
+    median = statistics.median(sample["total_ms"] for sample in samples)
+    return {
+        "ok": median <= budget_ms,
+        "median_ms": median,
+        "max_ms": max(sample["total_ms"] for sample in samples),
+        "budget_ms": budget_ms,
+        "runs": samples,
+    }
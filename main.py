@@ -1,68 +1,56 @@
+import time
+START = time.perf_counter()     # Before the Qt import, which is most of the startup
+
 from PySide6.QtWidgets import QApplication, QDialog
-from GUI_Screens.MainScreen import MainScreen
-from GUI_Screens.Setup import Setup
+from PySide6.QtCore import QObject, QEvent, QTimer
 import os
 import sys
-import json
-import configparser
 
-def get_config_paths():
-    """Returns platform-specific paths for config and setup details."""
-    if sys.platform == "win32":
-        config_dir = os.path.join(os.getenv("ProgramData"), "Hackintoshify")
-    elif sys.platform == "darwin":
-        config_dir = "/Library/Application Support/Hackintoshify"
-    else:  # Linux
-        config_dir = os.path.join(os.path.expanduser("~"), ".config", "hackintoshify")
-        
-    os.makedirs(config_dir, exist_ok=True)
-    
-    return {
-        "config": os.path.join(config_dir, "config.ini"),
-        "setup_details": os.path.join(config_dir, "setup_details.json")
-    }
+from Logic.Settings import get_settings
+
+# Set by `python -m hackintoshify startup`: report the first paint and quit
+STARTUP_BENCH = os.environ.get("HACKINTOSHIFY_STARTUP_BENCH") == "1"
 
 def initialize_files():
     """Creates config and setup files if they don't exist."""
-    paths = get_config_paths()
-    config_path = paths["config"]
-    setup_details_path = paths["setup_details"]
-
-    if not os.path.exists(config_path):
-        config = configparser.ConfigParser()
-        config['Settings'] = {'theme': 'Dark', 'verbose_logging': 'False'}
-        with open(config_path, 'w') as f:
-            config.write(f)
-
-    if not os.path.exists(setup_details_path):
-        with open(setup_details_path, 'w') as f:
-            json.dump({}, f)
+    get_settings().ensure_files()
 
 def is_first_time():
     """Checks if the setup has been completed."""
-    setup_details_path = get_config_paths()["setup_details"]
-    if not os.path.exists(setup_details_path):
-        return True
-        
-    with open(setup_details_path, 'r') as f:
-        try:
-            details = json.load(f)
-            return not details.get("setup_complete", False)
-        except (json.JSONDecodeError, AttributeError):
-            return True
+    return not get_settings().get_setup("setup_complete", False)
+
+class FirstPaint(QObject):
+    """Prints the time to the window's first paint and closes it (startup benchmark)."""
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.window.removeEventFilter(self)
+            print(f"STARTUP_READY {(time.perf_counter() - START) * 1000:.1f}", flush=True)
+            QTimer.singleShot(0, self.window.close)
+        return False
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     
     initialize_files()
 
+    # Screens are imported only when needed, the rest load in the background later
     if is_first_time():
+        from GUI_Screens.Setup import Setup
         setup_screen = Setup()
+        if STARTUP_BENCH:
+            FirstPaint(setup_screen)
         # The exec() method shows the dialog modally.
         result = setup_screen.exec()
         
         # QDialog.Accepted means the user saved the setup.
         if result == QDialog.Accepted:
+            from GUI_Screens.MainScreen import MainScreen
             main_screen = MainScreen()
             main_screen.show()
             sys.exit(app.exec())
@@ -70,6 +58,9 @@ if __name__ == "__main__":
             # If the user closes the setup dialog without saving, exit the app.
             sys.exit(0)
     else:
+        from GUI_Screens.MainScreen import MainScreen
         main_screen = MainScreen()
+        if STARTUP_BENCH:
+            FirstPaint(main_screen)
         main_screen.show()
         sys.exit(app.exec())
\ No newline at end of file